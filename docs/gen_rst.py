@@ -3,12 +3,17 @@ class_names = ["Curve",
                "DispersionCurve",
                "DispersionSet",
                "DispersionSuite",
+               "DispersionWriter",
                "GroundModel",
                "GroundModelSuite",
+               "GroundModelWriter",
+               "LazyDispersionSet",
+               "PairedSuite",
                "Parameter",
                "Parameterization",
                "Suite",
-               "Target"]
+               "Target",
+               "Writer"]
 
 for class_name in class_names:
 
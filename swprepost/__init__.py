@@ -22,13 +22,20 @@ from .curveuncertain import CurveUncertain
 from .dispersioncurve import DispersionCurve
 
 from .dispersionset import DispersionSet
+from .lazydispersionset import LazyDispersionSet
+
+from .groundmodel import GroundModel
+
+from .writer import Writer
+from .dispersionwriter import DispersionWriter
+from .groundmodelwriter import GroundModelWriter
 
 from .suite import Suite
 from .dispersionsuite import DispersionSuite
-
-from .groundmodel import GroundModel
 from .groundmodelsuite import GroundModelSuite
 
+from .pairedsuite import PairedSuite
+
 from .parameter import Parameter
 from .parameterization import Parameterization
 
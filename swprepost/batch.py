@@ -0,0 +1,162 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2021 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+"""Concurrent loading of many Geopsy-style inversion outputs."""
+
+import os
+import glob
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from swprepost import regex
+
+__all__ = ["parse_fname", "get_executor", "load_geopsy"]
+
+EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def parse_fname(fname):
+    """Parse the parameterization and trial from a file's name.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path, following
+        the convention `<...>_<LN#|LR#>_Tr#_<...>`, for example
+        `VS_Tar5_LN3_Tr0_GM.txt` or `VS_Tar5_LR15_Tr2_DC.txt`.
+
+    Returns
+    -------
+    tuple
+        Of the form `(partype, parnumber, trial)`, where `partype` is
+        "LN" or "LR", `parnumber` is the number of layers (`int`) for
+        "LN" or the layering ratio (`float`, i.e., LR15 is 1.5) for
+        "LR", and `trial` is an `int`.
+
+    Raises
+    ------
+    ValueError
+        If `fname` does not follow the convention.
+
+    """
+    match = regex.fname_tokens.search(os.path.basename(fname))
+    if match is None:
+        msg = f"Could not parse parameterization and trial from {fname}."
+        raise ValueError(msg)
+
+    partype, parnumber, trial = match.groups()
+    parnumber = int(parnumber)/10 if partype == "LR" else int(parnumber)
+    return (partype, parnumber, int(trial))
+
+
+def get_executor(name):
+    """Pool class from its name.
+
+    Parameters
+    ----------
+    name : {"process", "thread"}
+        Name of the pool, see `EXECUTORS`.
+
+    Returns
+    -------
+    type
+        `ProcessPoolExecutor` or `ThreadPoolExecutor`.
+
+    Raises
+    ------
+    ValueError
+        If `name` is not one of `EXECUTORS`.
+
+    """
+    try:
+        return EXECUTORS[name]
+    except KeyError as e:
+        msg = f"executor must be one of {list(EXECUTORS)}, not {name}."
+        raise ValueError(msg) from e
+
+
+def _load(suite, fname, kwargs):
+    """Load a single file and time it."""
+    start = time.perf_counter()
+    result = suite.from_geopsy(fname, **kwargs)
+    return (result, time.perf_counter() - start)
+
+
+def load_geopsy(pattern, suite, workers=None, executor="process", **kwargs):
+    """Load all Geopsy-style files matching a pattern concurrently.
+
+    Parameters
+    ----------
+    pattern : str
+        Glob pattern of the files to load, for example
+        `"3_text/*_GM.txt"`, see :meth: `parse_fname <parse_fname>`
+        for the naming convention of the files.
+    suite : type
+        Class used to load each file through its `from_geopsy`
+        method, for example `GroundModelSuite` or `DispersionSuite`.
+    workers : int, optional
+        Maximum number of threads or processes, default is `None`
+        so the executor's default is used.
+    executor : {"process", "thread"}, optional
+        Type of pool used to load the files, default is "process".
+        Use "thread" if `kwargs` cannot be pickled.
+    **kwargs
+        Keyword arguments passed to `suite.from_geopsy`, for example
+        `nmodels=1` or `nbest=100`.
+
+    Returns
+    -------
+    tuple
+        Of the form `(results, timings)`, where `results` is a `dict`
+        of the form `{(partype, parnumber, trial): suite, ... }` in
+        sorted order and `timings` is a `dict` of the form
+        `{fname: seconds, ... }` with the time taken to load each
+        file. Empty files are skipped with a warning.
+
+    Raises
+    ------
+    ValueError
+        If `executor` is not recognized, or if a file name does not
+        follow the naming convention or two files share the same
+        parameterization and trial.
+
+    """
+    pool = get_executor(executor)
+
+    keys = {}
+    for fname in sorted(glob.glob(pattern)):
+        key = parse_fname(fname)
+        if key in keys:
+            msg = f"{fname} and {keys[key]} share the same "
+            msg += f"parameterization and trial {key}."
+            raise ValueError(msg)
+        if os.path.getsize(fname) == 0:
+            warnings.warn(f"{fname} is empty, skipping.")
+            continue
+        keys[key] = fname
+
+    keys = dict(sorted(keys.items()))
+    n = len(keys)
+    with pool(max_workers=workers) as pool_executor:
+        loaded = list(pool_executor.map(_load, [suite]*n, keys.values(),
+                                        [kwargs]*n))
+
+    results, timings = {}, {}
+    for (key, fname), (result, elapsed) in zip(keys.items(), loaded):
+        results[key] = result
+        timings[fname] = elapsed
+    return (results, timings)
@@ -19,7 +19,7 @@
 
 import numpy as np
 
-from swprepost import Curve, regex
+from swprepost import Curve, fileio, regex
 
 __all__ = ['DispersionCurve']
 
@@ -97,21 +97,19 @@ class DispersionCurve(Curve):
         Only lines 2 and 3 will be parsed.
 
         """
-        frequency, slowness = [], []
-        for curve in regex.dc_data.finditer(dc_data):
-            f, p = curve.groups()
-            f = float(f)
-            try:
-                if f < frequency[-1]:
-                    break
-                else:
-                    frequency.append(f)
-                    slowness.append(float(p))
-            except IndexError:
-                frequency.append(f)
-                slowness.append(float(p))
-        return cls(frequency=frequency, velocity=1/np.array(slowness,
-                                                            dtype=np.double))
+        try:
+            data = np.array(dc_data.split(), dtype=np.double).reshape(-1, 2)
+        except ValueError:
+            data = regex.dc_data.findall(dc_data)
+            data = np.array(data, dtype=np.double).reshape(-1, 2)
+        frequency, slowness = data[:, 0], data[:, 1]
+
+        # Stop at the first decrease in frequency.
+        stop = np.flatnonzero(frequency[1:] < frequency[:-1])
+        if stop.size > 0:
+            frequency = frequency[:stop[0]+1]
+            slowness = slowness[:stop[0]+1]
+        return cls(frequency=frequency, velocity=1/slowness)
 
     @classmethod
     def from_geopsy(cls, fname):
@@ -128,17 +126,42 @@ class DispersionCurve(Curve):
             Instantiated `DispersionCurve` object.
 
         """
-        with open(fname, "r") as f:
+        with fileio.open_file(fname, "r") as f:
             lines = f.read()
         return cls._parse_dc(lines)
 
     @property
     def txt_repr(self):
         """Text representation following the Geopsy format."""
-        lines = ""
-        for f, p in zip(self.frequency, self.slowness):
-            lines += f"{f} {p}\n"
-        return lines
+        return self._txt_repr()
+
+    def _txt_repr(self, frequencies=None):
+        """Text representation, formatting each column in one call.
+
+        Parameters
+        ----------
+        frequencies : dict, optional
+            Cache of formatted frequencies of the form
+            `{frequency.tobytes(): [str, ... ]}` shared between curves
+            with the same frequency sampling, default is `None`
+            indicating no cache.
+
+        Returns
+        -------
+        str
+            See :meth: `txt_repr <DispersionCurve.txt_repr>`.
+
+        """
+        if frequencies is None:
+            frequency = fileio.repr_floats(self.frequency)
+        else:
+            key = self.frequency.tobytes()
+            frequency = frequencies.get(key)
+            if frequency is None:
+                frequency = fileio.repr_floats(self.frequency)
+                frequencies[key] = frequency
+        slowness = fileio.repr_floats(self.slowness)
+        return "".join(map("{} {}\n".format, frequency, slowness))
 
     def write_curve(self, fileobj):
         """Append `DispersionCurve` to open file object.
@@ -179,7 +202,7 @@ class DispersionCurve(Curve):
             Write text representation to disk.
 
         """
-        with open(fname, "w") as f:
+        with fileio.open_file(fname, "w") as f:
             f.write("# File written by swprepost\n")
             f.write(f"# Layered model {identifier}: value={misfit}\n")
             f.write(f"# 1 {wavetype.capitalize()} dispersion mode(s)\n")
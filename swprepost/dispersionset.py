@@ -19,7 +19,7 @@
 
 import numpy as np
 
-from swprepost import DispersionCurve, regex
+from swprepost import DispersionCurve, fileio, regex
 
 __all__ = ["DispersionSet"]
 
@@ -186,7 +186,7 @@ class DispersionSet():
             Instantiated `DispersionSet` object.
 
         """
-        with open(fname, "r") as f:
+        with fileio.open_file(fname, "r") as f:
             data = f.read()
         return cls._from_full_file(data, nrayleigh=nrayleigh, nlove=nlove)
 
@@ -203,35 +203,46 @@ class DispersionSet():
         None
             Writes file to disk.
 
+        """
+        fileobj.write(self._txt_repr(nrayleigh=nrayleigh, nlove=nlove))
+
+    def _txt_repr(self, nrayleigh="all", nlove="all", frequencies=None):
+        """Text written by :meth: `write_set <DispersionSet.write_set>`.
+
+        Parameters
+        ----------
+        nrayleigh, nlove : {int, 'all'}, optional
+            Number of modes to include, default is 'all'.
+        frequencies : dict, optional
+            Cache of formatted frequencies, see
+            :meth: `_txt_repr <DispersionCurve._txt_repr>`.
+
+        Returns
+        -------
+        str
+            Text representation following the Geopsy format.
+
         """
         nrayleigh = np.inf if nrayleigh == "all" else int(nrayleigh)
         nlove = np.inf if nlove == "all" else int(nlove)
 
         misfit = 0.0 if self.misfit is None else self.misfit
-        if (self.rayleigh is not None) and (nrayleigh > 0):
-            fileobj.write(
-                f"# Layered model {self.identifier}: value={misfit}\n")
-            nmodes = min(len(self.rayleigh), nrayleigh)
-            # TODO (jpv): Not true is mode is missing.
-            fileobj.write(f"# {nmodes} Rayleigh dispersion mode(s)\n")
-            fileobj.write("# CPU Time = 0 ms\n")
-            for key, value in self.rayleigh.items():
-                if key >= nrayleigh:
-                    continue
-                fileobj.write(f"# Mode {key}\n")
-                value.write_curve(fileobj)
-        if (self.love is not None) and (nlove > 0):
-            fileobj.write(
-                f"# Layered model {self.identifier}: value={misfit}\n")
-            nmodes = min(len(self.love), nlove)
+        lines = []
+        for wave, modes, nmax in [("Rayleigh", self.rayleigh, nrayleigh),
+                                  ("Love", self.love, nlove)]:
+            if (modes is None) or (nmax <= 0):
+                continue
+            nmodes = min(len(modes), nmax)
             # TODO (jpv): Not true is mode is missing.
-            fileobj.write(f"# {nmodes} Love dispersion mode(s)\n")
-            fileobj.write("# CPU Time = 0 ms\n")
-            for key, value in self.love.items():
-                if key >= nlove:
+            lines.append(f"# Layered model {self.identifier}: value={misfit}\n"
+                         f"# {nmodes} {wave} dispersion mode(s)\n"
+                         "# CPU Time = 0 ms\n")
+            for key, value in modes.items():
+                if key >= nmax:
                     continue
-                fileobj.write(f"# Mode {key}\n")
-                value.write_curve(fileobj)
+                lines.append(f"# Mode {key}\n")
+                lines.append(value._txt_repr(frequencies=frequencies))
+        return "".join(lines)
 
     def write_to_txt(self, fname):
         """Write `DispersionSet` to Geopsy formated file.
@@ -247,7 +258,7 @@ class DispersionSet():
             Writes text representation to disk.
 
         """
-        with open(fname, "w") as f:
+        with fileio.open_file(fname, "w") as f:
             f.write("# File written by swprepost\n")
             self.write_set(f)
 
@@ -18,15 +18,22 @@
 """DispersionSuite class definition."""
 
 import logging
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 
-from swprepost import DispersionSet, Suite, regex
+import numpy as np
+from scipy.io import savemat
+
+from swprepost import (DispersionSet, DispersionWriter, LazyDispersionSet,
+                       Suite, fileio, regex, scanner)
+from swprepost.suite import FollowMixin
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["DispersionSuite"]
 
 
-class DispersionSuite(Suite):
+class DispersionSuite(FollowMixin, Suite):
     """Container for instantiated `DispersionSet` objects.
 
     Attributes
@@ -94,9 +101,187 @@ class DispersionSuite(Suite):
         self.check_input(dispersionset, DispersionSet)
         super()._append(dispersionset, sort=sort)
 
+    @staticmethod
+    def _group_sets(models):
+        """Group consecutive Geopsy-style models by identifier.
+
+        Parameters
+        ----------
+        models : iterable of tuple
+            Groups of `regex.dcset` for each model block in file order,
+            of the form `(identifier, misfit, wave_type, data)`.
+
+        Yields
+        ------
+        tuple
+            Unparsed set of the form
+            `(identifier, misfit, [(wave_type, data), ... ])`.
+
+        """
+        previous_id, previous_misfit, blocks = None, None, []
+        for identifier, misfit, wave_type, data in models:
+            # Encountered new model, yield previous and reset.
+            if identifier != previous_id and blocks:
+                yield (previous_id, previous_misfit, blocks)
+                blocks = []
+            blocks.append((wave_type, data))
+            previous_id, previous_misfit = identifier, misfit
+
+        if blocks:
+            yield (previous_id, previous_misfit, blocks)
+
+    @classmethod
+    def _parse_set(cls, identifier, misfit, blocks, nrayleigh="all",
+                   nlove="all", lazy=False):
+        """Parse a `DispersionSet` from its unparsed blocks.
+
+        Parameters
+        ----------
+        identifier, misfit : str
+            Identifier and misfit of the set.
+        blocks : list of tuple
+            Of the form `[(wave_type, data), ... ]`, see
+            :meth: `_group_sets <DispersionSuite._group_sets>`.
+        nrayleigh, nlove : int, optional
+            Number of Rayleigh and Love modes respectively, default
+            is "all" so all available modes will be extracted.
+        lazy : bool, optional
+            If `True` return a `LazyDispersionSet` whose modes are
+            parsed on first access, default is `False`.
+
+        Returns
+        -------
+        DispersionSet
+            Instantiated `DispersionSet` object.
+
+        """
+        dcset = cls._lazy_dcset() if lazy else cls._dcset()
+        rayleigh, love = None, None
+        for wave_type, data in blocks:
+            if wave_type == "Rayleigh":
+                rayleigh = dcset._parse_dcs(data, nmodes=nrayleigh)
+            elif wave_type == "Love":
+                love = dcset._parse_dcs(data, nmodes=nlove)
+            else:
+                raise NotImplementedError
+        return dcset(identifier, float(misfit), rayleigh=rayleigh, love=love)
+
+    @classmethod
+    def _iter_raw(cls, fname, chunk_size=fileio.CHUNK_SIZE, identifiers=None,
+                  memory_map=False, engine="regex"):
+        """Iterate over the unparsed sets in a Geopsy-style file.
+
+        Refer to :meth: `iter_geopsy <DispersionSuite.iter_geopsy>`
+        for details on the parameters.
+
+        Yields
+        ------
+        tuple
+            Unparsed set, see
+            :meth: `_group_sets <DispersionSuite._group_sets>`.
+
+        """
+        scan, scan_bytes = scanner.select("dc", engine)
+        if identifiers is not None:
+            for block in fileio.iter_selection(fname, identifiers):
+                yield from cls._group_sets(scan(block))
+            return
+
+        if memory_map:
+            batches = fileio.iter_mmap(fname, scan_bytes)
+        else:
+            blocks = fileio.iter_blocks(fname, chunk_size=chunk_size)
+            batches = (scan(block) for block in blocks)
+        yield from cls._group_sets(model for batch in batches
+                                   for model in batch)
+
+    @classmethod
+    def iter_geopsy(cls, fname, nrayleigh="all", nlove="all",
+                    chunk_size=fileio.CHUNK_SIZE, identifiers=None,
+                    memory_map=False, max_misfit=None, where=None,
+                    lazy=False, engine="regex"):
+        """Iterate over the `DispersionSet`s in a Geopsy-style file.
+
+        The file is read in chunks of `chunk_size` characters and each
+        `DispersionSet` is yielded as soon as it is complete, such
+        that memory usage does not grow with the size of the file.
+
+        Parameters
+        ----------
+        fname : str
+            Name of file, may be a relative or full path.
+        nrayleigh, nlove : int, optional
+            Number of Rayleigh and Love modes respectively, default
+            is "all" so all available modes will be extracted.
+        chunk_size : int, optional
+            Number of characters to read from the file at a time,
+            default is 1048576.
+        identifiers : iterable of int, optional
+            Identifiers of the `DispersionSet`s to be read, default is
+            `None` so all `DispersionSet`s are read. If provided, the
+            blocks are read directly using the file's index which is
+            built on first use and stored alongside the file, see
+            :meth: `load_index <swprepost.fileio.load_index>`.
+        memory_map : bool, optional
+            If `True` the file is memory-mapped and scanned as bytes
+            so that only the numeric data of each model is decoded,
+            see :meth: `iter_mmap <swprepost.fileio.iter_mmap>`,
+            default is `False`. Ignored if `identifiers` is provided.
+        max_misfit : float, optional
+            Only read `DispersionSet`s with a misfit less than or equal
+            to `max_misfit`, default is `None` indicating no limit.
+        where : callable, optional
+            Function of the form `where(identifier, misfit)` returning
+            `True` if the `DispersionSet` is to be read, default is
+            `None` so all `DispersionSet`s are read. Rejected sets are
+            skipped based on their header without parsing their
+            modes.
+        lazy : bool, optional
+            If `True` yield `LazyDispersionSet`s whose modes are only
+            parsed when accessed, default is `False`, see
+            :meth: `LazyDispersionSet <swprepost.LazyDispersionSet>`.
+        engine : {"regex", "scanner"}, optional
+            Method used to find the models in the file, default is
+            "regex". The "scanner" runs in linear time regardless of
+            the file's contents and skips malformed lines, see
+            :meth: `scan_dc <swprepost.scanner.scan_dc>`.
+
+        Yields
+        ------
+        DispersionSet
+            Instantiated `DispersionSet` objects in file order.
+
+        Raises
+        ------
+        ValueError
+            If `memory_map=True` and the file is compressed or if
+            `engine` is not recognized.
+
+        """
+        raw_sets = cls._iter_raw(fname, chunk_size=chunk_size,
+                                 identifiers=identifiers,
+                                 memory_map=memory_map, engine=engine)
+        raw_sets = cls._filter_raw(raw_sets, max_misfit=max_misfit,
+                                   where=where)
+        for raw_set in raw_sets:
+            yield cls._parse_set(*raw_set, nrayleigh=nrayleigh, nlove=nlove,
+                                 lazy=lazy)
+
+    @classmethod
+    def _read_range(cls, fname, start, stop, nrayleigh="all", nlove="all",
+                    engine="regex"):
+        """Parse the `DispersionSet`s in a byte range of a file."""
+        scan, _ = scanner.select("dc", engine)
+        blocks = fileio.iter_ranges(fname, [(start, stop)])
+        models = (model for block in blocks for model in scan(block))
+        return [cls._parse_set(*raw_set, nrayleigh=nrayleigh, nlove=nlove)
+                for raw_set in cls._group_sets(models)]
+
     @classmethod
     def from_geopsy(cls, fname, nsets="all", nrayleigh="all", nlove="all",
-                    sort=False):
+                    sort=False, identifiers=None, workers=1,
+                    memory_map=False, nbest="all", max_misfit=None,
+                    where=None, lazy=False, engine="regex"):
         """Instantiate from a text file following the Geopsy format.
 
         Parameters
@@ -113,55 +298,144 @@ class DispersionSuite(Suite):
             Indicates whether the imported data should be sorted from
             lowest to highest misfit, default is `False` indicating no
             sorting is performed.
+        identifiers : iterable of int, optional
+            Identifiers of the `DispersionSet`s to be read, default is
+            `None` so all `DispersionSet`s are read, see
+            :meth: `iter_geopsy <DispersionSuite.iter_geopsy>`.
+        workers : int, optional
+            Number of processes used to parse the file, default is 1
+            so the file is parsed in the current process. If greater
+            than 1, the file is split at model boundaries and the
+            parts are parsed in parallel. Only used when reading all
+            sets of a file (i.e., `nsets="all"`,
+            `identifiers=None`, `nbest="all"`, `lazy=False`, and no
+            filters).
+        memory_map : bool, optional
+            Scan the memory-mapped file as bytes, default is `False`,
+            see :meth: `iter_geopsy <DispersionSuite.iter_geopsy>`.
+        nbest : {int, 'all'}, optional
+            Number of `DispersionSet`s with the lowest misfit to keep,
+            default is 'all' so all sets are kept. If an `int`, only a
+            bounded heap of `nbest` unparsed sets is kept while
+            reading, only those sets are parsed, and the result is
+            sorted from lowest to highest misfit.
+        max_misfit : float, optional
+            Only read `DispersionSet`s with a misfit less than or equal
+            to `max_misfit`, default is `None` indicating no limit.
+        where : callable, optional
+            Function of the form `where(identifier, misfit)` returning
+            `True` if the `DispersionSet` is to be read, see
+            :meth: `iter_geopsy <DispersionSuite.iter_geopsy>`.
+        lazy : bool, optional
+            If `True` the suite contains `LazyDispersionSet`s whose
+            modes are only parsed when accessed, default is `False`.
+        engine : {"regex", "scanner"}, optional
+            Method used to find the models in the file, default is
+            "regex", see
+            :meth: `iter_geopsy <DispersionSuite.iter_geopsy>`.
 
         Returns
         -------
         DispersionSuite
             Instantiated `DispersionSuite` object.
 
+        Raises
+        ------
+        ValueError
+            If no `DispersionSet`s are found in the file.
+
         """
         # TODO (jpv): Add warning if nsets < navailable.
-        with open(fname, "r") as f:
-            lines = f.read()
+        nsets = None if nsets == "all" else int(nsets)
+        filtered = max_misfit is not None or where is not None
+
+        if (workers > 1 and nsets is None and identifiers is None and
+                nbest == "all" and not lazy and not filtered):
+            ranges = fileio.split_ranges(fname, 4*workers, grouped=True)
+            if len(ranges) > 1:
+                starts, stops = zip(*ranges)
+                n = len(ranges)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(cls._read_range, [fname]*n,
+                                           starts, stops, [nrayleigh]*n,
+                                           [nlove]*n, [engine]*n)
+                    dc_sets = [dc_set for result in results
+                               for dc_set in result]
+                return cls._from_read(dc_sets, fname, sort=sort)
+
+        if nbest == "all":
+            dc_sets = cls.iter_geopsy(fname, nrayleigh=nrayleigh, nlove=nlove,
+                                      identifiers=identifiers,
+                                      memory_map=memory_map,
+                                      max_misfit=max_misfit, where=where,
+                                      lazy=lazy, engine=engine)
+            return cls._from_read(list(islice(dc_sets, nsets)), fname,
+                                  sort=sort)
+
+        raw_sets = cls._iter_raw(fname, identifiers=identifiers,
+                                 memory_map=memory_map, engine=engine)
+        raw_sets = cls._filter_raw(raw_sets, max_misfit=max_misfit,
+                                   where=where)
+        raw_sets = cls._nbest_raw(islice(raw_sets, nsets), nbest)
+        dc_sets = [cls._parse_set(*raw_set, nrayleigh=nrayleigh, nlove=nlove,
+                                  lazy=lazy)
+                   for raw_set in raw_sets]
+        return cls._from_read(dc_sets, fname, sort=False)
 
-        dc_sets = []
-        previous_id, previous_misfit = "start", "0"
-        rayleigh, love = None, None
-        model_count = 0
-        for model_info in regex.dcset.finditer(lines):
-            identifier, misfit, wave_type, data = model_info.groups()
-
-            # Encountered new model, save previous and reset.
-            if identifier != previous_id and previous_id != "start":
-                if model_count+1 == nsets:
-                    break
-
-                dc_sets.append(cls._dcset()(previous_id,
-                                            float(previous_misfit),
-                                            rayleigh=rayleigh, love=love))
-                model_count += 1
-                rayleigh, love = None, None
-
-            # Parse data.
-            if wave_type == "Rayleigh":
-                rayleigh = cls._dcset()._parse_dcs(data, nmodes=nrayleigh)
-            elif wave_type == "Love":
-                love = cls._dcset()._parse_dcs(data, nmodes=nlove)
-            else:
-                raise NotImplementedError
+    @classmethod
+    def _parse_text(cls, text, nrayleigh="all", nlove="all"):
+        """Parse the complete `DispersionSet`s in Geopsy-style text."""
+        raw_sets = cls._group_sets(regex.dcset.findall(text))
+        return [cls._parse_set(*raw_set, nrayleigh=nrayleigh, nlove=nlove)
+                for raw_set in raw_sets]
 
-            previous_id, previous_misfit = identifier, misfit
+    @classmethod
+    def follow(cls, fname, nrayleigh="all", nlove="all", sort=False):
+        """Create from a Geopsy-style file which is still being written.
 
-        dc_sets.append(cls._dcset()(previous_id,
-                                    float(previous_misfit),
-                                    rayleigh=rayleigh, love=love))
-        return cls.from_list(dc_sets, sort=sort)
+        The complete `DispersionSet`s currently in the file are read
+        and the position of the last one is remembered such that
+        :meth: `refresh <swprepost.suite.FollowMixin.refresh>` only parses the
+        `DispersionSet`s appended afterwards. A `DispersionSet` is
+        complete once the header of the next model is written, or
+        when `refresh(final=True)` is called.
+
+        Parameters
+        ----------
+        fname : str
+            Name of file, may be a relative or full path.
+        nrayleigh, nlove : int, optional
+            Number of Rayleigh and Love modes respectively, default
+            is "all" so all available modes will be extracted.
+        sort : bool, optional
+            Indicates whether the `DispersionSet`s should be kept
+            sorted from lowest to highest misfit, default is `False`.
+
+        Returns
+        -------
+        DispersionSuite
+            Instantiated `DispersionSuite` object.
+
+        Raises
+        ------
+        ValueError
+            If the file is compressed or does not yet contain a
+            complete `DispersionSet`.
+
+        """
+        return cls._from_follow(fname, grouped=True, sort=sort,
+                                nrayleigh=nrayleigh, nlove=nlove)
 
     @classmethod
     def _dcset(cls):
         """Convenient `DispersionSet` to allow subclassing."""
         return DispersionSet
 
+    @classmethod
+    def _lazy_dcset(cls):
+        """Convenient `LazyDispersionSet` to allow subclassing."""
+        return LazyDispersionSet
+
     @classmethod
     def from_list(cls, dc_sets, sort=True):
         """Instantiate from a list of `DispersionSet` objects.
@@ -184,10 +458,13 @@ class DispersionSuite(Suite):
         obj = cls(dc_sets[0])
         if len(dc_sets) > 1:
             for dc_set in dc_sets[1:]:
-                obj.append(dc_set, sort=sort)
+                obj.append(dc_set, sort=False)
+            if sort:
+                obj._sort()
         return obj
 
-    def write_to_txt(self, fname, nbest="all", nrayleigh="all", nlove="all"):
+    def write_to_txt(self, fname, nbest="all", nrayleigh="all", nlove="all",
+                     batch_size=1000):
         """Write to text file, following the Geopsy format.
 
         Parameters
@@ -200,6 +477,43 @@ class DispersionSuite(Suite):
         nrayleigh, nlove : {int, 'all'}, optional
             Number of modes to write to file, default is 'all'
             indicating all available modes will be written.
+        batch_size : int, optional
+            Number of `DispersionSet`s formatted per write, default
+            is 1000.
+
+        Returns
+        -------
+        None
+            Writes file to disk.
+
+        """
+        nbest = self._handle_nbest(nbest)
+        with DispersionWriter(fname, nrayleigh=nrayleigh, nlove=nlove,
+                              batch_size=batch_size) as writer:
+            writer.extend(self.sets[:nbest])
+
+    def write_to_mat(self, fname_prefix, nbest="all", nrayleigh="all",
+                     nlove="all"):
+        """Save all `DispersionSet`s to a single `.mat` file.
+
+        For each wave type (i.e., `rayleigh` and `love`) the keys
+        `<wave>_frequency` and `<wave>_velocity` are 3D arrays indexed
+        by set, mode number, and point, padded with `NaN`, and
+        `<wave>_npoints` is a 2D array of the number of points in each
+        mode, zero if the mode is absent. The vectors `identifier` and
+        `misfit` describe each set.
+
+        Parameters
+        ----------
+        fname_prefix : str
+            Name of file (excluding the `.mat` extension) where the file
+            should be saved, may be a relative or the full path.
+        nbest : {int, 'all'}, optional
+            Number of best sets to write to file, default is 'all'
+            indicating all sets will be written.
+        nrayleigh, nlove : {int, 'all'}, optional
+            Number of modes to write to file, default is 'all'
+            indicating all available modes will be written.
 
         Returns
         -------
@@ -208,10 +522,190 @@ class DispersionSuite(Suite):
 
         """
         nbest = self._handle_nbest(nbest)
-        with open(fname, "w") as f:
-            f.write("# File written by swprepost\n")
-            for cit in self.sets[:nbest]:
-                cit.write_set(f, nrayleigh=nrayleigh, nlove=nlove)
+        dc_sets = self.sets[:nbest]
+
+        data = {}
+        for wave, nmax in [("rayleigh", nrayleigh), ("love", nlove)]:
+            nmax = np.inf if nmax == "all" else int(nmax)
+            rows, modes, curves = [], [], []
+            for row, dc_set in enumerate(dc_sets):
+                dcs = getattr(dc_set, wave)
+                if dcs is None:
+                    continue
+                for mode, dc in dcs.items():
+                    if mode < nmax:
+                        rows.append(row)
+                        modes.append(mode)
+                        curves.append(dc)
+
+            rows = np.array(rows, dtype=int)
+            modes = np.array(modes, dtype=int)
+            npts = np.array([len(dc.frequency) for dc in curves], dtype=int)
+            nmodes = int(modes.max()) + 1 if modes.size else 0
+            maxnpts = int(npts.max()) if npts.size else 0
+
+            npoints = np.zeros((len(dc_sets), nmodes), dtype=int)
+            npoints[rows, modes] = npts
+
+            # Scatter all points at once, one entry per point.
+            pnt_rows = np.repeat(rows, npts)
+            pnt_modes = np.repeat(modes, npts)
+            pnts = np.arange(npts.sum()) - np.repeat(np.cumsum(npts) - npts,
+                                                     npts)
+            for attr in ["frequency", "velocity"]:
+                value = np.full((len(dc_sets), nmodes, maxnpts), np.nan)
+                if curves:
+                    value[pnt_rows, pnt_modes, pnts] = np.concatenate(
+                        [getattr(dc, attr) for dc in curves])
+                data[f"{wave}_{attr}"] = value
+            data[f"{wave}_npoints"] = npoints
+
+        data["identifier"] = np.array([dc_set.identifier for dc_set in dc_sets])
+        data["misfit"] = np.array([np.nan if dc_set.misfit is None else dc_set.misfit
+                                   for dc_set in dc_sets], dtype=np.double)
+        savemat(fname_prefix+".mat", data)
+
+    def write_to_npy(self, path, nbest="all"):
+        """Save to a columnar binary cache.
+
+        The points of all curves are stored as flat arrays `frequency`
+        and `velocity`, where the points of curve `j` are
+        `point_offset[j]:point_offset[j+1]` and the curves of set `i`
+        are `set_offset[i]:set_offset[i+1]`. Each curve's `wave`
+        (0 for Rayleigh, 1 for Love) and `mode` are stored alongside
+        the arrays `identifier` and `misfit` of each set. Reading the
+        cache with :meth: `from_npy <DispersionSuite.from_npy>` avoids
+        parsing text altogether.
+
+        Parameters
+        ----------
+        path : str
+            Name of directory holding one `.npy` file per array or, if
+            it ends with `.npz`, of an uncompressed archive, may be a
+            relative or the full path.
+        nbest : {int, 'all'}, optional
+            Number of best sets to write, default is 'all' indicating
+            all sets will be written.
+
+        Returns
+        -------
+        None
+            Writes arrays to disk.
+
+        """
+        nbest = self._handle_nbest(nbest)
+        dc_sets = self.sets[:nbest]
+
+        ncurves, waves, modes, curves = [], [], [], []
+        for dc_set in dc_sets:
+            ncurve = 0
+            for wave, dcs in enumerate([dc_set.rayleigh, dc_set.love]):
+                if dcs is None:
+                    continue
+                for mode, dc in dcs.items():
+                    waves.append(wave)
+                    modes.append(mode)
+                    curves.append(dc)
+                    ncurve += 1
+            ncurves.append(ncurve)
+
+        npoints = [len(dc.frequency) for dc in curves]
+        columns = {"set_offset": np.concatenate(([0], np.cumsum(ncurves, dtype=np.int64))),
+                   "point_offset": np.concatenate(([0], np.cumsum(npoints, dtype=np.int64))),
+                   "wave": np.array(waves, dtype=np.int8),
+                   "mode": np.array(modes, dtype=np.int64)}
+        for attr in ["frequency", "velocity"]:
+            values = [getattr(dc, attr) for dc in curves]
+            columns[attr] = np.concatenate(values) if values else np.empty(0)
+        columns["identifier"] = np.array([dc_set.identifier for dc_set in dc_sets],
+                                         dtype=np.int64)
+        columns["misfit"] = np.array([dc_set.misfit for dc_set in dc_sets],
+                                     dtype=np.double)
+        fileio.write_columns(path, "DispersionSuite", columns)
+
+    @classmethod
+    def from_npy(cls, path, nsets="all", nrayleigh="all", nlove="all",
+                 sort=False, nbest="all", max_misfit=None, mmap_mode="r"):
+        """Create from a columnar binary cache.
+
+        The arrays are memory-mapped, such that only the misfits and
+        the curves of the selected sets are read from disk.
+
+        Parameters
+        ----------
+        path : str
+            Name of directory or `.npz` archive written by
+            :meth: `write_to_npy <DispersionSuite.write_to_npy>`.
+        nsets : {int, 'all'}, optional
+            Number of sets to extract, default is "all".
+        nrayleigh, nlove : {int, 'all'}, optional
+            Number of Rayleigh and Love modes respectively, default
+            is "all" so all available modes will be extracted.
+        sort : bool, optional
+            Indicates whether the imported data should be sorted from
+            lowest to highest misfit, default is `False` indicating no
+            sorting is performed.
+        nbest : {int, 'all'}, optional
+            Number of sets with the lowest misfit to keep, default is
+            'all'. If provided the suite is sorted from lowest to
+            highest misfit.
+        max_misfit : float, optional
+            Only read sets with a misfit less than or equal to
+            `max_misfit`, default is `None` indicating no limit.
+        mmap_mode : {'r', 'c', None}, optional
+            Memory-map mode, default is 'r', see
+            :meth: `read_columns <swprepost.fileio.read_columns>`.
+
+        Returns
+        -------
+        DispersionSuite
+            Instantiated `DispersionSuite` object.
+
+        Raises
+        ------
+        ValueError
+            If `path` is not a `DispersionSuite` cache.
+
+        """
+        columns = fileio.read_columns(path, "DispersionSuite",
+                                      ["set_offset", "point_offset", "wave",
+                                       "mode", "frequency", "velocity",
+                                       "identifier", "misfit"],
+                                      mmap_mode=mmap_mode)
+        rows = cls._select_rows(columns["misfit"], nmodels=nsets,
+                                nbest=nbest, max_misfit=max_misfit)
+        if nbest != "all":
+            sort = False
+
+        curves, ncurves = cls._gather_ranges(columns["set_offset"], rows)
+        points, npoints = cls._gather_ranges(columns["point_offset"], curves)
+        frequency = np.asarray(columns["frequency"][points])
+        velocity = np.asarray(columns["velocity"][points])
+        waves = columns["wave"][curves].tolist()
+        modes = columns["mode"][curves].tolist()
+        ids = columns["identifier"][rows].tolist()
+        misfits = columns["misfit"][rows].tolist()
+
+        nmaxs = [np.inf if nmax == "all" else int(nmax)
+                 for nmax in (nrayleigh, nlove)]
+        dc, dcset = cls._dcset()._dc(), cls._dcset()
+        dc_sets, curve, stop = [], 0, 0
+        for identifier, misfit, ncurve in zip(ids, misfits, ncurves.tolist()):
+            dcs = [None, None]
+            for wave, mode, npts in zip(waves[curve:curve+ncurve],
+                                        modes[curve:curve+ncurve],
+                                        npoints[curve:curve+ncurve].tolist()):
+                start, stop = stop, stop + npts
+                if dcs[wave] is None:
+                    dcs[wave] = {}
+                if len(dcs[wave]) < nmaxs[wave]:
+                    dcs[wave][mode] = dc(frequency[start:stop],
+                                         velocity[start:stop])
+            curve += ncurve
+            rayleigh, love = [modes_ or None for modes_ in dcs]
+            dc_sets.append(dcset(identifier, misfit, rayleigh=rayleigh,
+                                 love=love))
+        return cls._from_read(dc_sets, path, sort=sort)
 
     def __getitem__(self, slce):
         """Define slicing behavior"""
@@ -0,0 +1,129 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2020 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+
+"""DispersionWriter class definition."""
+
+from swprepost import DispersionCurve, DispersionSet, Writer
+
+__all__ = ["DispersionWriter"]
+
+# Maximum number of formatted frequency arrays kept for reuse.
+FREQUENCY_CACHE_SIZE = 1024
+
+
+class DispersionWriter(Writer):
+    """Streaming writer for `DispersionSet`s in the Geopsy format.
+
+    The output is identical to
+    :meth: `write_to_txt <swprepost.DispersionSuite.write_to_txt>`
+    for the same `DispersionSet`s, without requiring a
+    `DispersionSuite` to be held in memory.
+
+    Attributes
+    ----------
+    nrayleigh, nlove : {int, 'all'}
+        Number of modes written for each `DispersionSet`.
+
+    Example
+    -------
+    >>> with DispersionWriter("best.txt", nrayleigh=1, nlove=0) as writer:
+    ...     writer.extend(DispersionSuite.iter_geopsy("dc.txt",
+    ...                                                max_misfit=0.5))
+
+    """
+
+    def __init__(self, fname, nrayleigh="all", nlove="all", batch_size=1000):
+        """Open a `DispersionWriter`.
+
+        Parameters
+        ----------
+        fname : str
+            Name of file, may be a relative or the full path.
+        nrayleigh, nlove : {int, 'all'}, optional
+            Number of modes to write for each `DispersionSet`, default
+            is 'all' indicating all available modes will be written.
+        batch_size : int, optional
+            Maximum number of `DispersionSet`s held before they are
+            written, default is 1000.
+
+        Returns
+        -------
+        DispersionWriter
+            Open `DispersionWriter` object.
+
+        """
+        self.nrayleigh = nrayleigh
+        self.nlove = nlove
+        self._frequencies = {}
+        super().__init__(fname, batch_size=batch_size)
+
+    @classmethod
+    def _item(cls):
+        """Convenient `DispersionSet` to allow subclassing."""
+        return DispersionSet
+
+    @classmethod
+    def _dc(cls):
+        """Convenient `DispersionCurve` to allow subclassing."""
+        return DispersionCurve
+
+    def _header(self):
+        """Text written at the start of the file."""
+        return "# File written by swprepost\n"
+
+    def _format(self, items):
+        """Text representation of a `list` of `DispersionSet`s."""
+        # Curves usually share their frequencies, format them once.
+        if len(self._frequencies) > FREQUENCY_CACHE_SIZE:
+            self._frequencies.clear()
+        return "".join([item._txt_repr(nrayleigh=self.nrayleigh,
+                                       nlove=self.nlove,
+                                       frequencies=self._frequencies)
+                        for item in items])
+
+    def write_curves(self, identifier=0, misfit=0.0, rayleigh=None,
+                     love=None):
+        """Write a dispersion set from its curves.
+
+        Parameters
+        ----------
+        identifier : int, optional
+            Model identifier, default is 0.
+        misfit : float, optional
+            Dispersion misfit, default is 0.0.
+        rayleigh, love : dict, optional
+            Curves of the form
+            `{0:(frequency0, velocity0), ... N:(frequencyN, velocityN)}`
+            where each key is the mode number, default is `None`
+            indicating no modes of that type.
+
+        Returns
+        -------
+        None
+            Dispersion set is buffered and written once the buffer is
+            full.
+
+        """
+        modes = []
+        for curves in [rayleigh, love]:
+            if curves is not None:
+                curves = {mode: self._dc()(frequency, velocity)
+                          for mode, (frequency, velocity) in curves.items()}
+            modes.append(curves)
+        self.write(self._item()(identifier=identifier, misfit=misfit,
+                                rayleigh=modes[0], love=modes[1]))
@@ -0,0 +1,845 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2021 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""File input/output utilities shared by the Geopsy readers."""
+
+import io
+import os
+import bz2
+import gzip
+import lzma
+import mmap
+import time
+import codecs
+import tarfile
+import zipfile
+import warnings
+
+import numpy as np
+
+from swprepost import regex
+
+__all__ = ["CHUNK_SIZE", "MODEL_HEADER", "INDEX_SUFFIX", "compression",
+           "open_file", "iter_blocks", "iter_mmap",
+           "build_index", "write_index", "read_index", "load_index",
+           "iter_ranges", "iter_selection", "split_ranges",
+           "complete_models", "read_appended",
+           "sniff_encoding", "iter_xml", "write_contents", "iter_contents",
+           "repr_floats", "write_columns", "read_columns"]
+
+# Default number of characters read from disk at a time.
+CHUNK_SIZE = 2**20
+
+# Literal start of every model block in a Geopsy-style text file.
+MODEL_HEADER = "# Layered model"
+
+# Extension appended to the name of a file to define its index sidecar.
+INDEX_SUFFIX = ".idx"
+
+# Name of the XML member of Dinver's .target and .param archives.
+CONTENTS = "contents.xml"
+
+# Name of the array identifying the contents of a columnar cache.
+CACHE_KIND = "kind"
+
+# Supported compression formats by extension and by magic bytes.
+EXTENSIONS = {".gz": gzip, ".bz2": bz2, ".xz": lzma, ".lzma": lzma}
+MAGIC = [(b"\x1f\x8b", gzip), (b"BZh", bz2), (b"\xfd7zXZ\x00", lzma)]
+
+
+def compression(fname, mode="r"):
+    """Determine the compression format of a file.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path.
+    mode : str, optional
+        Mode in which the file is to be opened, default is "r". The
+        format is determined from the file's extension and, when
+        reading, from the file's magic bytes.
+
+    Returns
+    -------
+    module or None
+        One of `gzip`, `bz2`, or `lzma` if the file is compressed,
+        otherwise `None`.
+
+    """
+    extension = os.path.splitext(fname)[1].lower()
+    if extension in EXTENSIONS:
+        return EXTENSIONS[extension]
+
+    if "r" in mode:
+        try:
+            with open(fname, "rb") as f:
+                magic = f.read(6)
+        except OSError:
+            return None
+        for prefix, module in MAGIC:
+            if magic.startswith(prefix):
+                return module
+    return None
+
+
+def open_file(fname, mode="r"):
+    """Open a file, transparently handling compression.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path.
+    mode : str, optional
+        Mode in which the file is to be opened, as in `open`, default
+        is "r".
+
+    Returns
+    -------
+    file
+        File object, which decompresses when reading and compresses
+        when writing if the file is `.gz`, `.bz2`, `.xz`, or `.lzma`.
+
+    """
+    module = compression(fname, mode=mode)
+    if module is None:
+        return open(fname, mode)
+    if "b" not in mode and "t" not in mode:
+        mode += "t"
+    return module.open(fname, mode)
+
+
+def iter_blocks(fname, chunk_size=CHUNK_SIZE):
+    """Read a Geopsy-style text file as a series of complete blocks.
+
+    The file is read `chunk_size` characters at a time and split
+    immediately before the last model header in the buffer, such
+    that each yielded string contains only complete model blocks and
+    the memory required is independent of the size of the file.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path.
+    chunk_size : int, optional
+        Number of characters to read from the file at a time, default
+        is `CHUNK_SIZE`.
+
+    Yields
+    ------
+    str
+        Text containing zero or more complete model blocks.
+
+    """
+    chunk_size = int(chunk_size)
+    if chunk_size < 1:
+        raise ValueError(f"`chunk_size` must be >= 1, not {chunk_size}.")
+
+    with open_file(fname, "r") as f:
+        buffer = ""
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buffer += chunk
+            split = buffer.rfind(MODEL_HEADER, 1)
+            if split > 0:
+                yield buffer[:split]
+                buffer = buffer[split:]
+        if buffer:
+            yield buffer
+
+
+def iter_mmap(fname, pattern, batch_size=4096):
+    """Scan a memory-mapped file directly as bytes.
+
+    The file is never decoded in full, only the groups of each match
+    are decoded to `str` with their line endings normalized.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path. The file
+        must not be compressed.
+    pattern : {Pattern, callable}
+        Compiled bytes regular expression, see `regex.py`, or a
+        function which yields the groups of each model in bytes-like
+        data, see `scanner.py`.
+    batch_size : int, optional
+        Number of matches to yield at a time, default is 4096.
+
+    Yields
+    ------
+    list
+        Of the form `[(group1, group2, ...), ... ]` with the decoded
+        groups of up to `batch_size` consecutive matches.
+
+    Raises
+    ------
+    ValueError
+        If the file is compressed.
+
+    """
+    if compression(fname) is not None:
+        raise ValueError(f"Compressed file {fname} cannot be memory-mapped.")
+    if os.path.getsize(fname) == 0:
+        return
+
+    with open(fname, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if callable(pattern):
+                matches = pattern(data)
+            else:
+                matches = (match.groups() for match in pattern.finditer(data))
+
+            batch = []
+            for groups in matches:
+                batch.append(tuple([group.decode().replace("\r\n", "\n")
+                                    for group in groups]))
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+
+def build_index(fname, chunk_size=CHUNK_SIZE):
+    """Index the model headers of a Geopsy-style text file.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path.
+    chunk_size : int, optional
+        Number of bytes to read from the file at a time, default is
+        `CHUNK_SIZE`.
+
+    Returns
+    -------
+    dict
+        With keys `offset`, `identifier`, and `misfit` where each
+        value is a 1D `ndarray` with one entry per model header (in
+        file order) denoting the header's position in bytes from the
+        start of the file, the model's identifier, and the model's
+        misfit, respectively. Dispersion files have one header per
+        wave type, so an identifier may appear more than once.
+
+    """
+    offsets, identifiers, misfits = [], [], []
+    with open_file(fname, "rb") as f:
+        position, buffer = 0, b""
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                end = len(buffer)
+            else:
+                buffer += chunk
+                end = buffer.rfind(b"\n") + 1
+                if end == 0:
+                    continue
+            for header in regex.model_bytes.finditer(buffer, 0, end):
+                offsets.append(position + header.start())
+                identifiers.append(header.group(1))
+                misfits.append(header.group(2))
+            position += end
+            buffer = buffer[end:]
+            if not chunk:
+                break
+
+    return {"offset": np.array(offsets, dtype=np.int64),
+            "identifier": np.array(identifiers, dtype=np.int64),
+            "misfit": np.array(misfits, dtype=np.double)}
+
+
+def _stat(fname):
+    """Size and modification time used to detect a stale index."""
+    stat = os.stat(fname)
+    return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+
+def write_index(fname, index):
+    """Write an index to the sidecar file of `fname`.
+
+    Parameters
+    ----------
+    fname : str
+        Name of the indexed file, may be a relative or the full path.
+        The index is written to `fname + INDEX_SUFFIX`.
+    index : dict
+        Index, see :meth: `build_index <swprepost.fileio.build_index>`.
+
+    Returns
+    -------
+    None
+        Writes file to disk.
+
+    """
+    with open(fname + INDEX_SUFFIX, "wb") as f:
+        np.savez(f, stat=_stat(fname), **index)
+
+
+def read_index(fname):
+    """Read the index sidecar file of `fname`.
+
+    Parameters
+    ----------
+    fname : str
+        Name of the indexed file, may be a relative or the full path.
+
+    Returns
+    -------
+    dict or None
+        Index, see :meth: `build_index <swprepost.fileio.build_index>`,
+        or `None` if the sidecar does not exist or is out of date.
+
+    """
+    try:
+        with np.load(fname + INDEX_SUFFIX) as data:
+            if not np.array_equal(data["stat"], _stat(fname)):
+                return None
+            return {key: data[key] for key in ["offset", "identifier",
+                                               "misfit"]}
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def load_index(fname, sidecar=True):
+    """Load the index of `fname` from its sidecar or build it.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path.
+    sidecar : bool, optional
+        Indicates whether an up-to-date sidecar should be read if
+        available and a new one written otherwise, default is `True`.
+
+    Returns
+    -------
+    dict
+        Index, see :meth: `build_index <swprepost.fileio.build_index>`.
+
+    """
+    index = read_index(fname) if sidecar else None
+    if index is None:
+        index = build_index(fname)
+        if sidecar:
+            try:
+                write_index(fname, index)
+            except OSError as e:
+                msg = f"Could not write index of {fname}, {e}."
+                warnings.warn(msg)
+    return index
+
+
+def iter_ranges(fname, ranges):
+    """Read byte ranges of a Geopsy-style text file.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path.
+    ranges : iterable
+        Of the form `[(start, stop), ... ]` where `start` and `stop`
+        are the first and one past the last byte to be read,
+        respectively. A `stop` of `None` reads to the end of the file.
+
+    Yields
+    ------
+    str
+        Text of each range.
+
+    """
+    with open_file(fname, "rb") as f:
+        for start, stop in ranges:
+            f.seek(start)
+            size = -1 if stop is None else stop - start
+            yield f.read(size).decode().replace("\r\n", "\n")
+
+
+def iter_selection(fname, identifiers, index=None):
+    """Read the model blocks of select identifiers.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path.
+    identifiers : iterable of int
+        Identifiers of the models to be read.
+    index : dict, optional
+        Index of `fname`, default is `None` so the index will be
+        loaded with :meth: `load_index <swprepost.fileio.load_index>`.
+
+    Yields
+    ------
+    str
+        Text of each contiguous run of selected model blocks, in file
+        order.
+
+    """
+    if index is None:
+        index = load_index(fname)
+    identifiers = np.array(list(identifiers), dtype=np.int64)
+
+    selected = np.isin(index["identifier"], identifiers)
+    missing = np.setdiff1d(identifiers, index["identifier"][selected])
+    if missing.size > 0:
+        msg = f"Identifier(s) {missing.tolist()} not found in {fname}."
+        warnings.warn(msg)
+
+    # Each block ends where the next begins, runs are merged.
+    starts = index["offset"]
+    stops = np.append(starts[1:], -1)
+    ranges = []
+    for start, stop in zip(starts[selected].tolist(), stops[selected].tolist()):
+        stop = None if stop == -1 else stop
+        if len(ranges) > 0 and ranges[-1][1] == start:
+            ranges[-1][1] = stop
+        else:
+            ranges.append([start, stop])
+    yield from iter_ranges(fname, ranges)
+
+
+def _next_boundary(fileobj, position, grouped=False, window=2**16):
+    """Find the first model boundary at or after `position`.
+
+    Parameters
+    ----------
+    fileobj : file
+        File object open in binary mode.
+    position : int
+        Position in bytes from which to start searching.
+    grouped : bool, optional
+        Indicates whether consecutive headers sharing an identifier
+        belong to the same model (as in dispersion files), such that
+        the boundary is placed at the first header whose identifier
+        differs from that of the header before it, default is `False`.
+    window : int, optional
+        Number of bytes read at a time, default is 65536.
+
+    Returns
+    -------
+    int or None
+        Position of the boundary in bytes or `None` if there is no
+        boundary after `position`.
+
+    """
+    fileobj.seek(position)
+    buffer, searched, previous_id = b"", 0, None
+    while True:
+        chunk = fileobj.read(window)
+        if not chunk:
+            return None
+        buffer += chunk
+        for header in regex.model_bytes.finditer(buffer, searched):
+            identifier = header.group(1)
+            if (not grouped) or (previous_id not in (None, identifier)):
+                return position + header.start()
+            previous_id = identifier
+            searched = header.end()
+
+
+def split_ranges(fname, nranges, grouped=False):
+    """Split a Geopsy-style text file into byte ranges of whole models.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path.
+    nranges : int
+        Desired number of ranges, fewer may be returned if the file
+        contains too few models.
+    grouped : bool, optional
+        Indicates whether consecutive headers sharing an identifier
+        belong to the same model (as in dispersion files), default is
+        `False`.
+
+    Returns
+    -------
+    list
+        Of the form `[(start, stop), ... ]` in file order where
+        `start` and `stop` are the first and one past the last byte of
+        each range, respectively. Compressed files cannot be split
+        and are returned as a single range.
+
+    """
+    if compression(fname) is not None:
+        return [(0, None)]
+
+    size = os.path.getsize(fname)
+    bounds = [0]
+    with open(fname, "rb") as f:
+        for part in range(1, int(nranges)):
+            position = max(part*size//nranges, bounds[-1]+1)
+            bound = _next_boundary(f, position, grouped=grouped)
+            if bound is None:
+                break
+            bounds.append(bound)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def complete_models(data, grouped=False):
+    """Find the end of the complete models in Geopsy-style text.
+
+    Parameters
+    ----------
+    data : bytes
+        Text which may end part way through a model, as when the file
+        is still being written.
+    grouped : bool, optional
+        Indicates whether consecutive headers sharing an identifier
+        belong to the same model (as in dispersion files), default is
+        `False`. If `True` the last model is never considered
+        complete as further blocks of it may follow, otherwise the
+        last model is complete once all of its layers are present.
+
+    Returns
+    -------
+    int
+        Position in bytes one past the end of the last complete
+        model, zero if there are none.
+
+    """
+    headers = list(regex.model_bytes.finditer(data))
+    if not headers:
+        return 0
+
+    if grouped:
+        last_id = headers[-1].group(1)
+        for header in reversed(headers):
+            if header.group(1) != last_id:
+                break
+            stop = header.start()
+        return stop
+
+    # Last model is complete once its layer count and layers are present.
+    start = headers[-1].start()
+    lines = data[start:].split(b"\n")
+    if len(lines) > 2:
+        try:
+            nlines = 2 + int(lines[1])
+        except ValueError:
+            nlines = None
+        if nlines is not None and len(lines) > nlines:
+            return start + sum(len(line) + 1 for line in lines[:nlines])
+    return start
+
+
+def read_appended(fname, start, grouped=False, final=False):
+    """Read the complete models appended to a file after `start`.
+
+    Parameters
+    ----------
+    fname : str
+        Name of file, may be a relative or the full path. The file
+        must not be compressed.
+    start : int
+        Position in bytes from which to read, typically the `stop`
+        returned by the previous call.
+    grouped : bool, optional
+        Refer to
+        :meth: `complete_models <swprepost.fileio.complete_models>`.
+    final : bool, optional
+        Indicates the file is no longer being written so all
+        remaining text is read, default is `False` so only complete
+        models are read.
+
+    Returns
+    -------
+    tuple
+        Of the form `(text, stop)` where `text` is the text of the
+        complete models and `stop` is the position in bytes one past
+        the end of `text`.
+
+    Raises
+    ------
+    ValueError
+        If the file is compressed or smaller than `start`.
+
+    """
+    if compression(fname) is not None:
+        raise ValueError(f"Compressed file {fname} cannot be followed.")
+
+    with open(fname, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() < start:
+            raise ValueError(f"{fname} was truncated to before byte {start}.")
+        f.seek(start)
+        data = f.read()
+
+    stop = len(data) if final else complete_models(data, grouped=grouped)
+    return (data[:stop].decode().replace("\r\n", "\n"), start + stop)
+
+
+def sniff_encoding(head):
+    """Determine the encoding of Dinver XML from its first bytes.
+
+    Parameters
+    ----------
+    head : bytes
+        First bytes of the XML.
+
+    Returns
+    -------
+    str
+        Name of codec, from the byte order mark if present otherwise
+        from the layout of the leading '<'.
+
+    """
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf_8_sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf_16"
+    if head.startswith(b"<\x00"):
+        return "utf_16_le"
+    if head.startswith(b"\x00<"):
+        return "utf_16_be"
+    return "utf_8"
+
+
+def iter_xml(fileobj, chunk_size=2**16):
+    """Decode a binary stream of Dinver XML as a series of chunks.
+
+    The encoding is determined once from the first bytes, see
+    :meth: `sniff_encoding <swprepost.fileio.sniff_encoding>`.
+
+    Parameters
+    ----------
+    fileobj : file-like
+        Binary stream of the XML, for example `contents.xml`.
+    chunk_size : int, optional
+        Number of bytes to read at a time, default is 64 KiB.
+
+    Yields
+    ------
+    str
+        Decoded text, chunks may end part way through an element.
+
+    Raises
+    ------
+    ValueError
+        If the encoding is not recognized.
+
+    """
+    chunk = fileobj.read(max(chunk_size, 64))
+    decoder = codecs.getincrementaldecoder(sniff_encoding(chunk))()
+    try:
+        text = decoder.decode(chunk)
+        if "<Dinver>" not in text[:10]:
+            raise ValueError("File encoding not recognized.")
+        while text:
+            yield text
+            chunk = fileobj.read(chunk_size)
+            text = decoder.decode(chunk, final=not chunk)
+    except UnicodeDecodeError as e:
+        raise ValueError("File encoding not recognized.") from e
+
+
+def write_contents(fname, contents):
+    """Write a Dinver archive (e.g., `.target`, `.param`) in memory.
+
+    The XML is encoded and added to the archive directly, such that
+    nothing is written to the current working directory.
+
+    Parameters
+    ----------
+    fname : str
+        Name of archive, may be a relative or the full path.
+    contents : iterable of str
+        Rows of XML, each is terminated with a newline.
+
+    Returns
+    -------
+    None
+        Writes archive to disk.
+
+    """
+    data = "".join(row+"\n" for row in contents).encode("utf-8")
+    info = tarfile.TarInfo(CONTENTS)
+    info.size, info.mtime, info.mode = len(data), time.time(), 0o644
+    with tarfile.open(fname, "w:gz") as f:
+        f.addfile(info, io.BytesIO(data))
+
+
+def iter_contents(fname, chunk_size=2**16):
+    """Read the XML of a Dinver archive as a series of chunks.
+
+    The `contents.xml` member is streamed from the archive, such that
+    nothing is written to the current working directory, see
+    :meth: `iter_xml <swprepost.fileio.iter_xml>`.
+
+    Parameters
+    ----------
+    fname : str
+        Name of archive, may be a relative or the full path.
+    chunk_size : int, optional
+        Number of bytes to read at a time, default is 64 KiB.
+
+    Yields
+    ------
+    str
+        Decoded text.
+
+    """
+    with tarfile.open(fname, "r:gz") as f:
+        yield from iter_xml(f.extractfile(CONTENTS), chunk_size=chunk_size)
+
+
+def repr_floats(values):
+    """Text representation of many floats, identical to `repr`.
+
+    Consecutive equal values (e.g., the velocity of sub-layers or a
+    constant density) are formatted once, such that the cost is
+    dominated by the number of changes in value rather than the
+    number of values.
+
+    Parameters
+    ----------
+    values : ndarray
+        1D array of `float`.
+
+    Returns
+    -------
+    list
+        Of `str`, where each entry is `repr(float(value))`.
+
+    """
+    values = np.asarray(values, dtype=np.double)
+    if values.size == 0:
+        return []
+
+    # Start of each run of equal values, -0.0 and 0.0 are not equal.
+    starts = np.empty(values.size, dtype=bool)
+    starts[0] = True
+    np.not_equal(values[1:], values[:-1], out=starts[1:])
+    starts[1:] |= np.signbit(values[1:]) != np.signbit(values[:-1])
+
+    reprs = np.array(list(map(repr, values[starts].tolist())), dtype=object)
+    return reprs[np.cumsum(starts) - 1].tolist()
+
+
+def write_columns(path, kind, columns):
+    """Save named arrays as a columnar cache.
+
+    If `path` ends with `.npz` the arrays are stored in a single
+    uncompressed archive, otherwise `path` is a directory holding one
+    `.npy` file per array.
+
+    Parameters
+    ----------
+    path : str
+        Name of the directory or `.npz` archive, may be a relative or
+        the full path.
+    kind : str
+        Name of the object stored, checked by
+        :meth: `read_columns <read_columns>`.
+    columns : dict
+        Of the form `{name: ndarray}`.
+
+    Returns
+    -------
+    None
+        Writes arrays to disk.
+
+    """
+    arrays = dict(columns)
+    arrays[CACHE_KIND] = np.array(kind)
+    if str(path).endswith(".npz"):
+        np.savez(path, **arrays)
+    else:
+        os.makedirs(path, exist_ok=True)
+        for name, value in arrays.items():
+            np.save(os.path.join(path, f"{name}.npy"), value)
+
+
+def _memmap_member(fname, archive, name, mmap_mode="r"):
+    """Memory-map a `.npy` member stored uncompressed in a `.npz`."""
+    info = archive.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED or mmap_mode is None:
+        return np.load(io.BytesIO(archive.read(info)))
+
+    with open(fname, "rb") as f:
+        # Data follows the member's local header and its variable fields.
+        f.seek(info.header_offset)
+        header = f.read(30)
+        f.seek(info.header_offset + 30 + int.from_bytes(header[26:28], "little")
+               + int.from_bytes(header[28:30], "little"))
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        else:
+            return np.load(io.BytesIO(archive.read(info)))
+        offset = f.tell()
+
+    if dtype.hasobject or 0 in shape or shape == ():
+        return np.load(io.BytesIO(archive.read(info)))
+    return np.memmap(fname, dtype=dtype, mode=mmap_mode, offset=offset,
+                     shape=shape, order="F" if fortran else "C")
+
+
+def read_columns(path, kind, names, mmap_mode="r"):
+    """Load named arrays from a columnar cache.
+
+    Arrays are memory-mapped, such that opening a large cache is
+    nearly instant and only the values which are accessed are read
+    from disk. This applies to a directory of `.npy` files and to an
+    uncompressed `.npz` archive, see
+    :meth: `write_columns <write_columns>`.
+
+    Parameters
+    ----------
+    path : str
+        Name of the directory or `.npz` archive, may be a relative or
+        the full path.
+    kind : str
+        Name of the object expected to be stored.
+    names : iterable of str
+        Names of the arrays to load.
+    mmap_mode : {'r', 'r+', 'c', None}, optional
+        Memory-map mode, see `numpy.load`, default is 'r'. If `None`
+        the arrays are read into memory.
+
+    Returns
+    -------
+    dict
+        Of the form `{name: ndarray}`.
+
+    Raises
+    ------
+    ValueError
+        If `path` is not a cache of `kind`.
+
+    """
+    if str(path).endswith(".npz"):
+        with zipfile.ZipFile(path) as archive:
+            _check_kind(path, kind, _memmap_member(path, archive, CACHE_KIND))
+            return {name: _memmap_member(path, archive, name, mmap_mode)
+                    for name in names}
+
+    _check_kind(path, kind, np.load(os.path.join(path, f"{CACHE_KIND}.npy")))
+    return {name: np.load(os.path.join(path, f"{name}.npy"),
+                          mmap_mode=mmap_mode)
+            for name in names}
+
+
+def _check_kind(path, kind, stored):
+    """Raise `ValueError` if a columnar cache does not store `kind`."""
+    if str(stored) != kind:
+        msg = f"{path} is not a {kind} cache, it stores {stored}."
+        raise ValueError(msg)
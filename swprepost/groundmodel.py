@@ -18,11 +18,12 @@
 """GroundModel class definition."""
 
 import logging
+from itertools import chain
 
 from scipy.io import savemat
 import numpy as np
 
-from swprepost import regex
+from swprepost import fileio, regex
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +67,10 @@ class GroundModel():
         for key, value in kwargs.items():
             if key in ["thickness", "vp", "vs", "density"]:
                 try:
-                    kwargs[key] = [float(val) for val in value]
+                    if isinstance(value, np.ndarray) and value.ndim == 1:
+                        kwargs[key] = value.astype(np.double).tolist()
+                    else:
+                        kwargs[key] = list(map(float, value))
                 except ValueError as e:
                     raise TypeError(f"{key} must be castable to float.", e)
             elif key in ["identifier"]:
@@ -570,10 +574,9 @@ class GroundModel():
     @property
     def txt_repr(self):
         """Text representation of the current `GroundModel`."""
-        lines = f"{self.nlay}\n"
-        for tk, vp, vs, rh in zip(self.tk, self.vp, self.vs, self.rh):
-            lines += f"{tk} {vp} {vs} {rh}\n"
-        return lines
+        layers = map("{} {} {} {}\n".format, self.tk, self.vp, self.vs,
+                     self.rh)
+        return f"{self.nlay}\n" + "".join(layers)
 
     def write_model(self, fileobj):
         """Write model to open file object following `Geopsy` format.
@@ -606,10 +609,61 @@ class GroundModel():
             Writes file to disk.
 
         """
-        with open(fname, "w") as f:
-            f.write(f"# Layered model {self.identifier}: value={self.misfit}\n")
-            for line in self.txt_repr:
-                f.write(line)
+        with fileio.open_file(fname, "w") as f:
+            self.write_model(f)
+
+    @classmethod
+    def _write_models(cls, fileobj, gms, batch_size=10000):
+        """Write many `GroundModel`s to an open file object.
+
+        The layers of each batch of models are gathered into arrays
+        and formatted column-by-column, the output is identical to
+        calling :meth: `write_model <GroundModel.write_model>` for
+        each `GroundModel` but written `batch_size` models at a time.
+        This method should not be accessed directly. Use
+        `GroundModelSuite.write_to_txt` instead.
+
+        Parameters
+        ----------
+        fileobj : _io.TextIOWrapper
+            Open file object.
+        gms : list
+            Of `GroundModel` objects.
+        batch_size : int, optional
+            Number of models formatted per write, default is 10000.
+
+        Returns
+        -------
+        None
+            Writes to `fileobj`.
+
+        """
+        for start in range(0, len(gms), batch_size):
+            batch = gms[start:start+batch_size]
+            nlays = [len(gm.thickness) for gm in batch]
+            nrows = sum(nlays)
+
+            columns = []
+            for attr in ["thickness", "vp", "vs", "density"]:
+                values = chain.from_iterable(getattr(gm, attr) for gm in batch)
+                values = np.fromiter(values, dtype=np.double, count=nrows)
+                columns.append(fileio.repr_floats(values))
+
+            rows = list(map(" ".join, zip(*columns)))
+
+            # Prefix the header to the first layer of each model.
+            row, empty = 0, []
+            for gm, nlay in zip(batch, nlays):
+                header = f"# Layered model {gm.identifier}: value={gm.misfit}\n{nlay}"
+                if nlay:
+                    rows[row] = f"{header}\n{rows[row]}"
+                else:
+                    empty.append((row, header))
+                row += nlay
+            for row, header in reversed(empty):
+                rows.insert(row, header)
+
+            fileobj.write("\n".join(rows) + "\n")
 
     @classmethod
     def _gm(cls):
@@ -640,19 +694,69 @@ class GroundModel():
             Instantiated `GroundModel` object.
 
         """
-        tks, vps, vss, rhs = [], [], [], []
-        for gm in regex.gm_data.finditer(gm_data):
-            tk, vp, vs, rh = gm.groups()
+        try:
+            data = np.array(gm_data.split(), dtype=np.double).reshape(-1, 4)
+        except ValueError:
+            data = regex.gm_data.findall(gm_data)
+            data = np.array(data, dtype=np.double).reshape(-1, 4)
+
+        # Stop at the half-space.
+        stop = np.flatnonzero(data[:, 0] == 0)
+        if stop.size > 0:
+            data = data[:stop[0]+1]
+
+        tks, vps, vss, rhs = data.T.tolist()
+        return cls._gm()(tks, vps, vss, rhs, identifier=identifier, misfit=misfit)
 
-            tks.append(tk)
-            vps.append(vp)
-            vss.append(vs)
-            rhs.append(rh)
+    @classmethod
+    def _parse_gms(cls, models):
+        """Instantiate many `GroundModel`s from lines of ground model text.
 
-            if tk == "0":
-                break
+        The layers of all models are converted to a single
+        `(nlay, 4)` array at once, such that the cost of parsing is
+        dominated by the number of layers rather than the number of
+        models. This method should not be accessed directly. Use
+        `GroundModelSuite.from_geopsy` instead.
 
-        return cls._gm()(tks, vps, vss, rhs, identifier=identifier, misfit=misfit)
+        Paramters
+        ---------
+        models : list
+            Of the form `[(identifier, misfit, gm_data), ... ]`
+            where each entry is as described in
+            :meth: `_parse_gm <GroundModel._parse_gm>`.
+
+        Returns
+        -------
+        list
+            Of instantiated `GroundModel` objects.
+
+        """
+        if len(models) == 0:
+            return []
+
+        nlines = [gm_data.count("\n") for _, _, gm_data in models]
+        try:
+            gm_data = "".join([gm_data for _, _, gm_data in models])
+            data = np.array(gm_data.split(), dtype=np.double)
+            data = data.reshape(sum(nlines), 4)
+        except ValueError:
+            return [cls._parse_gm(gm_data, identifier, misfit)
+                    for identifier, misfit, gm_data in models]
+
+        # Stop each model at its half-space.
+        stops = np.cumsum(nlines)
+        starts = stops - nlines
+        halfspaces = np.append(np.flatnonzero(data[:, 0] == 0), stops[-1])
+        stops = np.minimum(halfspaces[np.searchsorted(halfspaces, starts)]+1,
+                           stops)
+
+        rows = data.tolist()
+        gms = []
+        for (identifier, misfit, _), start, stop in zip(models, starts, stops):
+            tks, vps, vss, rhs = zip(*rows[start:stop])
+            gms.append(cls._gm()(tks, vps, vss, rhs,
+                                 identifier=identifier, misfit=misfit))
+        return gms
 
     @classmethod
     def from_geopsy(cls, fname):
@@ -674,7 +778,7 @@ class GroundModel():
             If file does not follow the `Geopsy` format.
 
         """
-        with open(fname, "r") as f:
+        with fileio.open_file(fname, "r") as f:
             lines = f.read()
 
         for model_info in regex.gm.finditer(lines):
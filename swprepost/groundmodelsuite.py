@@ -17,12 +17,18 @@
 
 """GroundModelSuite class definition."""
 
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+from scipy.io import savemat
 
-from swprepost import GroundModel, Suite, regex
+from swprepost import (GroundModel, GroundModelWriter, Suite, fileio, regex,
+                       scanner)
+from swprepost.suite import FollowMixin
 
 
-class GroundModelSuite(Suite):
+class GroundModelSuite(FollowMixin, Suite):
     """Class for manipulating suites of `GroundModel` objects.
 
     Attributes
@@ -215,9 +221,175 @@ class GroundModelSuite(Suite):
 
         """
         nbest = self._handle_nbest(nbest)
-        with open(fname, "w") as f:
-            for cgm in self.gms[:nbest]:
-                cgm.write_model(f)
+        with GroundModelWriter(fname) as writer:
+            writer.extend(self.gms[:nbest])
+
+    def write_to_mat(self, fname_prefix, nbest="all"):
+        """Save all `GroundModel`s to a single `.mat` file.
+
+        Each parameter is stored as a 2D array with one row per
+        model, padded with `NaN` to the largest number of layers (or
+        stair-step points), using the keys of
+        :meth: `write_to_mat <GroundModel.write_to_mat>`. The vectors
+        `nlay`, `identifier`, and `misfit` describe each row.
+
+        Parameters
+        ----------
+        fname_prefix : str
+            Name of file (excluding the `.mat` extension) where the file
+            should be saved, may be a relative or the full path.
+        nbest : {int, 'all'}, optional
+            Number of best models to write to file, default is 'all'
+            indicating all models will be written.
+
+        Returns
+        -------
+        None
+            Writes file to disk.
+
+        """
+        nbest = self._handle_nbest(nbest)
+        gms = self.gms[:nbest]
+
+        nlays = np.fromiter((len(gm.tk) for gm in gms), dtype=int,
+                            count=len(gms))
+        maxnlay = int(nlays.max())
+        rows = np.repeat(np.arange(len(gms)), nlays)
+        cols = np.arange(nlays.sum()) - np.repeat(np.cumsum(nlays) - nlays,
+                                                  nlays)
+
+        data = {}
+        for key, attr in [("thickness", "tk"), ("vp1", "vp"),
+                          ("vs1", "vs"), ("rho1", "rh")]:
+            values = chain.from_iterable(getattr(gm, attr) for gm in gms)
+            values = np.fromiter(values, dtype=np.double, count=rows.size)
+            data[key] = np.full((len(gms), maxnlay), np.nan)
+            data[key][rows, cols] = values
+
+        # Stair-step profiles, each layer contributes a top and bottom.
+        tks = np.nan_to_num(data["thickness"])
+        bottoms = np.cumsum(tks, axis=1)
+        bottoms[np.arange(len(gms)), nlays-1] = 9999.0
+        tops = np.zeros_like(bottoms)
+        tops[:, 1:] = bottoms[:, :-1]
+        for key, value in [("depth", np.stack((tops, bottoms), axis=2)),
+                           ("vp2", np.repeat(data["vp1"][:, :, None], 2, axis=2)),
+                           ("vs2", np.repeat(data["vs1"][:, :, None], 2, axis=2)),
+                           ("rho2", np.repeat(data["rho1"][:, :, None], 2, axis=2))]:
+            value = value.reshape(len(gms), 2*maxnlay)
+            value[np.arange(2*maxnlay) >= 2*nlays[:, None]] = np.nan
+            data[key] = value
+
+        data["nlay"] = nlays
+        data["identifier"] = np.array([gm.identifier for gm in gms])
+        data["misfit"] = np.array([gm.misfit for gm in gms], dtype=np.double)
+        savemat(fname_prefix+".mat", data)
+
+    def write_to_npy(self, path, nbest="all"):
+        """Save to a columnar binary cache.
+
+        The layers of all models are stored as flat arrays `thickness`,
+        `vp`, `vs`, and `density`, where the layers of model `i` are
+        `offset[i]:offset[i+1]`, alongside the arrays `identifier` and
+        `misfit`. Reading the cache with
+        :meth: `from_npy <GroundModelSuite.from_npy>` avoids parsing
+        text altogether.
+
+        Parameters
+        ----------
+        path : str
+            Name of directory holding one `.npy` file per array or, if
+            it ends with `.npz`, of an uncompressed archive, may be a
+            relative or the full path.
+        nbest : {int, 'all'}, optional
+            Number of best models to write, default is 'all'
+            indicating all models will be written.
+
+        Returns
+        -------
+        None
+            Writes arrays to disk.
+
+        """
+        nbest = self._handle_nbest(nbest)
+        gms = self.gms[:nbest]
+
+        nlays = np.fromiter((len(gm.tk) for gm in gms), dtype=np.int64,
+                            count=len(gms))
+        columns = {"offset": np.concatenate(([0], np.cumsum(nlays)))}
+        for attr in ["thickness", "vp", "vs", "density"]:
+            values = chain.from_iterable(getattr(gm, attr) for gm in gms)
+            columns[attr] = np.fromiter(values, dtype=np.double,
+                                        count=columns["offset"][-1])
+        columns["identifier"] = np.array([gm.identifier for gm in gms],
+                                         dtype=np.int64)
+        columns["misfit"] = np.array([gm.misfit for gm in gms],
+                                     dtype=np.double)
+        fileio.write_columns(path, "GroundModelSuite", columns)
+
+    @classmethod
+    def from_npy(cls, path, nmodels="all", sort=False, nbest="all",
+                 max_misfit=None, mmap_mode="r"):
+        """Create from a columnar binary cache.
+
+        The arrays are memory-mapped, such that only the misfits and
+        the layers of the selected models are read from disk.
+
+        Parameters
+        ----------
+        path : str
+            Name of directory or `.npz` archive written by
+            :meth: `write_to_npy <GroundModelSuite.write_to_npy>`.
+        nmodels : {int, 'all'}, optional
+            Number of `GroundModels` to extract, default is `all`.
+        sort : bool, optional
+            Indicates whether the imported data should be sorted from
+            lowest to highest misfit, default is `False` indicating no
+            sorting is performed.
+        nbest : {int, 'all'}, optional
+            Number of `GroundModel`s with the lowest misfit to keep,
+            default is 'all'. If provided the suite is sorted
+            from lowest to highest misfit.
+        max_misfit : float, optional
+            Only read `GroundModel`s with a misfit less than or equal
+            to `max_misfit`, default is `None` indicating no limit.
+        mmap_mode : {'r', 'c', None}, optional
+            Memory-map mode, default is 'r', see
+            :meth: `read_columns <swprepost.fileio.read_columns>`.
+
+        Returns
+        -------
+        GroundModelSuite
+            Instantiated `GroundModelSuite` object.
+
+        Raises
+        ------
+        ValueError
+            If `path` is not a `GroundModelSuite` cache.
+
+        """
+        columns = fileio.read_columns(path, "GroundModelSuite",
+                                      ["offset", "thickness", "vp", "vs",
+                                       "density", "identifier", "misfit"],
+                                      mmap_mode=mmap_mode)
+        rows = cls._select_rows(columns["misfit"], nmodels=nmodels,
+                                nbest=nbest, max_misfit=max_misfit)
+        if nbest != "all":
+            sort = False
+
+        layers, nlays = cls._gather_ranges(columns["offset"], rows)
+        tks, vps, vss, rhs = [columns[attr][layers].tolist()
+                              for attr in ["thickness", "vp", "vs", "density"]]
+        ids = columns["identifier"][rows].tolist()
+        misfits = columns["misfit"][rows].tolist()
+
+        gms, stop = [], 0
+        for identifier, misfit, nlay in zip(ids, misfits, nlays.tolist()):
+            start, stop = stop, stop + nlay
+            gms.append(cls._gm()(tks[start:stop], vps[start:stop],
+                                 vss[start:stop], rhs[start:stop],
+                                 identifier=identifier, misfit=misfit))
+        return cls._from_read(gms, path, sort=sort)
 
     def sigma_ln(self, dmax=50, dy=0.5, nbest='all', parameter='vs'):
         """Lognormal standard deviation of a parameter.
@@ -263,7 +435,9 @@ class GroundModelSuite(Suite):
         obj = cls._gm_suite()(groundmodels[0])
         if len(groundmodels) > 1:
             for cgm in groundmodels[1:]:
-                obj.append(cgm, sort=sort)
+                obj.append(cgm, sort=False)
+            if sort:
+                obj._sort()
         return obj
 
     @classmethod
@@ -313,7 +487,108 @@ class GroundModelSuite(Suite):
         return suite
 
     @classmethod
-    def from_geopsy(cls, fname, nmodels="all", sort=False):
+    def _iter_raw(cls, fname, chunk_size=fileio.CHUNK_SIZE, identifiers=None,
+                  memory_map=False, engine="regex"):
+        """Iterate over batches of unparsed models in a Geopsy-style file.
+
+        Refer to :meth: `iter_geopsy <GroundModelSuite.iter_geopsy>`
+        for details on the parameters.
+
+        Yields
+        ------
+        list of tuple
+            Groups of `regex.gm` of the form
+            `[(identifier, misfit, gm_data), ... ]`.
+
+        """
+        scan, scan_bytes = scanner.select("gm", engine)
+        if identifiers is not None:
+            blocks = fileio.iter_selection(fname, identifiers)
+        elif memory_map:
+            yield from fileio.iter_mmap(fname, scan_bytes)
+            return
+        else:
+            blocks = fileio.iter_blocks(fname, chunk_size=chunk_size)
+
+        for block in blocks:
+            yield list(scan(block))
+
+    @classmethod
+    def iter_geopsy(cls, fname, chunk_size=fileio.CHUNK_SIZE,
+                    identifiers=None, memory_map=False, max_misfit=None,
+                    where=None, engine="regex"):
+        """Iterate over the `GroundModel`s in a Geopsy-style file.
+
+        The file is read in chunks of `chunk_size` characters and each
+        `GroundModel` is yielded as soon as it is complete, such that
+        memory usage does not grow with the size of the file.
+
+        Parameters
+        ----------
+        fname : str
+            Name of file, may contain a relative or the full path.
+        chunk_size : int, optional
+            Number of characters to read from the file at a time,
+            default is 1048576.
+        identifiers : iterable of int, optional
+            Identifiers of the `GroundModel`s to be read, default is
+            `None` so all `GroundModel`s are read. If provided, the
+            blocks are read directly using the file's index which is
+            built on first use and stored alongside the file, see
+            :meth: `load_index <swprepost.fileio.load_index>`.
+        memory_map : bool, optional
+            If `True` the file is memory-mapped and scanned as bytes
+            so that only the numeric data of each model is decoded,
+            see :meth: `iter_mmap <swprepost.fileio.iter_mmap>`,
+            default is `False`. Ignored if `identifiers` is provided.
+        max_misfit : float, optional
+            Only read `GroundModel`s with a misfit less than or equal
+            to `max_misfit`, default is `None` indicating no limit.
+        where : callable, optional
+            Function of the form `where(identifier, misfit)` returning
+            `True` if the `GroundModel` is to be read, default is
+            `None` so all `GroundModel`s are read. Rejected models are
+            skipped based on their header without parsing their
+            layers.
+        engine : {"regex", "scanner"}, optional
+            Method used to find the models in the file, default is
+            "regex". The "scanner" runs in linear time regardless of
+            the file's contents and skips malformed lines, see
+            :meth: `scan_gm <swprepost.scanner.scan_gm>`.
+
+        Yields
+        ------
+        GroundModel
+            Initialized `GroundModel` objects in file order.
+
+        Raises
+        ------
+        ValueError
+            If `memory_map=True` and the file is compressed or if
+            `engine` is not recognized.
+
+        """
+        batches = cls._iter_raw(fname, chunk_size=chunk_size,
+                                identifiers=identifiers,
+                                memory_map=memory_map, engine=engine)
+        for batch in batches:
+            batch = list(cls._filter_raw(batch, max_misfit=max_misfit,
+                                         where=where))
+            yield from cls._gm()._parse_gms(batch)
+
+    @classmethod
+    def _read_range(cls, fname, start, stop, engine="regex"):
+        """Parse the `GroundModel`s in a byte range of a file."""
+        scan, _ = scanner.select("gm", engine)
+        gms = []
+        for block in fileio.iter_ranges(fname, [(start, stop)]):
+            gms += cls._gm()._parse_gms(list(scan(block)))
+        return gms
+
+    @classmethod
+    def from_geopsy(cls, fname, nmodels="all", sort=False, identifiers=None,
+                    workers=1, memory_map=False, nbest="all", max_misfit=None,
+                    where=None, engine="regex"):
         """Create from a file following the `Geopsy` format.
 
         Parameters
@@ -327,31 +602,117 @@ class GroundModelSuite(Suite):
             Indicates whether the imported data should be sorted from
             lowest to highest misfit, default is `False` indicating no
             sorting is performed.  
+        identifiers : iterable of int, optional
+            Identifiers of the `GroundModel`s to be read, default is
+            `None` so all `GroundModel`s are read, see
+            :meth: `iter_geopsy <GroundModelSuite.iter_geopsy>`.
+        workers : int, optional
+            Number of processes used to parse the file, default is 1
+            so the file is parsed in the current process. If greater
+            than 1, the file is split at model boundaries and the
+            parts are parsed in parallel. Only used when reading all
+            models of a file (i.e., `nmodels="all"`,
+            `identifiers=None`, `nbest="all"`, and no filters).
+        memory_map : bool, optional
+            Scan the memory-mapped file as bytes, default is `False`,
+            see :meth: `iter_geopsy <GroundModelSuite.iter_geopsy>`.
+        nbest : {int, 'all'}, optional
+            Number of `GroundModel`s with the lowest misfit to keep,
+            default is 'all' so all models are kept. If an `int`, only
+            a bounded heap of `nbest` unparsed models is kept while
+            reading, only those models are parsed, and the result is
+            sorted from lowest to highest misfit.
+        max_misfit : float, optional
+            Only read `GroundModel`s with a misfit less than or equal
+            to `max_misfit`, default is `None` indicating no limit.
+        where : callable, optional
+            Function of the form `where(identifier, misfit)` returning
+            `True` if the `GroundModel` is to be read, see
+            :meth: `iter_geopsy <GroundModelSuite.iter_geopsy>`.
+        engine : {"regex", "scanner"}, optional
+            Method used to find the models in the file, default is
+            "regex", see
+            :meth: `iter_geopsy <GroundModelSuite.iter_geopsy>`.
 
         Returns
         -------
         GroundModelSuite
             Initialized `GroundModelSuite`.
 
+
+        Raises
+        ------
+        ValueError
+            If no `GroundModel`s are found in the file.
+
         """
         # TODO (jpv): Add warning if nsets < navailable.
-        if nmodels == "all":
-            nmodels = np.inf
+        nmodels = None if nmodels == "all" else int(nmodels)
+        filtered = max_misfit is not None or where is not None
+
+        if (workers > 1 and nmodels is None and identifiers is None and
+                nbest == "all" and not filtered):
+            ranges = fileio.split_ranges(fname, 4*workers)
+            if len(ranges) > 1:
+                starts, stops = zip(*ranges)
+                n = len(ranges)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(cls._read_range, [fname]*n,
+                                           starts, stops, [engine]*n)
+                    gms = [gm for result in results for gm in result]
+                return cls._from_read(gms, fname, sort=sort)
+
+        if nbest == "all":
+            gms = cls.iter_geopsy(fname, identifiers=identifiers,
+                                  memory_map=memory_map,
+                                  max_misfit=max_misfit, where=where,
+                                  engine=engine)
+            return cls._from_read(list(islice(gms, nmodels)), fname,
+                                  sort=sort)
+
+        batches = cls._iter_raw(fname, identifiers=identifiers,
+                                memory_map=memory_map, engine=engine)
+        models = (model for batch in batches for model in batch)
+        models = cls._filter_raw(models, max_misfit=max_misfit, where=where)
+        models = cls._nbest_raw(islice(models, nmodels), nbest)
+        return cls._from_read(cls._gm()._parse_gms(models), fname,
+                              sort=False)
 
-        with open(fname, "r") as f:
-            lines = f.read()
+    @classmethod
+    def _parse_text(cls, text):
+        """Parse the complete `GroundModel`s in Geopsy-style text."""
+        return cls._gm()._parse_gms(regex.gm.findall(text))
 
-        gms = []
-        model_count = 0
-        for model_info in regex.gm.finditer(lines):
-            identifier, misfit, data = model_info.groups()
-            gms.append(cls._gm()._parse_gm(data, identifier, misfit))
+    @classmethod
+    def follow(cls, fname, sort=False):
+        """Create from a Geopsy-style file which is still being written.
+
+        The complete `GroundModel`s currently in the file are read and
+        the position of the last one is remembered such that
+        :meth: `refresh <swprepost.suite.FollowMixin.refresh>` only parses the
+        `GroundModel`s appended afterwards.
+
+        Parameters
+        ----------
+        fname : str
+            Name of file, may contain a relative or the full path.
+        sort : bool, optional
+            Indicates whether the `GroundModel`s should be kept sorted
+            from lowest to highest misfit, default is `False`.
 
-            model_count += 1
-            if model_count == nmodels:
-                break
+        Returns
+        -------
+        GroundModelSuite
+            Initialized `GroundModelSuite`.
+
+        Raises
+        ------
+        ValueError
+            If the file is compressed or does not yet contain a
+            complete `GroundModel`.
 
-        return cls.from_list(gms, sort=sort)
+        """
+        return cls._from_follow(fname, grouped=False, sort=sort)
 
     def __getitem__(self, sliced):
         if isinstance(sliced, int):
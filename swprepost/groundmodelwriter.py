@@ -0,0 +1,72 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2020 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+
+"""GroundModelWriter class definition."""
+
+import io
+
+from swprepost import GroundModel, Writer
+
+__all__ = ["GroundModelWriter"]
+
+
+class GroundModelWriter(Writer):
+    """Streaming writer for `GroundModel`s in the Geopsy format.
+
+    The output is identical to
+    :meth: `write_to_txt <swprepost.GroundModelSuite.write_to_txt>`
+    for the same `GroundModel`s, without requiring a
+    `GroundModelSuite` to be held in memory.
+
+    Example
+    -------
+    >>> with GroundModelWriter("best.txt") as writer:
+    ...     writer.extend(GroundModelSuite.iter_geopsy("gm.txt",
+    ...                                                 max_misfit=0.5))
+
+    """
+
+    @classmethod
+    def _item(cls):
+        """Convenient `GroundModel` to allow subclassing."""
+        return GroundModel
+
+    def _format(self, items):
+        """Text representation of a `list` of `GroundModel`s."""
+        text = io.StringIO()
+        self._item()._write_models(text, items, batch_size=self.batch_size)
+        return text.getvalue()
+
+    def write_layers(self, thickness, vp, vs, density, identifier=0,
+                     misfit=0.0):
+        """Write a ground model from its layers.
+
+        Parameters
+        ----------
+        thickness, vp, vs, density, identifier, misfit
+            See :meth: `GroundModel <swprepost.GroundModel.__init__>`.
+
+        Returns
+        -------
+        None
+            Ground model is buffered and written once the buffer is
+            full.
+
+        """
+        self.write(self._item()(thickness, vp, vs, density,
+                                identifier=identifier, misfit=misfit))
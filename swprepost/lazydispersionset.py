@@ -0,0 +1,149 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2020 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""LazyDispersionSet class definition."""
+
+from collections.abc import Mapping
+
+from swprepost import DispersionSet, regex
+
+__all__ = ["LazyModes", "LazyDispersionSet"]
+
+
+class LazyModes(Mapping):
+    """Read-only mapping of mode number to `DispersionCurve` where
+    each mode is parsed from its text on first access.
+
+    Attributes
+    ----------
+    raw : dict
+        Unparsed modes of the form `{0:text0, ... N:textN}`, modes
+        are removed once parsed.
+
+    """
+
+    def __init__(self, raw, dc):
+        """Create a `LazyModes` object.
+
+        Parameters
+        ----------
+        raw : dict
+            Unparsed modes of the form `{0:text0, ... N:textN}` where
+            each key is the mode number and the value is the text
+            following the mode's header in a Geopsy-style file.
+        dc : type
+            `DispersionCurve` (or subclass) used to parse each mode.
+
+        Returns
+        -------
+        LazyModes
+            Instantiated `LazyModes` object.
+
+        """
+        self.raw = dict(raw)
+        self._keys = list(self.raw)
+        self._dc = dc
+        self._parsed = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._parsed[key]
+        except KeyError:
+            dc = self._dc._parse_dc(self.raw.pop(key))
+            self._parsed[key] = dc
+            return dc
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    @property
+    def nparsed(self):
+        """Number of modes that have been parsed."""
+        return len(self._parsed)
+
+    def __repr__(self):
+        """Unambiguous representation of a `LazyModes` object."""
+        return f"LazyModes(nmodes={len(self)}, nparsed={self.nparsed})"
+
+
+class LazyDispersionSet(DispersionSet):
+    """`DispersionSet` whose modes are parsed on first access.
+
+    Identical to :meth: `DispersionSet <swprepost.DispersionSet>`
+    except when read from a Geopsy-style file `rayleigh` and `love`
+    are :meth: `LazyModes <LazyModes>` so that only the modes which
+    are accessed (e.g., `rayleigh[0]`) are parsed, once.
+
+    """
+
+    def __init__(self, identifier=0, misfit=0.0, rayleigh=None, love=None):
+        """Create a `LazyDispersionSet` object.
+
+        Parameters
+        ----------
+        identifier : str
+            Unique identifier of the `DispersionSet`.
+        misfit : float, optional
+            `DispersionSet` misfit, default is 0.0.
+        rayleigh, love : {dict, LazyModes}
+            Container for `DispersionCurve` objects, see
+            :meth: `DispersionSet <swprepost.DispersionSet.__init__>`.
+
+        Returns
+        -------
+        LazyDispersionSet
+            Instantiated `LazyDispersionSet` object.
+
+        """
+        if rayleigh is None and love is None:
+            msg = "`rayleigh` and `love` cannot both be `None`."
+            raise ValueError(msg)
+
+        self.rayleigh = self._check_modes(rayleigh)
+        self.love = self._check_modes(love)
+
+        self.identifier = int(identifier)
+        self.misfit = float(misfit)
+
+    @classmethod
+    def _check_modes(cls, curveset):
+        """Check `curveset` without parsing any `LazyModes`."""
+        if curveset is None or isinstance(curveset, LazyModes):
+            return curveset
+        cls.check_type(curveset, cls._dc())
+        return dict(curveset)
+
+    @classmethod
+    def _parse_dcs(cls, dcs_data, nmodes="all"):
+        """Split a group of modes into `LazyModes`."""
+        modes = regex.mode.split(dcs_data)
+
+        if nmodes == "all":
+            modes = modes[1:]
+        elif nmodes == 0:
+            return None
+        else:
+            modes = modes[1:nmodes+1]
+
+        return LazyModes(enumerate(modes), cls._dc())
+
+    def __repr__(self):
+        """Unambiguous representation of a `LazyDispersionSet` object."""
+        return f"LazyDispersionSet(identifier={self.identifier}, rayleigh={self.rayleigh}, love={self.love}, misfit={self.misfit})"
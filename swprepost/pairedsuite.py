@@ -0,0 +1,299 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2020 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""PairedSuite class definition."""
+
+from itertools import islice, zip_longest
+import warnings
+
+from swprepost import (GroundModel, GroundModelSuite, DispersionSet,
+                       DispersionSuite, Suite)
+
+__all__ = ["PairedSuite"]
+
+
+class PairedSuite(Suite):
+    """Container for `GroundModel` and `DispersionSet` pairs which
+    share a common identifier.
+
+    Attributes
+    ----------
+    pairs : list
+        Container of tuples of the form `(GroundModel, DispersionSet)`.
+
+    """
+    @staticmethod
+    def check_input(groundmodel, dispersionset):
+        """Check inputs comply with the required format.
+
+        Specifically:
+        1. `groundmodel` is of type `GroundModel`.
+        2. `dispersionset` is of type `DispersionSet`.
+        3. `groundmodel` and `dispersionset` share an identifier.
+
+        """
+        for value, valid_type in [(groundmodel, GroundModel),
+                                  (dispersionset, DispersionSet)]:
+            if not isinstance(value, valid_type):
+                msg = f"Must be instance of {valid_type}, not {type(value)}."
+                raise TypeError(msg)
+        if groundmodel.identifier != dispersionset.identifier:
+            msg = f"Identifiers must match, {groundmodel.identifier} != "
+            msg += f"{dispersionset.identifier}."
+            raise ValueError(msg)
+
+    def __init__(self, groundmodel, dispersionset):
+        """Initialize a `PairedSuite` from a single pair.
+
+        Parameters
+        ----------
+        groundmodel : GroundModel
+            Initialized `GroundModel` object.
+        dispersionset : DispersionSet
+            Initialized `DispersionSet` object with the same
+            identifier as `groundmodel`.
+
+        Returns
+        -------
+        PairedSuite
+            Instantiated `PairedSuite` object.
+
+        Raises
+        ------
+        TypeError
+            If `groundmodel` or `dispersionset` are of the wrong type.
+        ValueError
+            If their identifiers differ.
+
+        """
+        self.check_input(groundmodel, dispersionset)
+        super().__init__((groundmodel, dispersionset))
+
+    @property
+    def pairs(self):
+        return self._items
+
+    @property
+    def gms(self):
+        return [gm for gm, _ in self._items]
+
+    @property
+    def sets(self):
+        return [dc_set for _, dc_set in self._items]
+
+    @property
+    def misfits(self):
+        return [gm.misfit for gm, _ in self._items]
+
+    @property
+    def identifiers(self):
+        return [gm.identifier for gm, _ in self._items]
+
+    def append(self, groundmodel, dispersionset, sort=True):
+        """Append a pair to `PairedSuite`.
+
+        Parameters
+        ----------
+            Refer to :meth: `__init__ <PairedSuite.__init__>`.
+
+        Returns
+        -------
+        None
+            Updates the attribute `pairs`.
+
+        """
+        self.check_input(groundmodel, dispersionset)
+        super()._append((groundmodel, dispersionset), sort=sort)
+
+    @property
+    def groundmodelsuite(self):
+        """`GroundModelSuite` of the ground models in order."""
+        return self._gm_suite().from_list(self.gms, sort=False)
+
+    @property
+    def dispersionsuite(self):
+        """`DispersionSuite` of the dispersion sets in order."""
+        return self._dc_suite().from_list(self.sets, sort=False)
+
+    @classmethod
+    def _gm_suite(cls):
+        """Convenient `GroundModelSuite` to allow subclassing."""
+        return GroundModelSuite
+
+    @classmethod
+    def _dc_suite(cls):
+        """Convenient `DispersionSuite` to allow subclassing."""
+        return DispersionSuite
+
+    @classmethod
+    def from_list(cls, pairs, sort=True):
+        """Instantiate from a list of pairs.
+
+        Parameters
+        ----------
+        pairs : list of tuple
+            Of the form `[(GroundModel, DispersionSet), ... ]`.
+        sort : bool, optional
+            Indicates whether the pairs should be sorted from lowest
+            to highest misfit, default is `True`.
+
+        Returns
+        -------
+        PairedSuite
+            Instantiated `PairedSuite` object.
+
+        """
+        obj = cls(*pairs[0])
+        if len(pairs) > 1:
+            for pair in pairs[1:]:
+                obj.append(*pair, sort=False)
+            if sort:
+                obj._sort()
+        return obj
+
+    @classmethod
+    def _iter_raw(cls, fname_gm, fname_dc, memory_map=False, engine="regex"):
+        """Pair the unparsed models of two Geopsy-style files.
+
+        The files are read in lock-step, models which do not share
+        the same position are matched through their identifier.
+
+        Yields
+        ------
+        tuple
+            Of the form `(identifier, misfit, gm_raw, dc_raw)`, see
+            :meth: `_iter_raw <GroundModelSuite._iter_raw>` and
+            :meth: `_iter_raw <DispersionSuite._iter_raw>`.
+
+        """
+        batches = cls._gm_suite()._iter_raw(fname_gm, memory_map=memory_map,
+                                            engine=engine)
+        gms = (gm for batch in batches for gm in batch)
+        dcs = cls._dc_suite()._iter_raw(fname_dc, memory_map=memory_map,
+                                        engine=engine)
+
+        pending_gms, pending_dcs = {}, {}
+        for gm, dc in zip_longest(gms, dcs):
+            if gm is not None and dc is not None and gm[0] == dc[0]:
+                yield (gm[0], gm[1], gm, dc)
+                continue
+
+            if gm is not None:
+                match = pending_dcs.pop(gm[0], None)
+                if match is None:
+                    pending_gms[gm[0]] = gm
+                else:
+                    yield (gm[0], gm[1], gm, match)
+
+            if dc is not None:
+                match = pending_gms.pop(dc[0], None)
+                if match is None:
+                    pending_dcs[dc[0]] = dc
+                else:
+                    yield (dc[0], match[1], match, dc)
+
+        nunmatched = len(pending_gms) + len(pending_dcs)
+        if nunmatched:
+            msg = f"{nunmatched} models without a match in {fname_gm} and "
+            msg += f"{fname_dc} were ignored."
+            warnings.warn(msg)
+
+    @classmethod
+    def from_geopsy(cls, fname_gm, fname_dc, nmodels="all", nrayleigh="all",
+                    nlove="all", sort=True, nbest="all", max_misfit=None,
+                    where=None, memory_map=False, lazy=False,
+                    engine="regex"):
+        """Create from a pair of files following the Geopsy format.
+
+        The ground model and dispersion files are read together and
+        their models are paired by identifier in a single pass, only
+        the models which are kept are parsed.
+
+        Parameters
+        ----------
+        fname_gm, fname_dc : str
+            Name of the ground model and dispersion files from the
+            same inversion, may contain a relative or the full path.
+        nmodels : {int, 'all'}, optional
+            Number of pairs to extract, default is `all`.
+        nrayleigh, nlove : int, optional
+            Number of Rayleigh and Love modes respectively, default
+            is "all" so all available modes will be extracted.
+        sort : bool, optional
+            Indicates whether the pairs should be sorted from lowest
+            to highest misfit, default is `True`.
+        nbest : {int, 'all'}, optional
+            Number of pairs with the lowest misfit to keep, default is
+            'all', see
+            :meth: `from_geopsy <GroundModelSuite.from_geopsy>`.
+        max_misfit : float, optional
+            Only read pairs with a misfit less than or equal to
+            `max_misfit`, default is `None` indicating no limit.
+        where : callable, optional
+            Function of the form `where(identifier, misfit)` returning
+            `True` if the pair is to be read, default is `None` so all
+            pairs are read.
+        memory_map : bool, optional
+            Scan the memory-mapped files as bytes, default is `False`,
+            see :meth: `iter_geopsy <GroundModelSuite.iter_geopsy>`.
+        lazy : bool, optional
+            If `True` the `DispersionSet`s are `LazyDispersionSet`s,
+            default is `False`.
+        engine : {"regex", "scanner"}, optional
+            Method used to find the models in the files, default is
+            "regex", see
+            :meth: `iter_geopsy <GroundModelSuite.iter_geopsy>`.
+
+        Returns
+        -------
+        PairedSuite
+            Instantiated `PairedSuite` object.
+
+        """
+        nmodels = None if nmodels == "all" else int(nmodels)
+
+        raws = cls._iter_raw(fname_gm, fname_dc, memory_map=memory_map,
+                             engine=engine)
+        raws = cls._filter_raw(raws, max_misfit=max_misfit, where=where)
+        raws = islice(raws, nmodels)
+        if nbest == "all":
+            raws = list(raws)
+        else:
+            raws, sort = cls._nbest_raw(raws, nbest), False
+
+        gms = cls._gm_suite()._gm()._parse_gms([raw[2] for raw in raws])
+        dc_suite = cls._dc_suite()
+        dc_sets = [dc_suite._parse_set(*raw[3], nrayleigh=nrayleigh,
+                                       nlove=nlove, lazy=lazy)
+                   for raw in raws]
+        return cls._from_read(list(zip(gms, dc_sets)),
+                              f"{fname_gm} and {fname_dc}", sort=sort)
+
+    def __getitem__(self, sliced):
+        if isinstance(sliced, slice):
+            return self.from_list(self.pairs[sliced], sort=False)
+        return self.pairs[sliced]
+
+    def __iter__(self):
+        return iter(self.pairs)
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def __str__(self):
+        """Human-readable representation of a `PairedSuite`."""
+        return f"PairedSuite with {len(self.pairs)} pairs."
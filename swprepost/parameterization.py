@@ -19,13 +19,10 @@
 
 import warnings
 import logging
-import tarfile as tar
-import os
-import re
 
 import numpy as np
 
-from swprepost import Parameter
+from swprepost import Parameter, fileio, regex
 
 logging.Logger(name=__name__)
 
@@ -334,17 +331,15 @@ indicate by setting `full_version='2.9.0'`, otherwise no action is required."
                      '  </ParamGroundModel>',
                      '</Dinver>']
 
-        with open("contents.xml", "w") as f:
-            for row in contents:
-                f.write(row+"\n")
-        with tar.open(fname_prefix+".param", "w:gz") as f:
-            f.add("contents.xml")
-        os.remove("contents.xml")
+        fileio.write_contents(fname_prefix+".param", contents)
 
     @classmethod
     def from_param(cls, fname_prefix):
         """Instantitate a Parameterization object from a .param file.
 
+        The `contents.xml` of the archive is streamed and parsed one
+        `<ParamProfile>` at a time, nothing is extracted to disk.
+
         Parameters
         ----------
         fname_prefix : str
@@ -361,93 +356,79 @@ indicate by setting `full_version='2.9.0'`, otherwise no action is required."
         ValueError:
             If file encoding is not recognized.
         """
-        with tar.open(fname_prefix+".param", "r:gz") as a:
-            a.extractall()
-
-        try:
-            with open("contents.xml", "r", encoding="utf-8") as f:
-                lines = f.read()
-            if "<Dinver>" not in lines[:10]:
-                raise RuntimeError
-        except (UnicodeDecodeError, RuntimeError):
-            with open("contents.xml", "r", encoding="utf_16_le") as f:
-                lines = f.read()
-            if "<Dinver>" not in lines[:10]:
-                raise ValueError("File encoding not recognized.")
-        os.remove("contents.xml")
-
-        section_lines = []
-        lines = lines.splitlines()
-        for line_count, line in enumerate(lines):
-            if "<shortName>" in line:
-                section_lines.append(line_count)
-        section_lines.append(len(lines))
-
-        number = f"(-?\d+.?\d*[eE]?[+-]?\d*)"
-        newline = r"\W+"
-        reg_shape = "<shape>.*</shape>"
-        reg_cond = "<lastParamCondition>(true|false)</lastParamCondition>"
-        reg_nsub = "<nSubayers>\d+</nSubayers>"
-        reg_pmin = f"<topMin>{number}</topMin>"
-        reg_pmax = f"<topMax>{number}</topMax>"
-        reg_link = "<linkedTo>.*</linkedTo>"
-        reg_isdepth = "<isDepth>(true|false)</isDepth>"
-        reg_lmin = f"<dhMin>{number}</dhMin>"
-        reg_lmax = f"<dhMax>{number}</dhMax>"
-
-        regex = ""
-        for cond in [reg_shape, reg_cond, reg_nsub, reg_pmin, reg_pmax,
-                     reg_link, reg_isdepth, reg_lmin, reg_lmax]:
-            regex += f"{cond}{newline}"
-
-        for section_start, section_end in zip(section_lines[:-1], section_lines[1:]):
-            section_lines = lines[section_start:section_end]
-            name = re.findall(
-                "^\s+<shortName>(.*)</shortName>", section_lines[0])[0]
-            section = "\n".join(section_lines)
-
-            # Assume shape is uniform
-            tmp_rev = []
-            # Ignore sublayers
-            tmp_pmin = []
-            tmp_pmax = []
-            # Assume unlinked
-            tmp_depth = []
-            tmp_lmin = []
-            tmp_lmax = []
-
-            for rev, pmin, pmax, depth, lmin, lmax in re.findall(regex, section):
-                tmp_rev.append(False if rev == "true" else True)
-                tmp_pmin.append(float(pmin))
-                tmp_pmax.append(float(pmax))
-                tmp_depth.append(True if depth == "true" else False)
-                tmp_lmin.append(float(lmin))
-                tmp_lmax.append(float(lmax))
-
-            # Dont allow for mixed thickness and depth
-            if len(tmp_depth) > 1:
-                isdepth = tmp_depth[1]
-                for val in tmp_depth[1:]:
-                    if val != isdepth:
-                        msg = "Parameterizations with layers defined in terms of thickness and depth cannot be parsed at this time."
-                        raise ValueError(msg)
-            else:
-                isdepth = True
-
-            lay_type = "depth" if isdepth else "thickness"
-            par = Parameter(tmp_lmin, tmp_lmax, tmp_pmin,
-                            tmp_pmax, tmp_rev, lay_type)
-            if name == "Vp":
-                vp = par
-            elif name == "Vs":
-                vs = par
-            elif name == "Rho":
-                rh = par
-            elif name == "Nu":
-                pr = par
-            else:
+        end = "</ParamProfile>"
+        parameters, buffer = {}, ""
+        for text in fileio.iter_contents(fname_prefix+".param"):
+            buffer += text
+            split = buffer.rfind(end)
+            if split >= 0:
+                for section in buffer[:split].split(end):
+                    name, par = cls._parse_profile(section)
+                    parameters[name] = par
+                buffer = buffer[split+len(end):]
+
+        names = ["Vp", "Nu", "Vs", "Rho"]
+        for name in parameters:
+            if name not in names:
                 raise NotImplementedError
-        return cls(vp, pr, vs, rh)
+        return cls(*[parameters[name] for name in names])
+
+    @staticmethod
+    def _parse_profile(section):
+        """Parse the text of a `<ParamProfile>` into a `Parameter`.
+
+        Parameters
+        ----------
+        section : str
+            Text of a `<ParamProfile>` element.
+
+        Returns
+        -------
+        tuple
+            Of the form `(name, Parameter)` where `name` is the short
+            name of the profile (e.g., "Vs").
+
+        Raises
+        ------
+        ValueError
+            If the layers are defined in terms of both thickness and
+            depth.
+
+        """
+        name = regex.param_name.search(section).group(1)
+
+        # Assume shape is uniform
+        tmp_rev = []
+        # Ignore sublayers
+        tmp_pmin = []
+        tmp_pmax = []
+        # Assume unlinked
+        tmp_depth = []
+        tmp_lmin = []
+        tmp_lmax = []
+
+        for rev, pmin, pmax, depth, lmin, lmax in regex.param_layer.findall(section):
+            tmp_rev.append(False if rev == "true" else True)
+            tmp_pmin.append(float(pmin))
+            tmp_pmax.append(float(pmax))
+            tmp_depth.append(True if depth == "true" else False)
+            tmp_lmin.append(float(lmin))
+            tmp_lmax.append(float(lmax))
+
+        # Dont allow for mixed thickness and depth
+        if len(tmp_depth) > 1:
+            isdepth = tmp_depth[1]
+            for val in tmp_depth[1:]:
+                if val != isdepth:
+                    msg = "Parameterizations with layers defined in terms of thickness and depth cannot be parsed at this time."
+                    raise ValueError(msg)
+        else:
+            isdepth = True
+
+        lay_type = "depth" if isdepth else "thickness"
+        par = Parameter(tmp_lmin, tmp_lmax, tmp_pmin,
+                        tmp_pmax, tmp_rev, lay_type)
+        return (name, par)
 
     def __eq__(self, other):
         for attr in ["vp", "pr", "vs", "rh"]:
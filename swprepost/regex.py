@@ -21,12 +21,17 @@ import re
 
 number = r"\d+.?\d*[eE]?[+-]?\d*"
 
+# Line ends of the multi-line patterns. Text is read with universal
+# newlines, memory-mapped bytes are not and may also contain "\r\n".
+eol = r"\n"
+eol_bytes = r"\r?\n"
+
 # DC
-pair = f"{number} {number}\n"
+pair = f"{number} {number}{eol}"
 model_txt = r"# Layered model (\d+): value=(\d+.?\d*)"
 wave_txt = r"# \d+ (Rayleigh|Love) dispersion mode\(s\)"
-mode_txt = r"# Mode \d+\n"
-dcset_txt = f"{model_txt}\n{wave_txt}\n.*\n((?:{mode_txt}(?:{pair})+)+)"
+mode_txt = rf"# Mode \d+{eol}"
+dcset_txt = f"{model_txt}{eol}{wave_txt}{eol}.*{eol}((?:{mode_txt}(?:{pair})+)+)"
 
 model = re.compile(model_txt)
 mode = re.compile(mode_txt)
@@ -34,8 +39,32 @@ dcset = re.compile(dcset_txt)
 dc_data = re.compile(f"({number}) ({number})")
 
 # GM
-quad = f"{number} {number} {number} {number}\n"
-gm_txt = f"{model_txt}\n\d+\n((?:{quad})+)"
+quad = f"{number} {number} {number} {number}{eol}"
+gm_txt = rf"{model_txt}{eol}\d+{eol}((?:{quad})+)"
 
 gm = re.compile(gm_txt)
 gm_data = re.compile(f"({number}) ({number}) ({number}) ({number})")
+
+# Target
+target_point = re.compile(r"<x>([^<]*)</x>\s*<mean>([^<]*)</mean>\s*<stddev>([^<]*)</stddev>")
+
+# Parameterization
+param_name = re.compile(r"<shortName>(.*)</shortName>")
+param_layer_txt = [r"<shape>.*</shape>",
+                   r"<lastParamCondition>(true|false)</lastParamCondition>",
+                   r"<nSubayers>\d+</nSubayers>",
+                   r"<topMin>([^<]*)</topMin>",
+                   r"<topMax>([^<]*)</topMax>",
+                   r"<linkedTo>.*</linkedTo>",
+                   r"<isDepth>(true|false)</isDepth>",
+                   r"<dhMin>([^<]*)</dhMin>",
+                   r"<dhMax>([^<]*)</dhMax>"]
+param_layer = re.compile(r"\W+".join(param_layer_txt))
+
+# Bytes
+model_bytes = re.compile(model_txt.encode())
+dcset_bytes = re.compile(dcset_txt.replace(eol, eol_bytes).encode())
+gm_bytes = re.compile(gm_txt.replace(eol, eol_bytes).encode())
+
+# File names
+fname_tokens = re.compile(r"(L[NR])(\d+)_T[rR]?(\d+)")
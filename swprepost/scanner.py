@@ -0,0 +1,287 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2021 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+"""Single-pass scanners for Geopsy-style text files.
+
+An alternative to the regular expressions in `regex.py` which runs in
+time linear in the size of the text regardless of its contents. Each
+scanner yields the same groups as its regular expression counterpart
+for well-formed text and accepts `str`, `bytes`, or a memory-mapped
+file.
+
+"""
+
+from swprepost import regex
+
+__all__ = ["ENGINES", "select", "scan_gm", "scan_dc", "clean"]
+
+ENGINES = ("regex", "scanner")
+
+
+# Characters of well-formed data, i.e., numbers and mode headers.
+CHARACTERS = "0123456789.eE+- \t\r\n#Mod"
+
+# Longest token expected in well-formed data.
+MAX_TOKEN = 32
+
+
+class _Literals():
+    """Literals of the Geopsy format as `str` or `bytes`."""
+
+    def __init__(self, encode):
+        self.header = encode("# Layered model ")
+        self.value = encode(": value=")
+        self.newline = encode("\n")
+        self.crlf = encode("\r\n")
+        self.comment = encode("\n#")
+        self.hash = encode("#")
+        self.mode = encode("# Mode ")
+        self.waves = (encode("Rayleigh"), encode("Love"))
+        self.tail = [encode("dispersion"), encode("mode(s)")]
+        self.empty = encode("")
+
+
+STR = _Literals(lambda text: text)
+BYTES = _Literals(str.encode)
+_DELETE_STR = str.maketrans("", "", CHARACTERS)
+_DELETE_BYTES = CHARACTERS.encode()
+
+
+def _literals(data):
+    return STR if isinstance(data, str) else BYTES
+
+
+def _is_number(token):
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+def clean(data, ncols, literals=None):
+    """Remove malformed lines from the data of a model.
+
+    Parameters
+    ----------
+    data : {str, bytes}
+        Data of a single model, see :meth: `scan_gm <scan_gm>` and
+        :meth: `scan_dc <scan_dc>`.
+    ncols : int
+        Number of numeric columns of each line of data.
+    literals : _Literals, optional
+        Literals matching the type of `data`, default is `None` so
+        they are selected based on the type of `data`.
+
+    Returns
+    -------
+    {str, bytes}
+        `data` with only its mode headers and lines of exactly
+        `ncols` numbers and Windows line endings normalized. If
+        `data` passes a fast check for well-formed data it is
+        returned as is, otherwise each line is checked.
+
+    """
+    lit = _literals(data) if literals is None else literals
+    if lit.crlf in data:
+        data = data.replace(lit.crlf, lit.newline)
+
+    # Fast check that the data is well-formed, i.e., the number of
+    # tokens is consistent, only number characters are present, and
+    # no token is unreasonably long.
+    nlines = data.count(lit.newline)
+    nmodes = data.count(lit.mode)
+    tokens = data.split()
+    if isinstance(data, str):
+        others = data.translate(_DELETE_STR)
+    else:
+        others = data.translate(None, _DELETE_BYTES)
+    if (len(tokens) == ncols*(nlines - nmodes) + 3*nmodes and
+            others == lit.empty and
+            max(map(len, tokens), default=0) <= MAX_TOKEN):
+        return data
+
+    lines = []
+    for line in data.split(lit.newline)[:nlines]:
+        if line[:len(lit.mode)] == lit.mode:
+            lines.append(line)
+            continue
+        tokens = line.split()
+        if len(tokens) == ncols and all(map(_is_number, tokens)):
+            lines.append(line)
+    lines.append(lit.empty)
+    return lit.newline.join(lines)
+
+
+def _header(data, position, lit):
+    """Find and parse the next model header after `position`.
+
+    Returns
+    -------
+    tuple
+        Of the form `(identifier, misfit, end)` where `end` is the
+        position after the header's line, or `None` if there are no
+        further complete headers.
+
+    """
+    while True:
+        start = data.find(lit.header, position)
+        if start < 0:
+            return None
+        end = data.find(lit.newline, start)
+        if end < 0:
+            return None
+        line = data[start+len(lit.header):end].rstrip()
+        identifier, sep, misfit = line.partition(lit.value)
+        if sep and identifier.isdigit() and _is_number(misfit):
+            return (identifier, misfit, end+1)
+        position = end + 1
+
+
+def _data_end(data, start, lit):
+    """End of a model's data, one past its last complete line."""
+    found = data.find(lit.comment, start)
+    if found < 0:
+        return max(data.rfind(lit.newline) + 1, start)
+    return found + 1
+
+
+def scan_gm(data):
+    """Scan Geopsy-style ground model text.
+
+    Parameters
+    ----------
+    data : {str, bytes, mmap}
+        Text following the Geopsy ground model format.
+
+    Yields
+    ------
+    tuple
+        Of the form `(identifier, misfit, gm_data)`, identical to the
+        groups of `regex.gm`. Lines of `gm_data` which do not contain
+        four numbers are removed.
+
+    """
+    lit = _literals(data)
+    position = 0
+    while True:
+        header = _header(data, position, lit)
+        if header is None:
+            return
+        identifier, misfit, position = header
+
+        # Number of layers.
+        end = data.find(lit.newline, position)
+        if end < 0:
+            return
+        if not data[position:end].strip().isdigit():
+            continue
+
+        start = end + 1
+        position = _data_end(data, end, lit)
+        if position > start:
+            gm_data = clean(data[start:position], 4, literals=lit)
+            if gm_data:
+                yield (identifier, misfit, gm_data)
+
+
+def scan_dc(data):
+    """Scan Geopsy-style dispersion text.
+
+    Parameters
+    ----------
+    data : {str, bytes, mmap}
+        Text following the Geopsy dispersion format.
+
+    Yields
+    ------
+    tuple
+        Of the form `(identifier, misfit, wave_type, data)`, identical
+        to the groups of `regex.dcset`. Lines of `data` which are
+        neither a mode header nor contain two numbers are removed.
+
+    """
+    lit = _literals(data)
+    position = 0
+    while True:
+        header = _header(data, position, lit)
+        if header is None:
+            return
+        identifier, misfit, position = header
+
+        # Wave type, e.g., "# 2 Rayleigh dispersion mode(s)".
+        end = data.find(lit.newline, position)
+        if end < 0:
+            return
+        words = data[position:end].split()
+        if not (len(words) == 5 and words[0] == lit.hash and
+                words[1].isdigit() and words[2] in lit.waves and
+                words[3:] == lit.tail):
+            continue
+        wave_type = words[2]
+
+        # Skip CPU time line.
+        end = data.find(lit.newline, end+1)
+        if end < 0:
+            return
+        start = position = end + 1
+
+        # Modes continue until a comment which is not a mode header.
+        while data[position:position+len(lit.mode)] == lit.mode:
+            end = data.find(lit.newline, position)
+            if end < 0:
+                break
+            position = _data_end(data, end, lit)
+        if position > start:
+            modes = clean(data[start:position], 2, literals=lit)
+            if modes:
+                yield (identifier, misfit, wave_type, modes)
+
+
+def select(fmt, engine="regex"):
+    """Select the functions which find the models of a format.
+
+    Parameters
+    ----------
+    fmt : {"gm", "dc"}
+        Ground model or dispersion format.
+    engine : {"regex", "scanner"}, optional
+        Regular expressions from `regex.py` or the scanners of this
+        module, default is "regex".
+
+    Returns
+    -------
+    tuple
+        Of the form `(scan, scan_bytes)` where `scan` returns the
+        groups of each model in `str` and `scan_bytes` is suitable
+        for :meth: `iter_mmap <swprepost.fileio.iter_mmap>`.
+
+    Raises
+    ------
+    ValueError
+        If `engine` is not one of `ENGINES`.
+
+    """
+    if engine == "regex":
+        if fmt == "gm":
+            return (regex.gm.findall, regex.gm_bytes)
+        return (regex.dcset.findall, regex.dcset_bytes)
+    elif engine == "scanner":
+        scan = scan_gm if fmt == "gm" else scan_dc
+        return (scan, scan)
+    else:
+        msg = f"engine must be one of {ENGINES}, not {engine}."
+        raise ValueError(msg)
@@ -18,11 +18,14 @@
 """Suite class definition."""
 
 from abc import ABC, abstractmethod
+import heapq
 import warnings
 
 import numpy as np
 
-__all__ = ["Suite"]
+from swprepost import fileio
+
+__all__ = ["Suite", "FollowMixin"]
 
 
 class Suite(ABC):
@@ -43,6 +46,166 @@ class Suite(ABC):
         self._items = [x for _, x in sorted(zip(self.misfits, self._items),
                                             key=lambda pair: pair[0])]
 
+    @classmethod
+    def _from_read(cls, items, fname, sort=False):
+        """Instantiate from the items read from `fname`.
+
+        Raises
+        ------
+        ValueError
+            If no items were read.
+
+        """
+        if len(items) == 0:
+            raise ValueError(f"No models found in {fname}.")
+        return cls.from_list(items, sort=sort)
+
+    @staticmethod
+    def _filter_raw(models, max_misfit=None, where=None):
+        """Filter unparsed models on their header alone.
+
+        Parameters
+        ----------
+        models : iterable of tuple
+            Unparsed models of the form `(identifier, misfit, ...)`
+            where `identifier` and `misfit` are `str`.
+        max_misfit : float, optional
+            Reject models with a misfit greater than `max_misfit`,
+            default is `None` so no models are rejected on misfit.
+        where : callable, optional
+            Function of the form `where(identifier, misfit)` which
+            returns `True` if the model is to be kept, default is
+            `None` so no models are rejected.
+
+        Returns
+        -------
+        iterable of tuple
+            Models that satisfy all conditions, in order.
+
+        """
+        if max_misfit is None and where is None:
+            return models
+
+        def keep(model):
+            misfit = float(model[1])
+            if max_misfit is not None and misfit > max_misfit:
+                return False
+            if where is not None and not where(int(model[0]), misfit):
+                return False
+            return True
+
+        return filter(keep, models)
+
+    @staticmethod
+    def _nbest_raw(models, nbest):
+        """Select the unparsed models with the lowest misfit.
+
+        Only a bounded heap of `nbest` models is held in memory, such
+        that the data of rejected models is never parsed.
+
+        Parameters
+        ----------
+        models : iterable of tuple
+            Unparsed models of the form `(identifier, misfit, ...)`
+            where `identifier` and `misfit` are `str`.
+        nbest : int
+            Number of models to keep.
+
+        Returns
+        -------
+        list of tuple
+            Up to `nbest` models sorted from lowest to highest misfit,
+            ties are kept in their original order.
+
+        """
+        try:
+            nbest = int(nbest)
+        except ValueError as e:
+            msg = "`nbest` must be cast-able to `int`."
+            raise ValueError(msg) from e
+        if nbest < 1:
+            raise ValueError(f"`nbest` must be at least 1, not {nbest}.")
+
+        # Min-heap of (-misfit, -order), worst kept model at the top.
+        heap = []
+        for order, model in enumerate(models):
+            item = (-float(model[1]), -order, model)
+            if len(heap) < nbest:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        return [model for _, _, model in sorted(heap, reverse=True)]
+
+    @staticmethod
+    def _select_rows(misfits, nmodels="all", nbest="all", max_misfit=None):
+        """Select the models of a columnar cache to instantiate.
+
+        Only the misfits are inspected, such that the data of rejected
+        models is never read from disk.
+
+        Parameters
+        ----------
+        misfits : ndarray
+            Misfit of each model in the cache.
+        nmodels : {int, 'all'}, optional
+            Number of models to keep in cache order, default is 'all'.
+        nbest : {int, 'all'}, optional
+            Number of models with the lowest misfit to keep, default
+            is 'all'.
+        max_misfit : float, optional
+            Only keep models with a misfit less than or equal to
+            `max_misfit`, default is `None` indicating no limit.
+
+        Returns
+        -------
+        ndarray
+            Of `int`, rows to keep in cache order or sorted from
+            lowest to highest misfit if `nbest` is provided, ties are
+            kept in cache order.
+
+        """
+        misfits = np.asarray(misfits)
+        rows = np.arange(misfits.size)
+        if max_misfit is not None:
+            rows = rows[misfits <= max_misfit]
+        if nmodels != "all":
+            rows = rows[:int(nmodels)]
+        if nbest != "all":
+            try:
+                nbest = int(nbest)
+            except ValueError as e:
+                msg = "`nbest` must be cast-able to `int`."
+                raise ValueError(msg) from e
+            if nbest < 1:
+                raise ValueError(f"`nbest` must be at least 1, not {nbest}.")
+            rows = rows[np.argsort(misfits[rows], kind="stable")[:nbest]]
+        return rows
+
+    @staticmethod
+    def _gather_ranges(offsets, rows):
+        """Indices of the entries of `rows` in a flat offset array.
+
+        Parameters
+        ----------
+        offsets : ndarray
+            Of `int`, where the entries of row `i` are
+            `offsets[i]:offsets[i+1]`.
+        rows : ndarray
+            Of `int`, rows to gather.
+
+        Returns
+        -------
+        tuple
+            Of the form `(indices, counts)` where `indices` are the
+            positions of all entries of `rows` in order and `counts`
+            are the number of entries of each row.
+
+        """
+        starts = np.asarray(offsets[rows], dtype=np.int64)
+        counts = np.asarray(offsets[rows+1], dtype=np.int64) - starts
+        shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return (np.arange(counts.sum()) + shifts, counts)
+
     @property
     def size(self):
         return len(self._items)
@@ -142,4 +305,99 @@ class Suite(ABC):
             if my != ur:
                 return False
         return True
-        
\ No newline at end of file
+
+
+class FollowMixin(ABC):
+    """Read a Geopsy-style file which is still being written.
+
+    Mixed into a `Suite` whose models can be parsed from text, see
+    :meth: `follow <swprepost.GroundModelSuite.follow>`.
+
+    """
+    _follow = None
+
+    @classmethod
+    @abstractmethod
+    def _parse_text(cls, text, **kwargs):
+        """Parse the complete models in `text` into a `list` of items."""
+
+    @classmethod
+    def _from_follow(cls, fname, grouped=False, sort=False, **kwargs):
+        """Instantiate from the complete models in a file and follow it.
+
+        Parameters
+        ----------
+        fname : str
+            Name of file, may be a relative or the full path.
+        grouped : bool, optional
+            Refer to
+            :meth: `complete_models <swprepost.fileio.complete_models>`.
+        sort : bool, optional
+            Indicates whether the items should be kept sorted from
+            lowest to highest misfit, default is `False`.
+        **kwargs
+            Keyword arguments passed to `_parse_text`.
+
+        Returns
+        -------
+        Suite
+            Instantiated `Suite` object, see
+            :meth: `refresh <FollowMixin.refresh>`.
+
+        Raises
+        ------
+        ValueError
+            If the file does not yet contain a complete model.
+
+        """
+        text, stop = fileio.read_appended(fname, 0, grouped=grouped)
+        items = cls._parse_text(text, **kwargs)
+        if len(items) == 0:
+            raise ValueError(f"{fname} does not contain a complete model.")
+
+        obj = cls.from_list(items, sort=sort)
+        obj._follow = dict(fname=fname, stop=stop, grouped=grouped,
+                           sort=sort, kwargs=kwargs)
+        return obj
+
+    def refresh(self, final=False):
+        """Append the models added to the followed file since the last
+        read.
+
+        Only complete models written after the previous read are
+        parsed, such that the cost of each refresh is proportional to
+        the number of new models.
+
+        Parameters
+        ----------
+        final : bool, optional
+            Indicates the file is no longer being written so all
+            remaining text is read, default is `False`. Required to
+            read the last model of a grouped (i.e., dispersion) file
+            as it is otherwise only read once the next model begins.
+
+        Returns
+        -------
+        int
+            Number of models appended.
+
+        Raises
+        ------
+        ValueError
+            If the `Suite` is not following a file.
+
+        """
+        if self._follow is None:
+            raise ValueError("Suite is not following a file, use `follow`.")
+        follow = self._follow
+
+        text, follow["stop"] = fileio.read_appended(follow["fname"],
+                                                    follow["stop"],
+                                                    grouped=follow["grouped"],
+                                                    final=final)
+        items = self._parse_text(text, **follow["kwargs"])
+        for item in items:
+            self._append(item, sort=False)
+        if follow["sort"] and items:
+            self._sort()
+        return len(items)
@@ -17,16 +17,14 @@
 
 """Definition of Target class."""
 
-import tarfile as tar
-import os
 import warnings
-import re
 
 import matplotlib.pyplot as plt
 import numpy as np
 
 from swprepost import Curve
 from swprepost import CurveUncertain
+from swprepost import batch, fileio, regex
 
 
 class Target(CurveUncertain):
@@ -162,7 +160,9 @@ class Target(CurveUncertain):
         """Construct instance from csv file.
 
         Read a comma seperated values (csv) file with header line(s) to
-        construct a target object.
+        construct a target object. The file is read in a single pass
+        into arrays, only files which mix rows with and without a
+        velocity standard deviation are read line-by-line.
 
         Parameters
         ----------
@@ -187,6 +187,60 @@ class Target(CurveUncertain):
             detailed above.
 
         """
+        try:
+            data = np.loadtxt(fname, delimiter=",", comments=commentcharacter,
+                              ndmin=2)
+        except ValueError:
+            data = cls._read_csv_lines(fname, commentcharacter)
+
+        if data.shape[1] == 2:
+            data = np.column_stack((data, np.zeros(len(data))))
+        elif data.shape[1] != 3:
+            msg = f"Format of input file {fname} not recognized. Refer to documentation."
+            raise ValueError(msg)
+        return cls(data[:, 0], data[:, 1], data[:, 2])
+
+    @classmethod
+    def from_csvs(cls, fnames, commentcharacter="#", workers=None,
+                  executor="process"):
+        """Construct many instances from csv files concurrently.
+
+        Parameters
+        ----------
+        fnames : iterable of str
+            Names or paths to files, see
+            :meth: `from_csv <Target.from_csv>` for their format.
+        commentcharacter : str, optional
+            Character at the beginning of a line denoting a
+            comment, default value is '#'.
+        workers : int, optional
+            Maximum number of threads or processes, default is `None`
+            so the executor's default is used.
+        executor : {"process", "thread"}, optional
+            Type of pool used to read the files, default is "process".
+
+        Returns
+        -------
+        list
+            Of initialized `Target` objects, one per file in the order
+            of `fnames`.
+
+        Raises
+        ------
+        ValueError
+            If `executor` is not recognized or if the format of a file
+            is not recognized.
+
+        """
+        pool = batch.get_executor(executor)
+        fnames = list(fnames)
+        with pool(max_workers=workers) as pool_executor:
+            return list(pool_executor.map(cls.from_csv, fnames,
+                                          [commentcharacter]*len(fnames)))
+
+    @staticmethod
+    def _read_csv_lines(fname, commentcharacter="#"):
+        """Read csv line-by-line, allows rows with and without velstd."""
         with open(fname, "r") as f:
             lines = f.read().splitlines()
 
@@ -208,7 +262,7 @@ class Target(CurveUncertain):
             frequency.append(float(a))
             velocity.append(float(b))
             velstd.append(float(c))
-        return cls(frequency, velocity, velstd)
+        return np.column_stack((frequency, velocity, velstd))
 
     @classmethod
     def from_wavelength(cls, wavelength, velocity, velstd=0.05):
@@ -772,12 +826,44 @@ class Target(CurveUncertain):
         contents += ["  </TargetList>",
                      "</Dinver>"]
 
-        with open("contents.xml", "w", encoding="utf-8") as f:
-            for row in contents:
-                f.write(row+"\n")
-        with tar.open(fname_prefix+".target", "w:gz") as f:
-            f.add("contents.xml")
-        os.remove("contents.xml")
+        fileio.write_contents(fname_prefix+".target", contents)
+
+    @classmethod
+    def _read_points(cls, texts):
+        """Parse the statistical points of `contents.xml`.
+
+        The text is searched one chunk at a time, such that the file
+        is never held in memory in full, see
+        :meth: `iter_contents <swprepost.fileio.iter_contents>`.
+
+        Parameters
+        ----------
+        texts : iterable of str
+            Decoded chunks of `contents.xml`.
+
+        Returns
+        -------
+        ndarray
+            Of shape `(npoints, 3)` where each row is of the form
+            `(x, mean, stddev)`.
+
+        Raises
+        ------
+        ValueError
+            If the encoding is not recognized.
+
+        """
+        end = "</stddev>"
+        points, buffer = [], ""
+        for text in texts:
+            buffer += text
+            split = buffer.rfind(end)
+            if split >= 0:
+                split += len(end)
+                points += regex.target_point.findall(buffer, 0, split)
+                buffer = buffer[split:]
+
+        return np.array(points, dtype=float).reshape(-1, 3)
 
     @classmethod
     def from_target(cls, fname_prefix, version="3"):
@@ -800,33 +886,9 @@ class Target(CurveUncertain):
             Instantiated `Target` object.
 
         """
-        with tar.open(fname_prefix+".target", "r:gz") as a:
-            a.extractall()
-
-        try:
-            with open("contents.xml", "r", encoding="utf-8") as f:
-                lines = f.read()
-            if "<Dinver>" not in lines[:10]:
-                raise RuntimeError
-        except (UnicodeDecodeError, RuntimeError):
-            with open("contents.xml", "r", encoding="utf_16_le") as f:
-                lines = f.read()
-            if "<Dinver>" not in lines[:10]:
-                raise ValueError("File encoding not recognized.")
-
-        os.remove("contents.xml")
-
-        number = f"(-?\d+.?\d*[eE]?[+-]?\d*)"
-        newline = r"\W+"
-        regex = f"<x>{number}</x>{newline}<mean>{number}</mean>{newline}<stddev>{number}</stddev>"
-        search = re.findall(regex, lines)
-        xs, means, stddevs = np.zeros(len(search)), np.zeros(
-            len(search)), np.zeros(len(search))
-        for cid, item in enumerate(search):
-            tmp_x, tmp_mean, tmp_stddev = item
-            xs[cid] = float(tmp_x)
-            means[cid] = float(tmp_mean)
-            stddevs[cid] = float(tmp_stddev)
+        texts = fileio.iter_contents(fname_prefix+".target")
+        points = cls._read_points(texts)
+        xs, means, stddevs = points.T
 
         frequency = xs
         velocity = 1/means
@@ -0,0 +1,156 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2020 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+
+"""Writer class definition."""
+
+from abc import ABC, abstractmethod
+
+from swprepost import fileio
+
+__all__ = ["Writer"]
+
+
+class Writer(ABC):
+    """Streaming writer for Geopsy-style text files.
+
+    Items are accepted one at a time and held in a buffer of at most
+    `batch_size` items, which is formatted and written at once, such
+    that memory use does not depend on the number of items written.
+
+    Attributes
+    ----------
+    fname : str
+        Name of file being written.
+    batch_size : int
+        Maximum number of items held before they are written.
+    nitems : int
+        Number of items written so far, including those buffered.
+
+    """
+
+    def __init__(self, fname, batch_size=1000):
+        """Open a `Writer`.
+
+        Parameters
+        ----------
+        fname : str
+            Name of file, may be a relative or the full path. Files
+            with a compressed extension (e.g., `.gz`) are compressed,
+            see :meth: `open_file <swprepost.fileio.open_file>`.
+        batch_size : int, optional
+            Maximum number of items held before they are written,
+            default is 1000.
+
+        Returns
+        -------
+        Writer
+            Open `Writer` object.
+
+        Raises
+        ------
+        ValueError
+            If `batch_size` is less than one.
+
+        """
+        batch_size = int(batch_size)
+        if batch_size < 1:
+            raise ValueError(f"`batch_size` must be >= 1, not {batch_size}.")
+
+        self.fname = fname
+        self.batch_size = batch_size
+        self.nitems = 0
+        self._items = []
+        self._file = fileio.open_file(fname, "w")
+        self._file.write(self._header())
+
+    @classmethod
+    @abstractmethod
+    def _item(cls):
+        """Type of item accepted by the `Writer`."""
+
+    def _header(self):
+        """Text written at the start of the file."""
+        return ""
+
+    @abstractmethod
+    def _format(self, items):
+        """Text representation of a `list` of items."""
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def write(self, item):
+        """Write a single item.
+
+        Parameters
+        ----------
+        item : object
+            Item to be written, see :meth: `_item <Writer._item>`.
+
+        Returns
+        -------
+        None
+            Item is buffered and written once the buffer is full.
+
+        Raises
+        ------
+        TypeError
+            If `item` is not of the accepted type.
+        ValueError
+            If the `Writer` is closed.
+
+        """
+        if not isinstance(item, self._item()):
+            msg = f"Must be instance of {self._item()}, not {type(item)}."
+            raise TypeError(msg)
+        if self.closed:
+            raise ValueError(f"Writer for {self.fname} is closed.")
+
+        self._items.append(item)
+        self.nitems += 1
+        if len(self._items) >= self.batch_size:
+            self.flush()
+
+    def extend(self, items):
+        """Write each item of an iterable, see :meth: `write <Writer.write>`."""
+        for item in items:
+            self.write(item)
+
+    def flush(self):
+        """Write all buffered items to the file."""
+        if self._items:
+            self._file.write(self._format(self._items))
+            self._items = []
+        self._file.flush()
+
+    def close(self):
+        """Write all buffered items and close the file."""
+        if not self.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self):
+        """Human-readable representation of a `Writer`."""
+        return f"{type(self).__name__} with {self.nitems} items to {self.fname}."
@@ -42,3 +42,4 @@ stat.print_stats(0.1)
 # 2020 - 01 - 23 :  0.128s -> Factor out compilation
 # 2020 - 01 - 24 :  0.086s -> Remove line-by-line
 # 2020 - 04 - 06 :  0.065s -> After major refactor
+# 2026 - 10 - 17 :  0.026s -> Vectorized mode parsing
@@ -42,3 +42,4 @@ stat.print_stats(0.1)
 # 2020 - 01 - 22 :  0.019s -> Basline
 # 2020 - 01 - 23 :  0.016s -> Refactor for delegation
 # 2020 - 04 - 06 :  0.007s -> Major refactoring
+# 2026 - 10 - 17 :  0.006s -> Vectorized layer parsing
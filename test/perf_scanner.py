@@ -0,0 +1,64 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2020 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+"""Performance comparison of the regex and scanner engines."""
+
+import time
+
+import swprepost
+from swprepost import regex, scanner
+from testtools import get_full_path
+
+full_path = get_full_path(__file__)
+
+
+def best_of(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    # Well-formed files, full read.
+    for suite, name in [(swprepost.DispersionSuite, "test_dc_mod100_ray2_lov2_full.txt"),
+                        (swprepost.GroundModelSuite, "test_gm_mod100.txt")]:
+        fname = full_path+"data/"+name
+        for engine in scanner.ENGINES:
+            elapsed = best_of(lambda: suite.from_geopsy(fname, engine=engine))
+            print(f"{name:40} {engine:8} {elapsed:.4f}s")
+
+    # A single long malformed line, regex time grows with the cube of
+    # its length while the scanner grows linearly.
+    with open(full_path+"data/test_dc_mod100_ray2_lov2_full.txt", "r") as f:
+        text = f.read()
+    block = text[:text.index("# Layered model", 100)]
+    print(f"\n{'length':>8} {'regex':>10} {'scanner':>10}")
+    for length in [100, 200, 400, 800]:
+        bad = block.replace("# Mode 1\n", "# Mode 1\n"+"1"*length+"\n", 1)
+        t_regex = best_of(lambda: regex.dcset.findall(bad), repeat=1)
+        t_scan = best_of(lambda: list(scanner.scan_dc(bad)), repeat=1)
+        print(f"{length:8} {t_regex:9.4f}s {t_scan:9.4f}s")
+
+
+main()
+
+# YEAR - MO - DY : TIME UNIT
+# -------------------------
+# 2026 - 10 - 17 : Full read of DC/GM files, regex 0.025s/0.003s -> scanner 0.019s/0.003s
+# 2026 - 10 - 17 : Malformed line of 800 digits, regex 1.648s -> scanner 0.0002s
@@ -0,0 +1,102 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2021 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+"""Tests for batch module."""
+
+import os
+import shutil
+import logging
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from testtools import unittest, TestCase, get_full_path
+import swprepost
+from swprepost import batch
+
+logging.basicConfig(level=logging.WARN)
+
+
+class Test_Batch(TestCase):
+
+    def setUp(self):
+        self.full_path = get_full_path(__file__)
+        self.dirname = "test_batch/"
+        os.mkdir(self.dirname)
+        for name in ["VS_Tar5_LN3_Tr0", "VS_Tar5_LN3_Tr1", "VS_Tar5_LR15_Tr0"]:
+            shutil.copy(self.full_path+"data/test_gm_mod100.txt",
+                        self.dirname+name+"_GM.txt")
+            shutil.copy(self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt",
+                        self.dirname+name+"_DC.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def test_parse_fname(self):
+        self.assertTupleEqual(("LN", 3, 0),
+                              batch.parse_fname("3_text/VS_Tar5_LN3_Tr0_GM.txt"))
+        self.assertTupleEqual(("LR", 1.5, 12),
+                              batch.parse_fname("VS_Tar5_LR15_Tr12_DC.txt"))
+        self.assertTupleEqual(("LN", 4, 2), batch.parse_fname("LN4_T2_GM.txt"))
+        self.assertRaises(ValueError, batch.parse_fname, "test_gm_mod100.txt")
+
+    def test_get_executor(self):
+        self.assertIs(ProcessPoolExecutor, batch.get_executor("process"))
+        self.assertIs(ThreadPoolExecutor, batch.get_executor("thread"))
+        self.assertRaises(ValueError, batch.get_executor, "fork")
+
+    def test_load_geopsy(self):
+        expected = swprepost.GroundModelSuite.from_geopsy(self.full_path+"data/test_gm_mod100.txt",
+                                                          nbest=5)
+        for executor in ["thread", "process"]:
+            results, timings = batch.load_geopsy(self.dirname+"*_GM.txt",
+                                                 swprepost.GroundModelSuite,
+                                                 workers=2, executor=executor,
+                                                 nbest=5)
+            self.assertListEqual([("LN", 3, 0), ("LN", 3, 1), ("LR", 1.5, 0)],
+                                 list(results))
+            for suite in results.values():
+                self.assertEqual(expected, suite)
+            self.assertEqual(3, len(timings))
+            for fname, elapsed in timings.items():
+                self.assertTrue(fname.endswith("_GM.txt"))
+                self.assertGreater(elapsed, 0)
+
+        results, _ = batch.load_geopsy(self.dirname+"*_DC.txt",
+                                       swprepost.DispersionSuite,
+                                       executor="thread", nsets=1)
+        for suite in results.values():
+            self.assertEqual(1, len(suite.sets))
+
+    def test_load_geopsy_bad(self):
+        # Empty files are skipped.
+        open(self.dirname+"VS_Tar5_LN5_Tr0_GM.txt", "w").close()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            results, _ = batch.load_geopsy(self.dirname+"*_GM.txt",
+                                           swprepost.GroundModelSuite,
+                                           executor="thread")
+        self.assertEqual(1, len(w))
+        self.assertEqual(3, len(results))
+
+        # Duplicate keys and bad executor.
+        self.assertRaises(ValueError, batch.load_geopsy, self.dirname+"*.txt",
+                          swprepost.GroundModelSuite)
+        self.assertRaises(ValueError, batch.load_geopsy, self.dirname+"*_GM.txt",
+                          swprepost.GroundModelSuite, executor="fiber")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -70,6 +70,29 @@ class Test_DispersionCurve(TestCase):
         self.assertArrayEqual(expected_frequency, dc.frequency)
         self.assertArrayEqual(expected_slowness, dc.slowness)
 
+    def test_parse_dc(self):
+        # Only data.
+        dc_data = "0.1 0.01\n0.2 0.012\n0.3 0.0125\n"
+        dc = swprepost.DispersionCurve._parse_dc(dc_data)
+        self.assertArrayEqual(np.array([0.1, 0.2, 0.3]), dc.frequency)
+        self.assertArrayAlmostEqual(np.array([0.01, 0.012, 0.0125]),
+                                    dc.slowness)
+
+        # Stop when frequency decreases.
+        dc_data = "0.1 0.01\n0.2 0.012\n0.1 0.011\n0.2 0.013\n"
+        dc = swprepost.DispersionCurve._parse_dc(dc_data)
+        self.assertArrayEqual(np.array([0.1, 0.2]), dc.frequency)
+        self.assertArrayAlmostEqual(np.array([0.01, 0.012]),
+                                    dc.slowness)
+
+        # Data with comments.
+        dc_data = "# Frequency, Slowness\n0.1 0.01\n0.2 0.012\n"
+        dc_data += "# Frequency, Slowness\n0.1 0.011\n0.2 0.013\n"
+        dc = swprepost.DispersionCurve._parse_dc(dc_data)
+        self.assertArrayEqual(np.array([0.1, 0.2]), dc.frequency)
+        self.assertArrayAlmostEqual(np.array([0.01, 0.012]),
+                                    dc.slowness)
+
     def test_equal(self):
         dc_a = swprepost.DispersionCurve([1, 2, 3], [4, 5, 6])
         dc_b = swprepost.DispersionCurve([1, 2, 3], [4, 5, 6])
@@ -83,6 +106,25 @@ class Test_DispersionCurve(TestCase):
         self.assertTrue(dc_c != dc_d)
         self.assertTrue(dc_e != dc_a)
 
+    def test_txt_repr(self):
+        frequency = [0.1, 1/3, 2., 1e-5, 2e16]
+        velocity = [100., 250., 1/7, 3e5, 200.]
+        dc = swprepost.DispersionCurve(frequency, velocity)
+        expected = ""
+        for f, p in zip(dc.frequency, dc.slowness):
+            expected += f"{f} {p}\n"
+        self.assertEqual(expected, dc.txt_repr)
+
+        # Shared frequencies are formatted once.
+        frequencies = {}
+        self.assertEqual(expected, dc._txt_repr(frequencies=frequencies))
+        self.assertEqual(1, len(frequencies))
+        self.assertEqual(expected, dc._txt_repr(frequencies=frequencies))
+        self.assertEqual(1, len(frequencies))
+
+        dc = swprepost.DispersionCurve([], [])
+        self.assertEqual("", dc.txt_repr)
+
     def test_write_to_txt(self):
         frequency = [1,3,5,7,9]
         velocity = [100,200,300,400,500]
@@ -18,9 +18,11 @@
 """Tests for DispersionSuite."""
 
 import os
+import shutil
 import logging
 
 import numpy as np
+from scipy.io import loadmat
 
 from testtools import unittest, TestCase, get_full_path
 import swprepost
@@ -333,6 +335,220 @@ class Test_DispersionSuite(TestCase):
         models = [e1]
         compare(fname, models, nsets=20)
 
+    def test_iter_geopsy(self):
+        fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+        expected = swprepost.DispersionSuite.from_geopsy(fname)
+
+        # Chunks smaller and larger than a single DispersionSet.
+        for chunk_size in [50, 1000, 2**20]:
+            dc_sets = swprepost.DispersionSuite.iter_geopsy(fname,
+                                                            chunk_size=chunk_size)
+            returned = swprepost.DispersionSuite.from_list(list(dc_sets),
+                                                           sort=False)
+            self.assertEqual(expected, returned)
+
+        # Generator is lazy.
+        dc_sets = swprepost.DispersionSuite.iter_geopsy(fname)
+        self.assertEqual(expected[0], next(dc_sets))
+        self.assertEqual(expected[1], next(dc_sets))
+
+        # Bad chunk_size.
+        dc_sets = swprepost.DispersionSuite.iter_geopsy(fname, chunk_size=0)
+        self.assertRaises(ValueError, next, dc_sets)
+
+    def test_from_geopsy_workers(self):
+        fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+        for sort in [False, True]:
+            expected = swprepost.DispersionSuite.from_geopsy(fname, sort=sort)
+            returned = swprepost.DispersionSuite.from_geopsy(fname, sort=sort,
+                                                             workers=2)
+            self.assertEqual(expected, returned)
+            self.assertListEqual(expected.identifiers, returned.identifiers)
+
+    def test_from_geopsy_no_models(self):
+        fname = "test_from_geopsy_no_models.txt"
+        with open(fname, "w"):
+            pass
+        for fname in [fname, self.full_path+"data/test_gm_mod100.txt"]:
+            for kwargs in [{}, dict(nbest=3), dict(workers=2),
+                           dict(memory_map=True)]:
+                self.assertRaises(ValueError,
+                                  swprepost.DispersionSuite.from_geopsy,
+                                  fname, **kwargs)
+        os.remove("test_from_geopsy_no_models.txt")
+
+    def test_from_geopsy_memory_map(self):
+        fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+        for kwargs in [{}, dict(nsets=3), dict(nrayleigh=1, nlove=0)]:
+            expected = swprepost.DispersionSuite.from_geopsy(fname, **kwargs)
+            returned = swprepost.DispersionSuite.from_geopsy(fname,
+                                                             memory_map=True,
+                                                             **kwargs)
+            self.assertEqual(expected, returned)
+            self.assertListEqual(expected.identifiers, returned.identifiers)
+
+        # Windows line endings.
+        crlf = "test_from_geopsy_memory_map_crlf.txt"
+        with open(fname, "r") as f, open(crlf, "w", newline="\r\n") as g:
+            g.write(f.read())
+        expected = swprepost.DispersionSuite.from_geopsy(fname)
+        returned = swprepost.DispersionSuite.from_geopsy(crlf, memory_map=True)
+        self.assertEqual(expected, returned)
+        self.assertListEqual(expected.misfits, returned.misfits)
+        os.remove(crlf)
+
+        # Compressed files cannot be memory-mapped.
+        fname = "test_from_geopsy_memory_map.txt.gz"
+        expected.write_to_txt(fname)
+        self.assertRaises(ValueError, swprepost.DispersionSuite.from_geopsy,
+                          fname, memory_map=True)
+        os.remove(fname)
+
+    def test_from_geopsy_nbest(self):
+        fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+        suite = swprepost.DispersionSuite.from_geopsy(fname, sort=True)
+        for nbest in [1, 10, 100]:
+            returned = swprepost.DispersionSuite.from_geopsy(fname, nbest=nbest)
+            expected = swprepost.DispersionSuite.from_list(suite[:nbest])
+            self.assertEqual(expected, returned)
+            self.assertListEqual(suite.identifiers[:nbest], returned.identifiers)
+
+        # Fewer modes.
+        returned = swprepost.DispersionSuite.from_geopsy(fname, nbest=3,
+                                                         nrayleigh=1, nlove=0)
+        expected = swprepost.DispersionSuite.from_geopsy(fname, sort=True,
+                                                         nrayleigh=1, nlove=0)
+        self.assertEqual(swprepost.DispersionSuite.from_list(expected[:3]),
+                         returned)
+
+        # Bad value.
+        self.assertRaises(ValueError, swprepost.DispersionSuite.from_geopsy,
+                          fname, nbest="best")
+
+    def test_from_geopsy_filter(self):
+        fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+        suite = swprepost.DispersionSuite.from_geopsy(fname)
+        max_misfit = sorted(suite.misfits)[30]
+
+        expected = [dc for dc in suite.sets if dc.misfit <= max_misfit]
+        returned = swprepost.DispersionSuite.from_geopsy(fname,
+                                                         max_misfit=max_misfit)
+        self.assertEqual(swprepost.DispersionSuite.from_list(expected), returned)
+
+        # Custom predicate on identifier and misfit.
+        def where(identifier, misfit): return identifier % 2 == 1
+        expected = [dc for dc in expected if dc.identifier % 2 == 1]
+        returned = swprepost.DispersionSuite.from_geopsy(fname,
+                                                         max_misfit=max_misfit,
+                                                         where=where)
+        self.assertListEqual([dc.identifier for dc in expected],
+                             returned.identifiers)
+
+        # Combined with nbest.
+        returned = swprepost.DispersionSuite.from_geopsy(fname, nbest=2,
+                                                         where=where)
+        expected = sorted(expected, key=lambda dc: dc.misfit)[:2]
+        self.assertListEqual([dc.identifier for dc in expected],
+                             returned.identifiers)
+
+    def test_follow(self):
+        with open(self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt", "r") as f:
+            text = f.read()
+        expected = swprepost.DispersionSuite.from_geopsy(self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt",
+                                                         nrayleigh=1)
+
+        fname = "test_follow.txt"
+        with open(fname, "w") as f:
+            f.write(text[:len(text)//2])
+        suite = swprepost.DispersionSuite.follow(fname, nrayleigh=1)
+        nsets = len(suite.sets)
+        self.assertEqual(swprepost.DispersionSuite.from_list(expected[:nsets]),
+                         suite)
+
+        # Last set is only complete once the next begins or on final.
+        with open(fname, "a") as f:
+            f.write(text[len(text)//2:])
+        self.assertEqual(99 - nsets, suite.refresh())
+        self.assertEqual(1, suite.refresh(final=True))
+        self.assertEqual(expected, suite)
+        os.remove(fname)
+
+        # No complete set.
+        with open(fname, "w") as f:
+            f.write(text[:1000])
+        self.assertRaises(ValueError, swprepost.DispersionSuite.follow, fname)
+        os.remove(fname)
+
+    def test_from_geopsy_compressed(self):
+        expected = swprepost.DispersionSuite.from_geopsy(self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt")
+        for extension in [".gz", ".bz2", ".xz"]:
+            fname = "test_from_geopsy_compressed.txt"+extension
+            expected.write_to_txt(fname)
+            returned = swprepost.DispersionSuite.from_geopsy(fname)
+            self.assertEqual(expected, returned)
+            os.remove(fname)
+
+    def test_from_geopsy_identifiers(self):
+        fname = "test_from_geopsy_identifiers.txt"
+        shutil.copy(self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt",
+                    fname)
+        suite = swprepost.DispersionSuite.from_geopsy(fname)
+
+        identifiers = [suite[50].identifier, suite[2].identifier,
+                       suite[99].identifier]
+        returned = swprepost.DispersionSuite.from_geopsy(fname,
+                                                         identifiers=identifiers)
+        expected = swprepost.DispersionSuite.from_list([suite[2], suite[50],
+                                                        suite[99]],
+                                                       sort=False)
+        self.assertEqual(expected, returned)
+
+        # Repeat query uses the sidecar index.
+        self.assertTrue(os.path.exists(fname+swprepost.fileio.INDEX_SUFFIX))
+        returned = swprepost.DispersionSuite.from_geopsy(fname,
+                                                         identifiers=identifiers,
+                                                         nrayleigh=1, nlove=0)
+        self.assertListEqual(expected.identifiers, returned.identifiers)
+        self.assertIsNone(returned[0].love)
+        self.assertEqual(1, len(returned[0].rayleigh))
+
+        os.remove(fname)
+        os.remove(fname+swprepost.fileio.INDEX_SUFFIX)
+
+    def test_write_to_txt_identical(self):
+        fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+        suite = swprepost.DispersionSuite.from_geopsy(fname)
+
+        def write_set(dc_set, nrayleigh, nlove):
+            lines = ""
+            for wave, modes, nmax in [("Rayleigh", dc_set.rayleigh, nrayleigh),
+                                      ("Love", dc_set.love, nlove)]:
+                if nmax == 0:
+                    continue
+                lines += f"# Layered model {dc_set.identifier}: value={dc_set.misfit}\n"
+                lines += f"# {min(len(modes), nmax)} {wave} dispersion mode(s)\n"
+                lines += "# CPU Time = 0 ms\n"
+                for key, dc in modes.items():
+                    if key >= nmax:
+                        continue
+                    lines += f"# Mode {key}\n"
+                    for f, p in zip(dc.frequency, dc.slowness):
+                        lines += f"{f} {p}\n"
+            return lines
+
+        for nrayleigh, nlove, batch_size in [(2, 2, 1000), (1, 0, 7),
+                                             (0, 1, 1)]:
+            expected = "# File written by swprepost\n"
+            for dc_set in suite.sets:
+                expected += write_set(dc_set, nrayleigh, nlove)
+
+            fname = "test_write_to_txt_identical.txt"
+            suite.write_to_txt(fname, nrayleigh=nrayleigh, nlove=nlove,
+                               batch_size=batch_size)
+            with open(fname, "r") as f:
+                self.assertEqual(expected, f.read())
+            os.remove(fname)
+
     def test_write_to_txt(self):
         dc_0 = swprepost.DispersionCurve([1, 5, 10, 15], [100, 200, 300, 400])
         dc_1 = swprepost.DispersionCurve([1, 5, 12, 15], [100, 180, 300, 400])
@@ -352,6 +568,78 @@ class Test_DispersionSuite(TestCase):
 
         self.assertEqual(expected, returned)
 
+    def test_write_to_mat(self):
+        dc_0 = swprepost.DispersionCurve([1, 5, 10, 15], [100, 200, 300, 400])
+        dc_1 = swprepost.DispersionCurve([2, 6, 12], [110, 180, 300])
+        dc_sets = [swprepost.DispersionSet(0, misfit=0.5,
+                                           rayleigh={0: dc_0, 1: dc_1}),
+                   swprepost.DispersionSet(1, misfit=0.7,
+                                           rayleigh={0: dc_1},
+                                           love={0: dc_0})]
+        suite = swprepost.DispersionSuite.from_list(dc_sets)
+
+        fname = "test_write_to_mat"
+        suite.write_to_mat(fname)
+        data = loadmat(fname)
+        os.remove(f"{fname}.mat")
+
+        self.assertListEqual([0, 1], data["identifier"][0].tolist())
+        self.assertListEqual([0.5, 0.7], data["misfit"][0].tolist())
+        self.assertListEqual([[4, 3], [3, 0]],
+                             data["rayleigh_npoints"].tolist())
+        self.assertListEqual([[0], [4]], data["love_npoints"].tolist())
+        self.assertEqual((2, 2, 4), data["rayleigh_frequency"].shape)
+        for row, dc_set in enumerate(dc_sets):
+            for wave in ["rayleigh", "love"]:
+                modes = getattr(dc_set, wave)
+                if modes is None:
+                    continue
+                for mode, dc in modes.items():
+                    npts = len(dc.frequency)
+                    for attr in ["frequency", "velocity"]:
+                        returned = data[f"{wave}_{attr}"][row][mode]
+                        self.assertArrayEqual(getattr(dc, attr),
+                                              returned[:npts])
+                        self.assertTrue(np.all(np.isnan(returned[npts:])))
+        self.assertTrue(np.all(np.isnan(data["rayleigh_velocity"][1][1])))
+
+        # Limit the number of modes.
+        suite.write_to_mat(fname, nrayleigh=1, nlove=0)
+        data = loadmat(fname)
+        os.remove(f"{fname}.mat")
+        self.assertListEqual([[4], [3]], data["rayleigh_npoints"].tolist())
+        self.assertEqual((2, 0), data["love_npoints"].shape)
+
+    def test_write_to_npy(self):
+        fname = self.full_path + "data/test_dc_mod100_ray2_lov2_full.txt"
+        expected = swprepost.DispersionSuite.from_geopsy(fname)
+        dc = swprepost.DispersionCurve([1, 5, 10], [100, 200, 300])
+        expected.append(swprepost.DispersionSet(1000, misfit=10.,
+                                                love={1: dc}), sort=False)
+
+        for path in ["test_write_to_npy", "test_write_to_npy.npz"]:
+            expected.write_to_npy(path)
+
+            returned = swprepost.DispersionSuite.from_npy(path)
+            self.assertEqual(expected, returned)
+
+            # Selection matches reading the text file.
+            for kwargs in [dict(nsets=10), dict(nbest=5),
+                           dict(max_misfit=1.1, nbest=3),
+                           dict(nrayleigh=1, nlove=1)]:
+                exp = swprepost.DispersionSuite.from_geopsy(fname, **kwargs)
+                ret = swprepost.DispersionSuite.from_npy(path, **kwargs)
+                self.assertListEqual(exp.sets, ret.sets[:len(exp.sets)])
+
+            self.assertRaises(ValueError, swprepost.DispersionSuite.from_npy,
+                              path, max_misfit=-1)
+            self.assertRaises(ValueError, swprepost.GroundModelSuite.from_npy,
+                              path)
+            if path.endswith(".npz"):
+                os.remove(path)
+            else:
+                shutil.rmtree(path)
+
     def test_eq(self):
         dc = swprepost.DispersionCurve([1,2,3],[10,20,30])
         dc_set = swprepost.DispersionSet(0, rayleigh={0:dc})
@@ -0,0 +1,91 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2021 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Tests for DispersionWriter class."""
+
+import os
+import logging
+
+import numpy as np
+
+import swprepost
+from testtools import unittest, TestCase, get_full_path
+
+logging.basicConfig(level=logging.WARN)
+
+
+class Test_DispersionWriter(TestCase):
+
+    def setUp(self):
+        self.full_path = get_full_path(__file__)
+        self.fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+
+    def test_write(self):
+        suite = swprepost.DispersionSuite.from_geopsy(self.fname)
+        for nrayleigh, nlove, batch_size in [("all", "all", 1000), (1, 0, 7),
+                                             (0, 2, 1)]:
+            suite.write_to_txt("test_write_expected.txt", nrayleigh=nrayleigh,
+                               nlove=nlove)
+            with open("test_write_expected.txt", "r") as f:
+                expected = f.read()
+
+            with swprepost.DispersionWriter("test_write_returned.txt",
+                                            nrayleigh=nrayleigh, nlove=nlove,
+                                            batch_size=batch_size) as writer:
+                writer.extend(suite.sets)
+            with open("test_write_returned.txt", "r") as f:
+                self.assertEqual(expected, f.read())
+
+        os.remove("test_write_expected.txt")
+        os.remove("test_write_returned.txt")
+
+    def test_stream(self):
+        # Reader -> filter -> writer, without a suite.
+        fname = "test_stream.txt"
+        with swprepost.DispersionWriter(fname, batch_size=10) as writer:
+            writer.extend(swprepost.DispersionSuite.iter_geopsy(self.fname,
+                                                                max_misfit=1.1))
+        expected = swprepost.DispersionSuite.from_geopsy(self.fname,
+                                                         max_misfit=1.1)
+        returned = swprepost.DispersionSuite.from_geopsy(fname)
+        self.assertEqual(expected, returned)
+        os.remove(fname)
+
+    def test_write_curves(self):
+        fname = "test_write_curves.txt"
+        frequency = np.array([1., 2., 3.])
+        velocity = np.array([300., 250., 200.])
+        with swprepost.DispersionWriter(fname) as writer:
+            writer.write_curves(identifier=2, misfit=0.3,
+                                rayleigh={0: (frequency, velocity),
+                                          1: (frequency, 2*velocity)})
+        returned = swprepost.DispersionSet.from_geopsy(fname)
+        self.assertEqual(2, returned.identifier)
+        self.assertArrayAlmostEqual(velocity, returned.rayleigh[0].velocity)
+        self.assertArrayAlmostEqual(2*velocity, returned.rayleigh[1].velocity)
+        self.assertIsNone(returned.love)
+        os.remove(fname)
+
+    def test_bad(self):
+        fname = "test_bad.txt"
+        with swprepost.DispersionWriter(fname) as writer:
+            self.assertRaises(TypeError, writer.write, "not a DispersionSet")
+        os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2021 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Tests for fileio module."""
+
+import io
+import os
+import shutil
+import logging
+import warnings
+
+import numpy as np
+
+from testtools import unittest, TestCase, get_full_path
+from swprepost import fileio, regex
+
+logging.basicConfig(level=logging.WARN)
+
+
+class Test_FileIO(TestCase):
+
+    def setUp(self):
+        self.full_path = get_full_path(__file__)
+
+    def test_open_file(self):
+        text = "# Layered model 1: value=0.5\n"
+        for extension, magic in [(".gz", b"\x1f\x8b"), (".bz2", b"BZh"),
+                                 (".xz", b"\xfd7zXZ\x00"), ("", b"# ")]:
+            fname = "test_open_file.txt"+extension
+            with fileio.open_file(fname, "w") as f:
+                f.write(text)
+            with open(fname, "rb") as f:
+                self.assertTrue(f.read().startswith(magic))
+            with fileio.open_file(fname, "r") as f:
+                self.assertEqual(text, f.read())
+
+            # Detect compression from magic bytes alone.
+            os.rename(fname, "test_open_file.dat")
+            with fileio.open_file("test_open_file.dat", "r") as f:
+                self.assertEqual(text, f.read())
+            os.remove("test_open_file.dat")
+
+    def test_iter_blocks(self):
+        fname = self.full_path+"data/test_gm_mod100.txt"
+        with open(fname, "r") as f:
+            expected = f.read()
+
+        for chunk_size in [1, 100, 2**20]:
+            blocks = list(fileio.iter_blocks(fname, chunk_size=chunk_size))
+            self.assertEqual(expected, "".join(blocks))
+            for block in blocks[1:]:
+                self.assertTrue(block.startswith(fileio.MODEL_HEADER))
+                self.assertEqual(1, block.count(fileio.MODEL_HEADER))
+
+        self.assertRaises(ValueError, list,
+                          fileio.iter_blocks(fname, chunk_size=0))
+
+    def test_iter_mmap(self):
+        fname = self.full_path+"data/test_gm_mod100.txt"
+        with open(fname, "r") as f:
+            expected = regex.gm.findall(f.read())
+
+        batches = list(fileio.iter_mmap(fname, regex.gm_bytes, batch_size=30))
+        self.assertListEqual([30, 30, 30, 10], [len(batch) for batch in batches])
+        self.assertListEqual(expected, [model for batch in batches
+                                        for model in batch])
+
+        # Empty file.
+        fname = "test_iter_mmap.txt"
+        open(fname, "w").close()
+        self.assertListEqual([], list(fileio.iter_mmap(fname, regex.gm_bytes)))
+        os.remove(fname)
+
+    def test_build_index(self):
+        fname = self.full_path+"data/test_dc_mod2_ray2_lov2_shrt.txt"
+        with open(fname, "rb") as f:
+            data = f.read()
+
+        for chunk_size in [16, 2**20]:
+            index = fileio.build_index(fname, chunk_size=chunk_size)
+            self.assertListEqual([149641, 149641, 143539, 143539],
+                                 index["identifier"].tolist())
+            self.assertListEqual([1.08851, 1.08851, 1.0948, 1.0948],
+                                 index["misfit"].tolist())
+            for offset in index["offset"]:
+                self.assertTrue(data[offset:].startswith(b"# Layered model"))
+
+    def test_load_index(self):
+        fname = "test_load_index.txt"
+        shutil.copy(self.full_path+"data/test_gm_mod2.txt", fname)
+
+        # Build and write sidecar.
+        self.assertIsNone(fileio.read_index(fname))
+        expected = fileio.load_index(fname)
+        self.assertTrue(os.path.exists(fname+fileio.INDEX_SUFFIX))
+        returned = fileio.read_index(fname)
+        for key in ["offset", "identifier", "misfit"]:
+            self.assertArrayEqual(expected[key], returned[key])
+
+        # Stale sidecar.
+        with open(fname, "a") as f:
+            f.write("# Layered model 5: value=1.5\n1\n0 200 100 2000\n")
+        self.assertIsNone(fileio.read_index(fname))
+        returned = fileio.load_index(fname)
+        self.assertListEqual([149698, 147185, 5],
+                             returned["identifier"].tolist())
+
+        os.remove(fname)
+        os.remove(fname+fileio.INDEX_SUFFIX)
+
+    def test_iter_selection(self):
+        fname = self.full_path+"data/test_dc_mod2_ray2_lov2_shrt.txt"
+        index = fileio.build_index(fname)
+        with open(fname, "r") as f:
+            data = f.read()
+
+        # Contiguous blocks are read together.
+        returned = list(fileio.iter_selection(fname, [149641], index=index))
+        self.assertEqual(1, len(returned))
+        self.assertEqual(data[index["offset"][0]:index["offset"][2]],
+                         returned[0])
+
+        # Last block is read to the end of the file.
+        returned = list(fileio.iter_selection(fname, [143539], index=index))
+        self.assertEqual(data[index["offset"][2]:], returned[0])
+
+        # Missing identifier.
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            returned = list(fileio.iter_selection(fname, [1], index=index))
+            self.assertEqual(1, len(w))
+        self.assertListEqual([], returned)
+
+    def test_split_ranges(self):
+        for fname, grouped in [("data/test_gm_mod100.txt", False),
+                               ("data/test_dc_mod100_ray2_lov2_full.txt", True)]:
+            fname = self.full_path+fname
+            index = fileio.build_index(fname)
+            offsets = index["offset"].tolist()
+            with open(fname, "rb") as f:
+                data = f.read()
+
+            for nranges in [1, 3, 1000]:
+                ranges = fileio.split_ranges(fname, nranges, grouped=grouped)
+                self.assertTrue(len(ranges) <= nranges)
+
+                # Ranges are contiguous and cover the file.
+                self.assertEqual(0, ranges[0][0])
+                self.assertEqual(len(data), ranges[-1][1])
+                for (_, stop), (start, _) in zip(ranges[:-1], ranges[1:]):
+                    self.assertEqual(stop, start)
+
+                # Ranges start at a new model.
+                for start, _ in ranges[1:]:
+                    self.assertIn(start, offsets)
+                    cid = offsets.index(start)
+                    self.assertNotEqual(index["identifier"][cid-1],
+                                        index["identifier"][cid])
+
+    def test_complete_models(self):
+        gm = b"# Layered model 1: value=0.5\n2\n1 200 100 2000\n0 400 200 2000\n"
+        self.assertEqual(0, fileio.complete_models(b""))
+        self.assertEqual(len(gm), fileio.complete_models(gm))
+        self.assertEqual(len(gm), fileio.complete_models(gm+gm[:-1]))
+        self.assertEqual(len(gm), fileio.complete_models(gm+b"# Lay"))
+        self.assertEqual(2*len(gm), fileio.complete_models(gm+gm))
+
+        dc = b"# Layered model 1: value=0.5\n# 1 Rayleigh dispersion mode(s)\n"
+        self.assertEqual(0, fileio.complete_models(dc+dc, grouped=True))
+        other = dc.replace(b"model 1", b"model 2")
+        self.assertEqual(2*len(dc), fileio.complete_models(dc+dc+other,
+                                                           grouped=True))
+
+    def test_read_appended(self):
+        fname = "test_read_appended.txt"
+        gm = "# Layered model 1: value=0.5\n2\n1 200 100 2000\n0 400 200 2000\n"
+        with open(fname, "w") as f:
+            f.write(gm+gm[:10])
+        text, stop = fileio.read_appended(fname, 0)
+        self.assertEqual(gm, text)
+        self.assertEqual(len(gm), stop)
+        self.assertTupleEqual((gm[:10], len(gm)+10),
+                              fileio.read_appended(fname, stop, final=True))
+
+        with open(fname, "w") as f:
+            f.write(gm[:10])
+        self.assertRaises(ValueError, fileio.read_appended, fname, stop)
+        os.remove(fname)
+
+
+    def test_sniff_encoding(self):
+        text = "<Dinver>\n</Dinver>\n"
+        for encoding, expected in [("utf_8", "utf_8"),
+                                   ("utf_8_sig", "utf_8_sig"),
+                                   ("utf_16", "utf_16"),
+                                   ("utf_16_le", "utf_16_le"),
+                                   ("utf_16_be", "utf_16_be")]:
+            returned = fileio.sniff_encoding(text.encode(encoding))
+            self.assertEqual(expected, returned)
+
+    def test_write_and_iter_contents(self):
+        contents = ["<Dinver>", "  <pluginTag>é</pluginTag>", "</Dinver>"]
+        fname = "test_write_and_iter_contents.target"
+        fileio.write_contents(fname, contents)
+        returned = "".join(fileio.iter_contents(fname, chunk_size=3))
+        self.assertEqual("\n".join(contents)+"\n", returned)
+        os.remove(fname)
+
+        self.assertRaises(ValueError, list,
+                          fileio.iter_xml(io.BytesIO(b"<Other></Other>")))
+
+    def test_repr_floats(self):
+        values = [1., 1., 0., -0., -0., 0.1, 1/3, 1/3, 2e16, 1e-5, np.nan,
+                  np.nan, np.inf]
+        expected = list(map(repr, values))
+        self.assertListEqual(expected, fileio.repr_floats(np.array(values)))
+        self.assertListEqual([], fileio.repr_floats(np.array([])))
+
+    def test_write_and_read_columns(self):
+        columns = {"a": np.arange(10, dtype=np.double),
+                   "b": np.arange(6, dtype=np.int64).reshape(2, 3),
+                   "c": np.empty(0)}
+        for path in ["test_columns", "test_columns.npz"]:
+            fileio.write_columns(path, "Test", columns)
+            for mmap_mode in ["r", None]:
+                returned = fileio.read_columns(path, "Test", ["a", "b", "c"],
+                                               mmap_mode=mmap_mode)
+                for name, value in columns.items():
+                    self.assertArrayEqual(value, returned[name])
+                    self.assertEqual(value.dtype, returned[name].dtype)
+                self.assertEqual(mmap_mode is not None,
+                                 isinstance(returned["a"], np.memmap))
+                del returned
+            self.assertRaises(ValueError, fileio.read_columns, path, "Other",
+                              ["a"])
+            if path.endswith(".npz"):
+                os.remove(path)
+            else:
+                shutil.rmtree(path)
+
+if __name__ == "__main__":
+    unittest.main()
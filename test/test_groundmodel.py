@@ -19,6 +19,7 @@
 
 import os
 import logging
+import warnings
 
 from scipy.io import loadmat
 from hypothesis import given, settings
@@ -61,6 +62,19 @@ class Test_GroundModel(TestCase):
         self.assertListEqual(vss.tolist(), mygm.vs)
         self.assertListEqual(rho.tolist(), mygm.rh)
 
+        # ndarray - column, cast element-by-element if numpy allows.
+        columns = [x.reshape(-1, 1) for x in (thk, vps, vss, rho)]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            try:
+                [float(val) for val in columns[0]]
+            except TypeError:
+                self.assertRaises(TypeError, swprepost.GroundModel, *columns)
+            else:
+                mygm = swprepost.GroundModel(*columns)
+                self.assertListEqual(thk.tolist(), mygm.tk)
+                self.assertListEqual(vss.tolist(), mygm.vs)
+
         # Bad Type
         x = ["this", "that", "these", "those"]
         self.assertRaises(TypeError, swprepost.GroundModel, x, x, x, x)
@@ -353,6 +367,26 @@ class Test_GroundModel(TestCase):
         self.assertEqual(1, gm.identifier)
         self.assertEqual(0.0, gm.misfit)
 
+    def test_parse_gms(self):
+        gm_a = "2 300 100 2000\n0 500 250 2100\n"
+        gm_b = "1 300 100 2000\n3 400 150 2000\n0 600 300 2200\n"
+        models = [("1", "0.5", gm_a), ("2", "0.25", gm_b)]
+        returned = swprepost.GroundModel._parse_gms(models)
+        expected = [swprepost.GroundModel._parse_gm(gm_data, identifier, misfit)
+                    for identifier, misfit, gm_data in models]
+        self.assertListEqual(expected, returned)
+        self.assertListEqual([1., 3., 0.], returned[1].tk)
+        self.assertEqual(2, returned[1].identifier)
+        self.assertEqual(0.25, returned[1].misfit)
+
+        # Layers after the half-space are ignored.
+        gm_c = "2 300 100 2000\n0 500 250 2100\n4 700 300 2200\n"
+        returned = swprepost.GroundModel._parse_gms([("3", "1.", gm_c)])
+        self.assertListEqual([2., 0.], returned[0].tk)
+
+        # No models.
+        self.assertListEqual([], swprepost.GroundModel._parse_gms([]))
+
     def test_write_to_txt(self):
         tk = [2, 4, 0]
         vp = [100, 200, 300]
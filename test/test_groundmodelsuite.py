@@ -17,10 +17,13 @@
 
 """Tests for GroundModelSuite class."""
 
+import io
 import os
+import shutil
 import logging
 
 import numpy as np
+from scipy.io import loadmat
 
 import swprepost
 from testtools import unittest, TestCase, get_full_path
@@ -144,6 +147,200 @@ class Test_GroundModelSuite(TestCase):
                                        identifier=_id, misfit=mf)
         self.assertEqual(expected_9, suite[9])
 
+    def test_iter_geopsy(self):
+        fname = self.full_path+"data/test_gm_mod100.txt"
+        expected = swprepost.GroundModelSuite.from_geopsy(fname)
+
+        # Chunks smaller and larger than a single GroundModel.
+        for chunk_size in [20, 1000, 2**20]:
+            gms = swprepost.GroundModelSuite.iter_geopsy(fname,
+                                                         chunk_size=chunk_size)
+            returned = swprepost.GroundModelSuite.from_list(list(gms),
+                                                            sort=False)
+            self.assertEqual(expected, returned)
+
+        # Generator is lazy.
+        gms = swprepost.GroundModelSuite.iter_geopsy(fname)
+        self.assertEqual(expected[0], next(gms))
+        self.assertEqual(expected[1], next(gms))
+
+    def test_from_geopsy_workers(self):
+        fname = self.full_path+"data/test_gm_mod100.txt"
+        for sort in [False, True]:
+            expected = swprepost.GroundModelSuite.from_geopsy(fname, sort=sort)
+            returned = swprepost.GroundModelSuite.from_geopsy(fname, sort=sort,
+                                                              workers=2)
+            self.assertEqual(expected, returned)
+
+    def test_from_geopsy_no_models(self):
+        fname = "test_from_geopsy_no_models.txt"
+        with open(fname, "w"):
+            pass
+        for fname in [fname, self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"]:
+            for kwargs in [{}, dict(nbest=3), dict(workers=2),
+                           dict(memory_map=True)]:
+                self.assertRaises(ValueError,
+                                  swprepost.GroundModelSuite.from_geopsy,
+                                  fname, **kwargs)
+        os.remove("test_from_geopsy_no_models.txt")
+
+    def test_from_geopsy_memory_map(self):
+        fname = self.full_path+"data/test_gm_mod100.txt"
+        expected = swprepost.GroundModelSuite.from_geopsy(fname)
+        returned = swprepost.GroundModelSuite.from_geopsy(fname, memory_map=True)
+        self.assertEqual(expected, returned)
+        self.assertListEqual(expected.identifiers, returned.identifiers)
+        self.assertListEqual(expected.misfits, returned.misfits)
+
+        returned = swprepost.GroundModelSuite.from_geopsy(fname, nmodels=3,
+                                                          memory_map=True)
+        self.assertEqual(expected[:3], returned)
+
+        # Windows line endings.
+        crlf = "test_from_geopsy_memory_map_crlf.txt"
+        with open(fname, "r") as f, open(crlf, "w", newline="\r\n") as g:
+            g.write(f.read())
+        for engine in ["regex", "scanner"]:
+            returned = swprepost.GroundModelSuite.from_geopsy(crlf,
+                                                              memory_map=True,
+                                                              engine=engine)
+            self.assertEqual(expected, returned)
+            self.assertListEqual(expected.misfits, returned.misfits)
+        os.remove(crlf)
+
+        # Compressed files cannot be memory-mapped.
+        fname = "test_from_geopsy_memory_map.txt.gz"
+        expected.write_to_txt(fname)
+        self.assertRaises(ValueError, swprepost.GroundModelSuite.from_geopsy,
+                          fname, memory_map=True)
+        os.remove(fname)
+
+    def test_from_geopsy_nbest(self):
+        fname = self.full_path+"data/test_gm_mod100.txt"
+        suite = swprepost.GroundModelSuite.from_geopsy(fname, sort=True)
+        for nbest in [1, 10, 100]:
+            returned = swprepost.GroundModelSuite.from_geopsy(fname, nbest=nbest)
+            self.assertEqual(suite[:nbest], returned)
+            self.assertListEqual(suite.identifiers[:nbest], returned.identifiers)
+
+        # More than available.
+        returned = swprepost.GroundModelSuite.from_geopsy(fname, nbest=1000)
+        self.assertListEqual(suite.identifiers, returned.identifiers)
+
+        # Combined with nmodels and memory_map.
+        expected = swprepost.GroundModelSuite.from_geopsy(fname, nmodels=20,
+                                                          sort=True)
+        returned = swprepost.GroundModelSuite.from_geopsy(fname, nmodels=20,
+                                                          nbest=5,
+                                                          memory_map=True)
+        self.assertEqual(expected[:5], returned)
+
+        # Bad value.
+        self.assertRaises(ValueError, swprepost.GroundModelSuite.from_geopsy,
+                          fname, nbest=0)
+
+    def test_from_geopsy_filter(self):
+        fname = self.full_path+"data/test_gm_mod100.txt"
+        suite = swprepost.GroundModelSuite.from_geopsy(fname)
+        max_misfit = sorted(suite.misfits)[30]
+
+        expected = [gm for gm in suite.gms if gm.misfit <= max_misfit]
+        returned = swprepost.GroundModelSuite.from_geopsy(fname,
+                                                          max_misfit=max_misfit)
+        self.assertEqual(swprepost.GroundModelSuite.from_list(expected,
+                                                              sort=False),
+                         returned)
+
+        # Custom predicate on identifier and misfit.
+        def where(identifier, misfit):
+            self.assertIsInstance(identifier, int)
+            self.assertIsInstance(misfit, float)
+            return identifier % 2 == 0
+
+        expected = [gm for gm in expected if gm.identifier % 2 == 0]
+        for memory_map in [False, True]:
+            returned = swprepost.GroundModelSuite.from_geopsy(fname,
+                                                              max_misfit=max_misfit,
+                                                              where=where,
+                                                              memory_map=memory_map)
+            self.assertListEqual([gm.identifier for gm in expected],
+                                 returned.identifiers)
+
+        # Combined with nbest.
+        returned = swprepost.GroundModelSuite.from_geopsy(fname, nbest=3,
+                                                          where=where)
+        expected = sorted(expected, key=lambda gm: gm.misfit)[:3]
+        self.assertListEqual([gm.identifier for gm in expected],
+                             returned.identifiers)
+
+    def test_follow(self):
+        with open(self.full_path+"data/test_gm_mod100.txt", "r") as f:
+            text = f.read()
+        expected = swprepost.GroundModelSuite.from_geopsy(self.full_path+"data/test_gm_mod100.txt")
+
+        # Simulate a file being written in pieces.
+        fname = "test_follow.txt"
+        cuts = [len(text)//3, len(text)//3 + 7, 2*len(text)//3, len(text)]
+        with open(fname, "w") as f:
+            f.write(text[:cuts[0]])
+        suite = swprepost.GroundModelSuite.follow(fname)
+        nmodels = len(suite)
+        self.assertEqual(expected[:nmodels], suite)
+
+        for start, stop in zip(cuts[:-1], cuts[1:]):
+            with open(fname, "a") as f:
+                f.write(text[start:stop])
+            nmodels += suite.refresh()
+            self.assertEqual(nmodels, len(suite))
+        self.assertEqual(expected, suite)
+        self.assertEqual(0, suite.refresh())
+
+        # Sorted.
+        suite = swprepost.GroundModelSuite.follow(fname, sort=True)
+        self.assertListEqual(sorted(expected.misfits), suite.misfits)
+
+        # Not following.
+        self.assertRaises(ValueError, expected.refresh)
+        os.remove(fname)
+
+    def test_from_geopsy_compressed(self):
+        expected = swprepost.GroundModelSuite.from_geopsy(self.full_path+"data/test_gm_mod100.txt")
+        for extension in [".gz", ".bz2", ".xz"]:
+            fname = "test_from_geopsy_compressed.txt"+extension
+            expected.write_to_txt(fname)
+            returned = swprepost.GroundModelSuite.from_geopsy(fname)
+            self.assertEqual(expected, returned)
+            returned = swprepost.GroundModelSuite.from_geopsy(fname, workers=2)
+            self.assertEqual(expected, returned)
+            returned = swprepost.GroundModelSuite.from_geopsy(fname,
+                                                              identifiers=[expected[5].identifier])
+            self.assertEqual(expected[5], returned[0])
+            os.remove(fname)
+            os.remove(fname+swprepost.fileio.INDEX_SUFFIX)
+
+    def test_from_geopsy_identifiers(self):
+        fname = "test_from_geopsy_identifiers.txt"
+        shutil.copy(self.full_path+"data/test_gm_mod100.txt", fname)
+        suite = swprepost.GroundModelSuite.from_geopsy(fname)
+
+        identifiers = [suite[50].identifier, suite[2].identifier,
+                       suite[99].identifier]
+        returned = swprepost.GroundModelSuite.from_geopsy(fname,
+                                                          identifiers=identifiers)
+        expected = swprepost.GroundModelSuite.from_list([suite[2], suite[50],
+                                                         suite[99]],
+                                                        sort=False)
+        self.assertEqual(expected, returned)
+
+        # Repeat query uses the sidecar index.
+        self.assertTrue(os.path.exists(fname+swprepost.fileio.INDEX_SUFFIX))
+        returned = swprepost.GroundModelSuite.from_geopsy(fname,
+                                                          identifiers=identifiers[:1])
+        self.assertEqual(suite[50], returned[0])
+
+        os.remove(fname)
+        os.remove(fname+swprepost.fileio.INDEX_SUFFIX)
+
     def test_vs30(self):
         # nbest="all"
         thk = [5, 20, 0]
@@ -265,6 +462,98 @@ class Test_GroundModelSuite(TestCase):
             self.assertEqual(gm_a, gm_b)
         os.remove(fname)
 
+    def test_write_to_txt_identical(self):
+        suite = swprepost.GroundModelSuite.from_geopsy(self.full_path+"data/test_gm_mod100.txt")
+        gms = suite.gms
+        gms += [swprepost.GroundModel([], [], [], [], identifier=7),
+                swprepost.GroundModel([-0., 0.], [1e-5, 2e16], [1e-6, 1/3],
+                                      [2000, 2000], identifier=8,
+                                      misfit=1e-7),
+                swprepost.GroundModel([], [], [], [], identifier=9)]
+        expected = io.StringIO()
+        for gm in gms:
+            gm.write_model(expected)
+
+        for batch_size in [1, 7, 10000]:
+            returned = io.StringIO()
+            swprepost.GroundModel._write_models(returned, gms,
+                                                batch_size=batch_size)
+            self.assertEqual(expected.getvalue(), returned.getvalue())
+
+        fname = "test_write_to_txt_identical.txt"
+        suite = swprepost.GroundModelSuite.from_list(gms, sort=False)
+        suite.write_to_txt(fname)
+        with open(fname, "r") as f:
+            self.assertEqual(expected.getvalue(), f.read())
+        os.remove(fname)
+
+    def test_write_to_mat(self):
+        fname = self.full_path + "data/test_gm_mod100.txt"
+        suite = swprepost.GroundModelSuite.from_geopsy(fname)
+        suite.append(swprepost.GroundModel([0.], [500.], [250.], [2000.],
+                                           identifier=1000, misfit=10.),
+                     sort=False)
+
+        fname = "test_write_to_mat"
+        suite.write_to_mat(fname)
+        data = loadmat(fname)
+        os.remove(f"{fname}.mat")
+
+        self.assertListEqual(suite.identifiers, data["identifier"][0].tolist())
+        self.assertListEqual(suite.misfits, data["misfit"][0].tolist())
+        for row, gm in enumerate(suite.gms):
+            nlay = gm.nlay
+            self.assertEqual(nlay, data["nlay"][0][row])
+            for key, attr, npts in [("thickness", "tk", nlay),
+                                    ("vp1", "vp", nlay),
+                                    ("vs1", "vs", nlay),
+                                    ("rho1", "rh", nlay),
+                                    ("depth", "depth", 2*nlay),
+                                    ("vp2", "vp2", 2*nlay),
+                                    ("vs2", "vs2", 2*nlay),
+                                    ("rho2", "rh2", 2*nlay)]:
+                self.assertListEqual(list(getattr(gm, attr)),
+                                     data[key][row][:npts].tolist())
+                self.assertTrue(np.all(np.isnan(data[key][row][npts:])))
+
+        suite.write_to_mat(fname, nbest=3)
+        data = loadmat(fname)
+        os.remove(f"{fname}.mat")
+        self.assertEqual((3, 2*max(gm.nlay for gm in suite.gms[:3])),
+                         data["depth"].shape)
+
+    def test_write_to_npy(self):
+        fname = self.full_path + "data/test_gm_mod100.txt"
+        expected = swprepost.GroundModelSuite.from_geopsy(fname)
+
+        for path in ["test_write_to_npy", "test_write_to_npy.npz"]:
+            expected.write_to_npy(path)
+
+            returned = swprepost.GroundModelSuite.from_npy(path)
+            self.assertEqual(len(expected), len(returned))
+            for exp, ret in zip(expected.gms, returned.gms):
+                self.assertEqual(exp, ret)
+                self.assertEqual(exp.identifier, ret.identifier)
+                self.assertEqual(exp.misfit, ret.misfit)
+
+            # Selection matches reading the text file.
+            for kwargs in [dict(nmodels=10), dict(nbest=5),
+                           dict(max_misfit=0.775, nbest=3),
+                           dict(nmodels=20, sort=True)]:
+                exp = swprepost.GroundModelSuite.from_geopsy(fname, **kwargs)
+                ret = swprepost.GroundModelSuite.from_npy(path, **kwargs)
+                self.assertListEqual(exp.identifiers, ret.identifiers)
+                self.assertListEqual(exp.misfits, ret.misfits)
+
+            self.assertRaises(ValueError, swprepost.GroundModelSuite.from_npy,
+                              path, max_misfit=-1)
+            self.assertRaises(ValueError, swprepost.DispersionSuite.from_npy,
+                              path)
+            if path.endswith(".npz"):
+                os.remove(path)
+            else:
+                shutil.rmtree(path)
+
     def test_str(self):
         x = [1, 2, 3]
         y = [2, 4, 5]
@@ -0,0 +1,92 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2021 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+
+"""Tests for GroundModelWriter class."""
+
+import os
+import logging
+
+import swprepost
+from testtools import unittest, TestCase, get_full_path
+
+logging.basicConfig(level=logging.WARN)
+
+
+class Test_GroundModelWriter(TestCase):
+
+    def setUp(self):
+        self.full_path = get_full_path(__file__)
+        self.fname = self.full_path+"data/test_gm_mod100.txt"
+
+    def test_write(self):
+        suite = swprepost.GroundModelSuite.from_geopsy(self.fname)
+        suite.write_to_txt("test_write_expected.txt")
+        with open("test_write_expected.txt", "r") as f:
+            expected = f.read()
+
+        for batch_size in [1, 7, 1000]:
+            with swprepost.GroundModelWriter("test_write_returned.txt",
+                                             batch_size=batch_size) as writer:
+                for gm in suite:
+                    writer.write(gm)
+                self.assertEqual(len(suite), writer.nitems)
+            self.assertTrue(writer.closed)
+            with open("test_write_returned.txt", "r") as f:
+                self.assertEqual(expected, f.read())
+
+        os.remove("test_write_expected.txt")
+        os.remove("test_write_returned.txt")
+
+    def test_stream(self):
+        # Reader -> filter -> writer, without a suite.
+        fname = "test_stream.txt"
+        with swprepost.GroundModelWriter(fname, batch_size=10) as writer:
+            writer.extend(swprepost.GroundModelSuite.iter_geopsy(self.fname,
+                                                                 max_misfit=0.775))
+        expected = swprepost.GroundModelSuite.from_geopsy(self.fname,
+                                                          max_misfit=0.775)
+        returned = swprepost.GroundModelSuite.from_geopsy(fname)
+        self.assertEqual(expected, returned)
+        os.remove(fname)
+
+    def test_write_layers(self):
+        fname = "test_write_layers.txt"
+        with swprepost.GroundModelWriter(fname) as writer:
+            writer.write_layers([1, 0], [200, 400], [100, 200], [2000, 2000],
+                                identifier=3, misfit=0.5)
+        expected = swprepost.GroundModel([1, 0], [200, 400], [100, 200],
+                                         [2000, 2000], identifier=3,
+                                         misfit=0.5)
+        self.assertEqual(expected, swprepost.GroundModel.from_geopsy(fname))
+        os.remove(fname)
+
+    def test_bad(self):
+        fname = "test_bad.txt"
+        writer = swprepost.GroundModelWriter(fname)
+        self.assertRaises(TypeError, writer.write, "not a GroundModel")
+        writer.close()
+        writer.close()
+        gm = swprepost.GroundModel([1, 0], [200, 400], [100, 200],
+                                   [2000, 2000])
+        self.assertRaises(ValueError, writer.write, gm)
+        self.assertRaises(ValueError, swprepost.GroundModelWriter, fname,
+                          batch_size=0)
+        os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
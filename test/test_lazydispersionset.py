@@ -0,0 +1,96 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2020 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+"""Tests for LazyDispersionSet class."""
+
+import os
+import pickle
+import logging
+
+from testtools import unittest, TestCase, get_full_path
+import swprepost
+from swprepost.lazydispersionset import LazyModes
+
+logging.basicConfig(level=logging.CRITICAL)
+
+
+class Test_LazyDispersionSet(TestCase):
+
+    def setUp(self):
+        self.full_path = get_full_path(__file__)
+        self.fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+
+    def test_lazymodes(self):
+        text = "0.1 0.005\n0.2 0.01\n"
+        modes = LazyModes({0: text, 1: text}, swprepost.DispersionCurve)
+        self.assertEqual(2, len(modes))
+        self.assertListEqual([0, 1], list(modes))
+        self.assertEqual(0, modes.nparsed)
+
+        # Parsed on first access and cached.
+        expected = swprepost.DispersionCurve._parse_dc(text)
+        self.assertEqual(expected, modes[0])
+        self.assertIs(modes[0], modes[0])
+        self.assertEqual(1, modes.nparsed)
+
+        # Equal to a dict of the same curves.
+        self.assertEqual({0: expected, 1: expected}, modes)
+        self.assertEqual(modes, {0: expected, 1: expected})
+        self.assertRaises(KeyError, modes.__getitem__, 2)
+
+    def test_init(self):
+        ray = {0: swprepost.DispersionCurve([0.1, 0.2], [200, 100])}
+        dc_set = swprepost.LazyDispersionSet(1, 0.5, rayleigh=ray)
+        self.assertEqual(swprepost.DispersionSet(1, 0.5, rayleigh=ray), dc_set)
+        self.assertRaises(ValueError, swprepost.LazyDispersionSet)
+        self.assertRaises(TypeError, swprepost.LazyDispersionSet,
+                          rayleigh={0: "curve"})
+
+    def test_from_geopsy(self):
+        expected = swprepost.DispersionSet.from_geopsy(self.fname)
+        returned = swprepost.LazyDispersionSet.from_geopsy(self.fname)
+        self.assertIsInstance(returned.rayleigh, LazyModes)
+        self.assertEqual(0, returned.rayleigh.nparsed)
+        self.assertEqual(expected.rayleigh[0], returned.rayleigh[0])
+        self.assertEqual(1, returned.rayleigh.nparsed)
+        self.assertEqual(0, returned.love.nparsed)
+        self.assertEqual(expected, returned)
+
+        returned = swprepost.LazyDispersionSet.from_geopsy(self.fname,
+                                                           nrayleigh=1,
+                                                           nlove=0)
+        self.assertEqual(1, len(returned.rayleigh))
+        self.assertIsNone(returned.love)
+
+    def test_suite(self):
+        expected = swprepost.DispersionSuite.from_geopsy(self.fname, nbest=10)
+        returned = swprepost.DispersionSuite.from_geopsy(self.fname, nbest=10,
+                                                         lazy=True)
+        for dc_set in returned.sets:
+            self.assertIsInstance(dc_set, swprepost.LazyDispersionSet)
+        self.assertEqual(expected, returned)
+
+        # Pickle and write.
+        dc_set = pickle.loads(pickle.dumps(returned[0]))
+        self.assertEqual(expected[0], dc_set)
+        fname = "test_lazydispersionset_suite.txt"
+        returned.write_to_txt(fname)
+        self.assertEqual(expected, swprepost.DispersionSuite.from_geopsy(fname))
+        os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
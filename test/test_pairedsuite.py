@@ -0,0 +1,127 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2020 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+"""Tests for PairedSuite class."""
+
+import os
+import logging
+import warnings
+
+import swprepost
+from testtools import unittest, TestCase, get_full_path
+
+logging.basicConfig(level=logging.ERROR)
+
+
+class Test_PairedSuite(TestCase):
+
+    def setUp(self):
+        self.full_path = get_full_path(__file__)
+        self.fname_gm = "test_pairedsuite_gm.txt"
+        self.fname_dc = "test_pairedsuite_dc.txt"
+
+        # Assign the identifiers and misfits of the ground models to
+        # the dispersion sets, as if from the same inversion.
+        self.gm_suite = swprepost.GroundModelSuite.from_geopsy(self.full_path+"data/test_gm_mod100.txt")
+        dc_suite = swprepost.DispersionSuite.from_geopsy(self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt")
+        dc_sets = [swprepost.DispersionSet(gm.identifier, gm.misfit,
+                                           rayleigh=dc.rayleigh, love=dc.love)
+                   for gm, dc in zip(self.gm_suite.gms, dc_suite.sets)]
+        self.dc_suite = swprepost.DispersionSuite.from_list(dc_sets, sort=False)
+
+        self.gm_suite.write_to_txt(self.fname_gm)
+        self.dc_suite.write_to_txt(self.fname_dc)
+
+    def tearDown(self):
+        os.remove(self.fname_gm)
+        os.remove(self.fname_dc)
+
+    def test_init(self):
+        gm, dc = self.gm_suite[0], self.dc_suite[0]
+        suite = swprepost.PairedSuite(gm, dc)
+        self.assertTupleEqual((gm, dc), suite[0])
+        self.assertListEqual([gm], suite.gms)
+        self.assertListEqual([dc], suite.sets)
+
+        self.assertRaises(TypeError, swprepost.PairedSuite, dc, gm)
+        self.assertRaises(ValueError, swprepost.PairedSuite, gm,
+                          self.dc_suite[1])
+
+    def test_from_geopsy(self):
+        suite = swprepost.PairedSuite.from_geopsy(self.fname_gm, self.fname_dc)
+        expected_gm = swprepost.GroundModelSuite.from_geopsy(self.fname_gm,
+                                                             sort=True)
+        expected_dc = swprepost.DispersionSuite.from_geopsy(self.fname_dc,
+                                                            sort=True)
+        self.assertEqual(expected_gm, suite.groundmodelsuite)
+        self.assertEqual(expected_dc, suite.dispersionsuite)
+        self.assertListEqual(sorted(suite.misfits), suite.misfits)
+        for gm, dc in suite:
+            self.assertEqual(gm.identifier, dc.identifier)
+
+        # Files in a different order are paired by identifier.
+        fname = "test_pairedsuite_dc_reversed.txt"
+        reversed_dc = swprepost.DispersionSuite.from_list(self.dc_suite.sets[::-1],
+                                                          sort=False)
+        reversed_dc.write_to_txt(fname)
+        returned = swprepost.PairedSuite.from_geopsy(self.fname_gm, fname)
+        self.assertEqual(suite, returned)
+        os.remove(fname)
+
+    def test_from_geopsy_unmatched(self):
+        fname = "test_pairedsuite_gm_short.txt"
+        self.gm_suite[:90].write_to_txt(fname)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            suite = swprepost.PairedSuite.from_geopsy(fname, self.fname_dc)
+        self.assertEqual(1, len(w))
+        self.assertEqual(90, len(suite))
+
+        # Files without a common identifier have no pairs.
+        fname_dc = "test_pairedsuite_dc_short.txt"
+        dc_suite = swprepost.DispersionSuite.from_list(self.dc_suite[90:],
+                                                       sort=False)
+        dc_suite.write_to_txt(fname_dc)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertRaises(ValueError, swprepost.PairedSuite.from_geopsy,
+                              fname, fname_dc)
+        os.remove(fname)
+        os.remove(fname_dc)
+
+    def test_from_geopsy_select(self):
+        suite = swprepost.PairedSuite.from_geopsy(self.fname_gm, self.fname_dc)
+
+        returned = swprepost.PairedSuite.from_geopsy(self.fname_gm,
+                                                     self.fname_dc, nbest=10)
+        self.assertEqual(suite[:10], returned)
+
+        max_misfit = suite.misfits[20]
+        returned = swprepost.PairedSuite.from_geopsy(self.fname_gm,
+                                                     self.fname_dc,
+                                                     max_misfit=max_misfit,
+                                                     nrayleigh=1, nlove=0)
+        self.assertListEqual(suite.identifiers[:21], returned.identifiers)
+        for _, dc in returned:
+            self.assertEqual(1, len(dc.rayleigh))
+            self.assertIsNone(dc.love)
+
+        self.assertRaises(ValueError, swprepost.PairedSuite.from_geopsy,
+                          self.fname_gm, self.fname_dc, max_misfit=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,8 +18,12 @@
 """Tests for Parameterization class."""
 
 import warnings
+import io
 import os
+import codecs
+import tarfile
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import swprepost
 from testtools import unittest, TestCase, get_full_path
@@ -154,5 +158,44 @@ class Test_Parameterization(TestCase):
         self.assertEqual(par, new_par)
         os.remove(fname_prefix+".param")
 
+    def test_from_param_encoding(self):
+        vp = ['LR', 4, 200, 400, True]
+        pr = ['LN', 3, 0.2, 0.5, False]
+        vs = ['FTL', 3, 3, 100, 200, True]
+        rh = ['FX', 2000]
+        par = swprepost.Parameterization.from_min_max(vp, pr, vs, rh, [1, 100])
+        par.to_param("test_from_param_encoding")
+        with tarfile.open("test_from_param_encoding.param", "r:gz") as f:
+            text = f.extractfile("contents.xml").read().decode("utf-8")
+
+        # Geopsy writes UTF-16 with a byte order mark.
+        data = codecs.BOM_UTF16_LE + text.encode("utf_16_le")
+        info = tarfile.TarInfo("contents.xml")
+        info.size = len(data)
+        with tarfile.open("test_from_param_encoding.param", "w:gz") as f:
+            f.addfile(info, io.BytesIO(data))
+        new_par = swprepost.Parameterization.from_param("test_from_param_encoding")
+        self.assertEqual(par, new_par)
+        self.assertFalse(os.path.exists("contents.xml"))
+        os.remove("test_from_param_encoding.param")
+
+    def test_to_and_from_param_concurrent(self):
+        def round_trip(nlay):
+            vs = ['FTL', nlay, 3, 100, 200, True]
+            par = swprepost.Parameterization.from_min_max(['LR', 4, 200, 400, True],
+                                                          ['LN', 3, 0.2, 0.5, False],
+                                                          vs, ['FX', 2000],
+                                                          [1, 100])
+            fname_prefix = f"test_to_and_from_param_concurrent_{nlay}"
+            par.to_param(fname_prefix)
+            new_par = swprepost.Parameterization.from_param(fname_prefix)
+            os.remove(fname_prefix+".param")
+            return (par, new_par)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for par, new_par in executor.map(round_trip, range(2, 10)):
+                self.assertEqual(par, new_par)
+
+
 if __name__ == '__main__':
     unittest.main()
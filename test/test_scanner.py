@@ -0,0 +1,129 @@
+# This file is part of swprepost, a Python package for surface wave
+# inversion pre- and post-processing.
+# Copyright (C) 2019-2021 Joseph P. Vantassel (jvantassel@utexas.edu)
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     This program is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <https: //www.gnu.org/licenses/>.
+"""Tests for scanner module."""
+
+import os
+import logging
+
+from testtools import unittest, TestCase, get_full_path
+import swprepost
+from swprepost import regex, scanner
+
+logging.basicConfig(level=logging.WARN)
+
+
+class Test_Scanner(TestCase):
+
+    def setUp(self):
+        self.full_path = get_full_path(__file__)
+
+    def test_scan_gm(self):
+        for name in ["test_gm_mod1.txt", "test_gm_mod2.txt",
+                     "test_gm_mod1_self.txt", "test_gm_mod100.txt"]:
+            with open(self.full_path+"data/"+name, "r") as f:
+                text = f.read()
+            expected = regex.gm.findall(text)
+            self.assertListEqual(expected, list(scanner.scan_gm(text)))
+            returned = [tuple(group.decode() for group in groups)
+                        for groups in scanner.scan_gm(text.encode())]
+            self.assertListEqual(expected, returned)
+
+        # Malformed header, layer count, and lines.
+        gm = "# Layered model 1: value=0.5\n2\n1 200 100 2000\n0 400 200 2000\n"
+        self.assertListEqual([], list(scanner.scan_gm(gm.replace("0.5", "x"))))
+        self.assertListEqual([], list(scanner.scan_gm(gm.replace("\n2\n", "\nx\n"))))
+        bad = gm.replace("0 400", "1"*1000+"\n0 400")
+        self.assertListEqual(list(scanner.scan_gm(gm)),
+                             list(scanner.scan_gm(bad)))
+
+    def test_scan_dc(self):
+        for name in ["test_dc_mod1_ray2_lov2_shrt.txt",
+                     "test_dc_mod2_ray0_lov2_shrt.txt",
+                     "test_dc_mod2_ray2_lov0_shrt.txt",
+                     "test_dc_mod100_ray2_lov2_full.txt"]:
+            with open(self.full_path+"data/"+name, "r") as f:
+                text = f.read()
+            expected = regex.dcset.findall(text)
+            self.assertListEqual(expected, list(scanner.scan_dc(text)))
+            returned = [tuple(group.decode() for group in groups)
+                        for groups in scanner.scan_dc(text.encode())]
+            self.assertListEqual(expected, returned)
+
+        # Malformed lines are removed.
+        dc = "# Layered model 1: value=0.5\n# 2 Rayleigh dispersion mode(s)\n# CPU Time = 0 ms\n# Mode 0\n0.1 0.01\n0.2 0.02\n# Mode 1\n0.1 0.005\n"
+        bad = dc.replace("0.2 0.02\n", "0.2 0.02\n0.3 0.03 x\n"+"1"*1000+"\n")
+        self.assertListEqual(list(scanner.scan_dc(dc)), list(scanner.scan_dc(bad)))
+
+        # Malformed wave type or missing mode.
+        self.assertListEqual([], list(scanner.scan_dc(dc.replace("Rayleigh", "Scholte"))))
+        self.assertListEqual([], list(scanner.scan_dc(dc.replace("# Mode 0", "#"))))
+
+    def test_clean(self):
+        data = "# Mode 0\n0.1 0.01\n0.2\n0.3 x\n0.4 0.04\n"
+        self.assertEqual("# Mode 0\n0.1 0.01\n0.4 0.04\n", scanner.clean(data, 2))
+        self.assertEqual(b"# Mode 0\n0.1 0.01\n0.4 0.04\n",
+                         scanner.clean(data.encode(), 2))
+        data = "# Mode 0\n0.1 0.01\n"
+        self.assertIs(data, scanner.clean(data, 2))
+
+    def test_select(self):
+        self.assertEqual(regex.gm.findall, scanner.select("gm", "regex")[0])
+        self.assertEqual(scanner.scan_dc, scanner.select("dc", "scanner")[0])
+        self.assertRaises(ValueError, scanner.select, "dc", "fast")
+
+    def test_engine(self):
+        fname = self.full_path+"data/test_gm_mod100.txt"
+        expected = swprepost.GroundModelSuite.from_geopsy(fname)
+        for memory_map in [False, True]:
+            returned = swprepost.GroundModelSuite.from_geopsy(fname,
+                                                              engine="scanner",
+                                                              memory_map=memory_map)
+            self.assertEqual(expected, returned)
+
+        fname = self.full_path+"data/test_dc_mod100_ray2_lov2_full.txt"
+        expected = swprepost.DispersionSuite.from_geopsy(fname)
+        for memory_map in [False, True]:
+            returned = swprepost.DispersionSuite.from_geopsy(fname,
+                                                             engine="scanner",
+                                                             memory_map=memory_map)
+            self.assertEqual(expected, returned)
+        returned = swprepost.DispersionSuite.from_geopsy(fname, engine="scanner",
+                                                         workers=2)
+        self.assertEqual(expected, returned)
+
+        # Windows line endings, read directly by the scanner.
+        crlf = "test_engine_crlf.txt"
+        with open(fname, "r") as f, open(crlf, "w", newline="\r\n") as g:
+            g.write(f.read())
+        with open(crlf, "rb") as f:
+            data = f.read()
+        for identifier, misfit, _, modes in scanner.scan_dc(data):
+            self.assertNotIn(b"\r", identifier + misfit + modes)
+        for memory_map in [False, True]:
+            returned = swprepost.DispersionSuite.from_geopsy(crlf,
+                                                             engine="scanner",
+                                                             memory_map=memory_map)
+            self.assertEqual(expected, returned)
+            self.assertEqual(2, len(returned.sets[0].rayleigh))
+        os.remove(crlf)
+
+        self.assertRaises(ValueError, swprepost.DispersionSuite.from_geopsy,
+                          fname, engine="fast")
+
+
+if __name__ == "__main__":
+    unittest.main()
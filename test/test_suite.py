@@ -53,6 +53,19 @@ class Test_Suite(TestCase):
         self.assertRaises(ValueError, self.gm_suite._handle_nbest,
                           nbest="tada")
 
+    def test_follow_mixin(self):
+        from swprepost.suite import FollowMixin
+        for suite in [swprepost.GroundModelSuite, swprepost.DispersionSuite]:
+            self.assertTrue(issubclass(suite, FollowMixin))
+        self.assertFalse(issubclass(swprepost.PairedSuite, FollowMixin))
+        self.assertFalse(hasattr(swprepost.PairedSuite, "refresh"))
+
+        # Following requires parsing text.
+        class Unparsable(FollowMixin, swprepost.Suite):
+            def __init__(self, item):
+                super().__init__(item)
+        self.assertRaises(TypeError, Unparsable, 0)
+
     def test_misfit_range(self):
         # GroundModelSuite
         for nmodels, expected in zip(["all", 1, 5], [(0.1, 1), 0.1, (0.1, 0.4)]):
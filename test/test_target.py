@@ -17,10 +17,13 @@
 
 """Tests for the Target class."""
 
+import io
 import os
+import tarfile
 import logging
 import warnings
 import platform
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import nbformat
@@ -28,6 +31,7 @@ from nbconvert.preprocessors import ExecutePreprocessor
 
 from testtools import unittest, TestCase, get_full_path
 import swprepost
+from swprepost import fileio
 
 logging.basicConfig(level=logging.ERROR)
 
@@ -129,6 +133,38 @@ class Test_Target(TestCase):
         fname = self.full_path+"data/test_tar_bad.csv"
         self.assertRaises(ValueError, swprepost.Target.from_csv, fname)
 
+    def test_from_csv_mixed(self):
+        # Rows with and without standard deviation.
+        fname = "test_from_csv_mixed.csv"
+        with open(fname, "w") as f:
+            f.write("# Frequency,Velocity,VelStd\n1.55,200,10\n2.00,500\n")
+        tar = swprepost.Target.from_csv(fname)
+        self.assertListEqual([1.55, 2.00], tar.frequency.tolist())
+        self.assertListEqual([10, 0], tar.velstd.tolist())
+
+        # Other comment character.
+        with open(fname, "w") as f:
+            f.write("% Frequency,Velocity\n1.55,200\n2.00,500\n")
+        tar = swprepost.Target.from_csv(fname, commentcharacter="%")
+        self.assertListEqual([200, 500], tar.velocity.tolist())
+        os.remove(fname)
+
+    def test_from_csvs(self):
+        fnames = [self.full_path+f"data/test_tar_{name}.csv"
+                  for name in ["wstd", "wostd", "wstd_nonlin_0",
+                               "wstd_nonlin_1"]]
+        expected = [swprepost.Target.from_csv(fname) for fname in fnames]
+        for executor in ["thread", "process"]:
+            returned = swprepost.Target.from_csvs(fnames, workers=2,
+                                                  executor=executor)
+            self.assertListEqual(expected, returned)
+
+        fnames.append(self.full_path+"data/test_tar_bad.csv")
+        self.assertRaises(ValueError, swprepost.Target.from_csvs, fnames,
+                          executor="thread")
+        self.assertRaises(ValueError, swprepost.Target.from_csvs, fnames,
+                          executor="cluster")
+
     def test_setcov(self):
         frequency = [1, 2, 3]
         velocity = np.array([10, 100, 1000])
@@ -307,6 +343,71 @@ class Test_Target(TestCase):
         self.assertRaises(NotImplementedError, tar.from_target,
                           fname_prefix=prefix+"_geopsy_v3", version="12000")
 
+    def test_to_and_from_target_concurrent(self):
+        prefix = self.full_path+"data/test_tar_wstd_nonlin_1"
+        targets = [swprepost.Target.from_csv(prefix + ".csv")
+                   for _ in range(8)]
+        for cid, target in enumerate(targets):
+            target.velocity *= (1 + cid)
+
+        def round_trip(args):
+            cid, target = args
+            fname_prefix = f"test_to_and_from_target_concurrent_{cid}"
+            target.to_target(fname_prefix)
+            returned = swprepost.Target.from_target(fname_prefix)
+            os.remove(fname_prefix+".target")
+            return returned
+
+        expected = list(map(round_trip, enumerate(targets)))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            returned = list(executor.map(round_trip, enumerate(targets)))
+        for cid, (target_a, target_b) in enumerate(zip(expected, returned)):
+            self.assertEqual(target_a, target_b)
+            if cid:
+                self.assertNotEqual(expected[0], target_b)
+
+        # Nothing is written to the working directory.
+        self.assertFalse(os.path.exists("contents.xml"))
+
+        # Single member, as written by Dinver.
+        targets[0].to_target("test_to_target_members")
+        with tarfile.open("test_to_target_members.target", "r:gz") as f:
+            self.assertListEqual(["contents.xml"], f.getnames())
+        os.remove("test_to_target_members.target")
+
+    def test_read_points(self):
+        point = "<StatPoint>\n<x>{}</x>\n<mean>{}</mean>\n<stddev>{}</stddev>\n</StatPoint>\n"
+        expected = np.arange(30, dtype=float).reshape(10, 3) + 0.5
+        text = "<Dinver>\n" + "".join(point.format(*row) for row in expected)
+        text += "</Dinver>\n"
+        for encoding in ["utf_8", "utf_8_sig", "utf_16", "utf_16_le", "utf_16_be"]:
+            for chunk_size in [7, 2**16]:
+                fileobj = io.BytesIO(text.encode(encoding))
+                texts = fileio.iter_xml(fileobj, chunk_size=chunk_size)
+                returned = swprepost.Target._read_points(texts)
+                self.assertArrayEqual(expected, returned)
+
+        fileobj = io.BytesIO("<Dinver></Dinver>".encode("utf_16_le"))
+        returned = swprepost.Target._read_points(fileio.iter_xml(fileobj))
+        self.assertTupleEqual((0, 3), returned.shape)
+
+        # Not recognized.
+        for data in [b"<Other></Other>", b"<Dinver>\xff\xfe\xff"]:
+            self.assertRaises(ValueError, swprepost.Target._read_points,
+                              fileio.iter_xml(io.BytesIO(data)))
+
+        # Read from an archive in the encoding of each version of Geopsy.
+        fname = "test_read_points.target"
+        for encoding in ["utf_8", "utf_16"]:
+            data = text.encode(encoding)
+            info = tarfile.TarInfo(fileio.CONTENTS)
+            info.size = len(data)
+            with tarfile.open(fname, "w:gz") as f:
+                f.addfile(info, io.BytesIO(data))
+            returned = swprepost.Target._read_points(fileio.iter_contents(fname))
+            self.assertArrayEqual(expected, returned)
+        os.remove(fname)
+
     def test_to_and_from_dinver_txt(self):
         frq = [1, 3, 5, 7, 9, 15]
         vel = [200, 150, 112, 95, 90, 85]